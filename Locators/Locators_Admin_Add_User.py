@@ -26,6 +26,9 @@ class Admin_Add_User_Locators:
         # Input field for the employee number / staff ID
         self.txt_employee_number = page.locator('input[formcontrolname="empNo"]')
 
+        # The Add User / User Details form holding all the fields above
+        self.user_form = page.locator("form", has=self.txt_name)
+
         # 🔹 Dropdowns
         # Role selection dropdown to assign access level to the user
         self.dropdown_role = page.locator('ng-select[formcontrolname="role"]')
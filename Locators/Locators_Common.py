@@ -1,3 +1,4 @@
+from functools import cached_property
 from playwright.sync_api import Page
 from Utilities.BaseHelpers import BaseHelper
 
@@ -5,7 +6,6 @@ class Common_Locators:
 
     def __init__(self, page: Page):
         self.page = page
-        self.helper = BaseHelper(page)
 
         # 🔹 Navigation Menu
         # Sidebar link to open the Admin section
@@ -13,6 +13,10 @@ class Common_Locators:
         # Sidebar link to open the Lookups section
         self.side_nav_lookup = page.get_by_role("link", name="Lookups")
 
+    # Created on first use: the async page objects share these locators, never the sync helper
+    @cached_property
+    def helper(self) -> BaseHelper:
+        return BaseHelper(self.page)
 
     # Admin Page Navigation Method
     def navigate_to_admin(self):
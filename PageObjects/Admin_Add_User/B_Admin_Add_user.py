@@ -1,17 +1,34 @@
-from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import Page, Locator, Response, TimeoutError as PlaywrightTimeoutError
 from Utilities.BaseHelpers import BaseHelper
+from Utilities.FrameworkLogger import get_logger, step_fields
+from Utilities.PasswordPolicy import PasswordPolicy, PasswordPolicyCache, PasswordRuleState
+from Utilities.ImportedUsers import ImportedUserReader
 from Locators.Locators_Admin_Add_User import Admin_Add_User_Locators
 from Locators.Locators_Common import Common_Locators
-import pandas as pd
 from playwright.sync_api import expect
 import random
 import string
 import re
 import pytest
+from urllib.parse import unquote_plus
+import fnmatch
 import time
 
+log = get_logger("admin_add_user")
+
 
 class AdminNavigationAndAddUser:
+    # User search: how long the backend may take on big tenants, the URL glob of the grid's
+    # search call (set by conftest from the region's searchResponsePattern; empty = unknown,
+    # wait for the grid only) and the check that the grid lists the searched name
+    SEARCH_RESPONSE_TIMEOUT = 30000
+    SEARCH_RESPONSE_PATTERN = ""
+    EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    # Add User text controls (formcontrolname) filled together by fill_user_form
+    FORM_TEXT_FIELDS = ("name", "department", "email", "loginId", "password", "empNo", "whatsappNo")
+    GRID_SHOWS_NAME_JS = """(name) => [...document.querySelectorAll('.admin-grid-item p')]
+        .some((p) => p.textContent.trim() === name)"""
+
     def __init__(self, page: Page, helper: BaseHelper):
         self.page = page
         self.helper = helper
@@ -51,9 +68,8 @@ class AdminNavigationAndAddUser:
         if not email:
             email = self.random_email()
 
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
-            print(f"❌ Invalid email format: '{email}'")
+        if not re.match(self.EMAIL_PATTERN, email):
+            log.error("❌ Invalid email format: '%s'", email)
             pytest.fail(f"Invalid Email Format: {email}", pytrace=False)
 
         self.helper.enter_text(self.locators.txt_email, email, "Email textbox")
@@ -67,9 +83,9 @@ class AdminNavigationAndAddUser:
         if not login_id:
             login_id = self.random_login_id()
 
-        print(f"🔑 Entering Login ID: {login_id}")
+        log.info("🔑 Entering Login ID: %s", login_id)
         self.helper.enter_text(self.locators.txt_login_id, login_id, "Login ID textbox")
-        print(f"✅ Login ID entered successfully: {login_id}")
+        log.info("✅ Login ID entered successfully: %s", login_id)
         return login_id
 
     # Generate an Employee Number
@@ -88,14 +104,15 @@ class AdminNavigationAndAddUser:
         if isinstance(roles, str):
             roles = [roles]
 
-        print(f"🎯 Selecting roles: {roles}")
+        log.info("🎯 Selecting roles: %s", roles)
 
+        start = time.perf_counter()
         for role in roles:
-            print(f"➡ Selecting role: '{role}'")
+            log.debug("➡ Selecting role: '%s'", role)
 
             # Step 1️⃣ - Open dropdown before *each* selection
             self.helper.click(self.locators.dropdown_role, "Roles dropdown")
-            self.page.wait_for_timeout(500)
+            self.helper.wait_until_settled("roles dropdown", legacy_ms=500)
 
             # Step 2️⃣ - Wait for dropdown to appear
             try:
@@ -111,19 +128,21 @@ class AdminNavigationAndAddUser:
             try:
                 self.page.wait_for_selector(role_option_xpath, state="visible", timeout=5000)
                 role_option.first.click()
-                print(f"✅ Selected role: '{role}'")
+                log.info("✅ Selected role: '%s'", role)
             except Exception as e:
                 self.helper.take_screenshot(prefix=f"ErrorSelecting_{role}")
-                print(f"❌ Error selecting role '{role}': {e}")
+                log.error("❌ Error selecting role '%s': %s", role, e)
 
                 # Debug dropdown content if fails
                 dropdown_texts = self.page.locator("//div[@role='listbox']").all_inner_texts()
-                print(f"🧾 Dropdown visible options: {dropdown_texts}")
+                log.debug("🧾 Dropdown visible options: %s", dropdown_texts)
 
                 pytest.fail(f"❌ Failed to select role '{role}': {e}")
 
-            # Step 4️⃣ - Small delay for safety
-            self.page.wait_for_timeout(500)
+            # Step 4️⃣ - Let the selection render before the next one
+            self.helper.wait_until_settled(f"role '{role}' selected", legacy_ms=500)
+
+        log.info("✅ Selected %d role(s)", len(roles), extra=step_fields("select_role", start))
 
     def select_country_code(self, country_code):
         # Click the dropdown
@@ -138,7 +157,7 @@ class AdminNavigationAndAddUser:
         option.wait_for(state="visible", timeout=5000)
         option.click()
 
-        print(f"✅ Clicked: Country code dropdown, selected: {country_code}")
+        log.info("✅ Clicked: Country code dropdown, selected: %s", country_code)
     # Generate whatsapp number with country code
     def enter_whatsapp_number(self, whatsapp_no="9876543210"):
         self.helper.enter_text(self.locators.whatsapp_input, whatsapp_no, "WhatsApp number input")
@@ -157,16 +176,16 @@ class AdminNavigationAndAddUser:
             is_checked = checkbox.evaluate("el => el.checked")
             if not is_checked:
                 slider.click(force=True)
-                self.page.wait_for_timeout(300)
+                self.helper.wait_until_settled("'Send welcome mail' toggle", legacy_ms=300)
 
             is_checked = checkbox.evaluate("el => el.checked")
             if is_checked:
-                print("✔ 'Send welcome mail to the user?' toggle enabled")
+                log.info("✔ 'Send welcome mail to the user?' toggle enabled")
             else:
-                print("❌ Failed to enable 'Send welcome mail to the user?' toggle")
+                log.error("❌ Failed to enable 'Send welcome mail to the user?' toggle")
                 self.helper.take_screenshot(prefix="SendWelcomeMailFailed")
         except Exception as e:
-            print(f"❌ Error while enabling toggle: {e}")
+            log.error("❌ Error while enabling toggle: %s", e)
             self.helper.take_screenshot(prefix="SendWelcomeMailError")
 
     # disable 'Status' toggle
@@ -183,18 +202,69 @@ class AdminNavigationAndAddUser:
 
             if is_checked:
                 slider.click(force=True)
-                self.page.wait_for_timeout(300)
+                self.helper.wait_until_settled("'Status' toggle", legacy_ms=300)
 
             is_checked = checkbox.evaluate("el => el.checked")
             if not is_checked:
-                print("✔ 'Status' toggle disabled")
+                log.info("✔ 'Status' toggle disabled")
             else:
-                print("❌ Failed to disable 'Status' toggle")
+                log.error("❌ Failed to disable 'Status' toggle")
                 self.helper.take_screenshot(prefix="StatusToggleFailed")
         except Exception as e:
-            print(f"❌ Error while disabling 'Status' toggle: {e}")
+            log.error("❌ Error while disabling 'Status' toggle: %s", e)
             self.helper.take_screenshot(prefix="StatusToggleError")
 
+    # Fill the whole Add User form at once
+    def fill_user_form(self, user: dict | None = None, typed: bool = False) -> dict:
+        """
+        Fill the Add User form from a dict keyed by form control (same keys as the API payload):
+        name, department, email, loginId, password, empNo, role, countryCode, whatsappNo,
+        status (False = disabled) and sendMail (True = send welcome mail).
+
+        Text fields are set in one BaseHelper.fill_form call, which is meant for data setup;
+        typed=True enters them one by one with the enter_* steps instead, so a test still
+        covers real input into the form. The dropdowns and toggles use their own steps.
+        Missing name, email, loginId, empNo and password are generated.
+
+        Returns:
+            dict: The values entered, generated ones included.
+        """
+        user = dict(user or {})
+        user.setdefault("name", f"User_{self.random_string(5)}")
+        user.setdefault("email", self.random_email())
+        user.setdefault("loginId", self.random_login_id())
+        user.setdefault("empNo", self.random_employee_number())
+        if not user.get("password"):
+            user["password"] = PasswordGenerationAndValidation(self.page, self.helper).generate_valid_password()
+
+        if not re.match(self.EMAIL_PATTERN, user["email"]):
+            log.error("❌ Invalid email format: '%s'", user['email'])
+            pytest.fail(f"Invalid Email Format: {user['email']}", pytrace=False)
+
+        log.info("📝 Filling Add User form for '%s' (Login ID: %s)", user['name'], user['loginId'])
+        if typed:
+            self.enter_name(user["name"])
+            if user.get("department"):
+                self.enter_department(user["department"])
+            self.enter_email(user["email"])
+            self.enter_login_id(user["loginId"])
+            PasswordGenerationAndValidation(self.page, self.helper).enter_password(user["password"])
+            self.enter_employee_number(user["empNo"])
+            if user.get("whatsappNo"):
+                self.enter_whatsapp_number(user["whatsappNo"])
+        else:
+            self.helper.fill_form({name: user.get(name) for name in self.FORM_TEXT_FIELDS},
+                                  container=self.locators.user_form, description="Add User form")
+        if user.get("role"):
+            self.select_role(user["role"])
+        if user.get("countryCode"):
+            self.select_country_code(user["countryCode"])
+        if user.get("status") is False:
+            self.disable_user_status_toggle()
+        if user.get("sendMail"):
+            self.enable_send_welcome_mail()
+        return user
+
     # Click Reset Password link/icon
     def click_reset_password(self):
         """
@@ -205,20 +275,59 @@ class AdminNavigationAndAddUser:
             "Reset Password icon/link"
         )
 
+    @classmethod
+    def is_search_response(cls, response: Response, term: str) -> bool:
+        """True for the grid's search call for `term` (URL matches SEARCH_RESPONSE_PATTERN, term in URL or body)."""
+        if not fnmatch.fnmatchcase(response.url, cls.SEARCH_RESPONSE_PATTERN):
+            return False
+        return term in unquote_plus(response.url) or term in (response.request.post_data or "")
+
+    @staticmethod
+    def search_rows(payload) -> list[dict]:
+        """User rows of a search payload ({"data": [...]} or a bare list); [] for anything else."""
+        rows = payload.get("data") if isinstance(payload, dict) else payload
+        return [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
+
     # To Search User in Admin Page
-    def search_user(self, username: str, timeout: int = 5000):
+    def search_user(self, username: str, timeout: int = 5000) -> list[dict]:
+        """
+        Search the user grid until it lists `username`; no fixed sleep, so small grids
+        return at once and big tenants get up to SEARCH_RESPONSE_TIMEOUT for the backend.
+
+        When the region configures the search call's URL (searchResponsePattern), its
+        response is awaited and its rows returned; otherwise only the grid is watched.
+
+        Returns:
+            list[dict]: The rows of the search response (name, loginId, status, ...),
+            or [] when the search call is not known for this region.
+        """
+        start = time.perf_counter()
         try:
-            print(f"🔍  Searching for user '{username}'...")
+            log.info("🔍  Searching for user '%s'...", username)
             self.locators.search_box.wait_for(state="visible", timeout=timeout)
             self.locators.search_box.fill("")  # clear old value
             self.locators.search_box.fill(username)  # type username
-            self.page.keyboard.press("Enter")  # trigger search
-            self.page.wait_for_timeout(1500)  # wait for list refresh
-            print(f"✅ User '{username}' search completed.")
+            response_timeout = max(timeout, self.SEARCH_RESPONSE_TIMEOUT)
+            rows = []
+            if self.SEARCH_RESPONSE_PATTERN:
+                with self.page.expect_response(lambda r: self.is_search_response(r, username),
+                                               timeout=response_timeout) as response_info:
+                    self.page.keyboard.press("Enter")  # trigger search
+                try:
+                    rows = self.search_rows(response_info.value.json())
+                except ValueError:
+                    pass  # not JSON; the grid check below still applies
+            else:
+                self.page.keyboard.press("Enter")  # trigger search
+            self.page.wait_for_function(self.GRID_SHOWS_NAME_JS, arg=username,
+                                        timeout=timeout if self.SEARCH_RESPONSE_PATTERN else response_timeout)
+            log.info("✅ User '%s' search completed — %d result(s).", username, len(rows),
+                     extra=step_fields("search_user", start))
+            return rows
         except Exception as e:
             self.helper.take_screenshot(f"SearchUserFailed_{username}")
             error_msg = f"❌ Failed to search user '{username}': {e}"
-            print(error_msg)
+            log.error(error_msg, extra=step_fields("search_user", start))
             raise AssertionError(error_msg)
 
     # Click User in All Users page to open user details
@@ -229,11 +338,11 @@ class AdminNavigationAndAddUser:
             )
             user_locator.wait_for(state="visible", timeout=timeout)
             user_locator.click()
-            print(f"✅ Clicked on user '{username}' in {description}.")
+            log.info("✅ Clicked on user '%s' in %s.", username, description)
         except Exception as e:
             self.helper.take_screenshot(f"ClickUserFailed_{username}")
             error_msg = f"❌ Failed to click user '{username}' in {description}: {e}"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
     # Click Save button and validate toast messages
@@ -242,16 +351,16 @@ class AdminNavigationAndAddUser:
         Clicks the Save button and validates toast messages.
         Ensures screenshot and proper failure logging for any invalid state.
         """
+        mark = self.helper.toasts.mark()
         self.helper.click(self.locators.btn_save, "Save button")
 
-        # Toast locator: supports both div/span structures
-        toast = self.page.locator("#toast-container div, #toast-container span").first
-
         try:
-            # Wait for toast to appear (max 5 seconds)
-            toast.wait_for(state="visible", timeout=5000)
-            message = " ".join(toast.inner_text().strip().split())  # Normalize whitespace
-            print(f"💬 Toast detected: '{message}'")
+            # First toast raised by this Save (max 5 seconds)
+            toast = self.helper.toasts.wait_for(mark, timeout=5000)
+            if toast is None:
+                raise PlaywrightTimeoutError("No toast within 5000 ms")
+            message = toast.text
+            log.info("💬 Toast detected: '%s'", message)
 
             # --- Duplicate or error validations ---
             if re.search(r"username\s*already\s*exists?", message, re.IGNORECASE):
@@ -267,18 +376,18 @@ class AdminNavigationAndAddUser:
                 pytest.fail(f"❌ Form submission failed: {message}. Screenshot: {screenshot_path}", pytrace=False)
 
             else:
-                print(f"✅ Success message: {message}")
+                log.info("✅ Success message: %s", message)
 
         except PlaywrightTimeoutError:
-            print("⚠️ No toast appeared after clicking Save — checking Save button visibility...")
+            log.warning("⚠️ No toast appeared after clicking Save — checking Save button visibility...")
             if self.locators.btn_save.is_visible():
                 screenshot_path = self.helper.take_screenshot("SaveButtonStillVisible")
                 pytest.fail(f"❌ Save did not complete successfully. Screenshot: {screenshot_path}", pytrace=False)
             else:
-                print("✅ Save action likely successful (button hidden, no toast detected).")
+                log.info("✅ Save action likely successful (button hidden, no toast detected).")
 
         except Exception as e:
-            print(f"⚠️ Unexpected error while handling toast: {e}")
+            log.warning("⚠️ Unexpected error while handling toast: %s", e)
             screenshot_path = self.helper.take_screenshot("UnexpectedToastError")
             pytest.fail(f"⚠️ Unexpected error during Save: {e}. Screenshot: {screenshot_path}", pytrace=False)
 
@@ -301,11 +410,11 @@ class AdminNavigationAndAddUser:
         try:
             self.locators.btn_update.wait_for(state="visible", timeout=5000)
             self.helper.click(self.locators.btn_update, "Update button")
-            print("✅ Clicked the 'Update' button successfully.")
+            log.info("✅ Clicked the 'Update' button successfully.")
         except Exception as e:
             self.helper.take_screenshot("ClickUpdateFailed")
             error_msg = f"❌ Failed to click 'Update' button: {e}"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
 class UserVerificationAndDuplicateEmpNOLoginChecks:
@@ -329,11 +438,11 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
         )
         try:
             user_row.wait_for(state="visible", timeout=5000)
-            print(f"✅ User '{username}' found in All Users Page.")
+            log.info("✅ User '%s' found in All Users Page.", username)
         except PlaywrightTimeoutError:
             self.helper.take_screenshot(f"UserNotFound_{username}")
             error_msg = f"❌ User '{username}' not found in All Users list."
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
     # Verify whether the user's status toggle is enabled or disabled
@@ -341,7 +450,7 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
         """
         Verify whether the given user's status toggle is enabled (Active) or disabled (Inactive).
         """
-        print(f"\n🔍  Verifying user status toggle for '{username}' under {description}...")
+        log.info("🔍  Verifying user status toggle for '%s' under %s...", username, description)
         try:
             toggle_locator = self.page.locator(
                 f'//p[normalize-space()="{username}"]/ancestor::div[contains(@class,"admin-grid-item")]//input[@aria-label="User Status"]'
@@ -350,15 +459,15 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
             is_checked = toggle_locator.is_checked()
 
             if is_checked:
-                print(f"🔴 🏆  User '{username}' status is Active (toggle ON).")
+                log.info("🔴 🏆  User '%s' status is Active (toggle ON).", username)
                 return "Active"
             else:
-                print(f"🔴  User '{username}' status is Disabled (toggle OFF).")
+                log.info("🔴  User '%s' status is Disabled (toggle OFF).", username)
                 return "Disabled"
         except Exception as e:
             self.helper.take_screenshot(f"ToggleCheckFailed_{username}")
             error_msg = f"❌ Test failed — Unable to verify toggle for '{username}': {e}"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
     def toggle_user_status(self, username):
@@ -373,7 +482,7 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
 
     def verify_user_status_toggle_disabled(self, username: str, description: str = "'User Status Toggle'",
                                            timeout: int = 10000):
-        print(f"🔍 Verifying that user status toggle for '{username}' is DISABLED...")
+        log.info("🔍 Verifying that user status toggle for '%s' is DISABLED...", username)
         try:
             checkbox_locator = self.page.locator(
                 f'//p[normalize-space()="{username}"]/ancestor::div[contains(@class,"admin-grid-item")]//input[@aria-label="User Status"]'
@@ -383,7 +492,7 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
             is_checked = checkbox_locator.is_checked()
 
             if not is_checked:
-                print(f"✔ User '{username}' is correctly disabled (toggle OFF).")
+                log.info("✔ User '%s' is correctly disabled (toggle OFF).", username)
                 return "Disabled"
             else:
                 self.helper.take_screenshot(f"ToggleShouldBeDisabled_{username}")
@@ -395,16 +504,12 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
             raise AssertionError(f"❌ Unable to verify toggle state for '{username}': {e}")
 
     def enable_user_toggle(self, username: str, description: str = "'User Status Toggle'", timeout: int = 10000):
-        print(f"🟢 Enabling user status for '{username}'...")
+        log.info("🟢 Enabling user status for '%s'...", username)
 
+        start = time.perf_counter()
         try:
             # 🔍 Search user before interacting
-            search_box = self.page.locator("#search-user-grid-records")
-            search_box.wait_for(state="visible", timeout=5000)
-            search_box.fill("")
-            search_box.fill(username)
-            self.page.keyboard.press("Enter")
-            self.page.wait_for_timeout(1500)
+            self.admin_nav.search_user(username)  # waits until the grid lists the user
 
             toggle_slider = self.page.locator(
                 f'//p[normalize-space()="{username}"]/ancestor::div[contains(@class,"admin-grid-item")]'
@@ -421,14 +526,14 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
             try:
                 self.helper.scroll_to_label(toggle_slider, friendly_name=f"{username} Toggle")
             except Exception:
-                print("⚠ Element already in view or scrolling not needed.")
+                log.debug("⚠ Element already in view or scrolling not needed.")
 
             if toggle_checkbox.is_checked():
-                print(f"ℹ '{username}' is already enabled.")
+                log.info("ℹ '%s' is already enabled.", username)
                 return "Already Enabled"
 
             toggle_slider.click(force=True)
-            print(f"🖱 Clicked toggle for '{username}'...")
+            log.info("🖱 Clicked toggle for '%s'...", username)
 
             # 📌 Handle confirmation popup if appears
             yes_button = self.page.locator(
@@ -438,14 +543,14 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
             try:
                 yes_button.wait_for(state="visible", timeout=5000)
                 yes_button.click()
-                print("🆗 Clicked 'Yes' to confirm activation.")
+                log.info("🆗 Clicked 'Yes' to confirm activation.")
             except:
-                print("ℹ No confirmation popup — continuing...")
+                log.info("ℹ No confirmation popup — continuing...")
 
-            self.page.wait_for_timeout(2000)
+            self.helper.wait_until_settled("user status update", legacy_ms=2000)
 
             if toggle_checkbox.is_checked():
-                print(f"✅ '{username}' successfully enabled.")
+                log.info("✅ '%s' successfully enabled.", username, extra=step_fields("enable_user_toggle", start))
                 return "Enabled"
             else:
                 self.helper.take_screenshot(f"EnableToggleFailed_{username}")
@@ -460,14 +565,14 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
         """
         Switches to Active Users tab and verifies that the user appears there.
         """
-        print(f"👁️  Checking if '{username}' appears in Active Users list...")
+        log.info("👁️  Checking if '%s' appears in Active Users list...", username)
         self.admin_nav.click_Active_Users_radio_()
-        self.page.wait_for_timeout(2000)
+        self.helper.wait_until_settled("Active Users list", legacy_ms=2000)
 
         user_locator = self.page.locator(f'//p[normalize-space()="{username}"]')
         try:
             user_locator.wait_for(state="visible", timeout=timeout)
-            print(f"✅ User '{username}' is displayed in Active Users list.")
+            log.info("✅ User '%s' is displayed in Active Users list.", username)
             return True
         except:
             self.helper.take_screenshot(f"UserNotFoundInActive_{username}")
@@ -479,39 +584,38 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
         Click Save and check if expected duplicate login toast appears.
         Takes screenshot if toast does not appear or message mismatch.
         """
+        mark = self.helper.toasts.mark()
         self.helper.click(self.locators.btn_save, "Save button")
 
         try:
-            # Wait for toast container to attach
-            self.page.locator("#toast-container").wait_for(state="attached", timeout=5000)
-
-            # Wait for the actual toast message
-            toast_locator = self.page.locator("#toast-container div, #toast-container span").first
-            toast_locator.wait_for(state="visible", timeout=10000)
+            # First toast raised by this Save
+            toast = self.helper.toasts.wait_for(mark, timeout=10000)
+            if toast is None:
+                raise PlaywrightTimeoutError("No toast within 10000 ms")
 
-            message = " ".join(toast_locator.inner_text().strip().split())
-            print(f"⚠️ Toast message detected: {message}")
+            message = toast.text
+            log.warning("⚠️ Toast message detected: %s", message)
 
             if expected_message.lower() not in message.lower():
                 self.helper.take_screenshot(prefix="DuplicateToastMismatch")
                 error_msg = f"❌ Expected message '{expected_message}', but got: '{message}'"
-                print(error_msg)
+                log.error(error_msg)
                 raise AssertionError(error_msg)
 
-            print("✅ Negative test passed: Toast message displayed correctly")
+            log.info("✅ Negative test passed: Toast message displayed correctly")
             return True
 
         except PlaywrightTimeoutError:
-            print("⚠️ Toast did not appear — taking screenshot.")
+            log.warning("⚠️ Toast did not appear — taking screenshot.")
             self.helper.take_screenshot(prefix="ToastNotFound")
             error_msg = f"❌ Expected toast message '{expected_message}' did not appear"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
         except Exception as e:
             self.helper.take_screenshot(prefix="DuplicateToastError")
             error_msg = f"❌ Unexpected error while verifying duplicate login toast: {e}"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
     # To verify duplicate Employee No toast message
@@ -520,42 +624,52 @@ class UserVerificationAndDuplicateEmpNOLoginChecks:
         Click Save and verify 'Employee No Already Exist' toast appears.
         Takes screenshot if toast does not appear or message mismatch.
         """
+        mark = self.helper.toasts.mark()
         self.helper.click(self.locators.btn_save, "Save button")
 
         try:
-            self.page.locator("#toast-container").wait_for(state="attached", timeout=5000)
-
-            toast_locator = self.page.locator("#toast-container div, #toast-container span").first
-            toast_locator.wait_for(state="visible", timeout=10000)
+            toast = self.helper.toasts.wait_for(mark, timeout=10000)
+            if toast is None:
+                raise PlaywrightTimeoutError("No toast within 10000 ms")
 
-            message = " ".join(toast_locator.inner_text().strip().split())
-            print(f"⚠️ Toast message detected: {message}")
+            message = toast.text
+            log.warning("⚠️ Toast message detected: %s", message)
 
             if "Employee No Already Exist" not in message:
                 self.helper.take_screenshot(prefix="DuplicateEmpToastMismatch")
                 error_msg = f"❌ Expected duplicate employee number message, but got: '{message}'"
-                print(error_msg)
+                log.error(error_msg)
                 raise AssertionError(error_msg)
 
-            print("✅ Negative test passed: Duplicate Employee Number message displayed correctly")
+            log.info("✅ Negative test passed: Duplicate Employee Number message displayed correctly")
 
         except PlaywrightTimeoutError:
-            print("⚠️ Toast did not appear — taking screenshot.")
+            log.warning("⚠️ Toast did not appear — taking screenshot.")
             self.helper.take_screenshot(prefix="DuplicateEmpToastNotFound")
             error_msg = "❌ Expected duplicate Employee Number toast did not appear"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
         except Exception as e:
             self.helper.take_screenshot(prefix="DuplicateEmpToastError")
             error_msg = f"❌ Unexpected error while verifying duplicate employee toast: {e}"
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
 class PasswordGenerationAndValidation:
     """
     Handles password entry, policy validation, generation, and reset flows.
     """
+    PASSWORD_RULES = "cf-password-policy-validate .password-validation ul li"
+
+    # Every rendered rule with its validator state. Only the "valid" class counts as met;
+    # visibility is reported but never taken as a verdict.
+    READ_RULES_JS = """(items) => items.map((li) => ({
+        text: li.textContent.trim(),
+        visible: li.checkVisibility(),
+        passed: li.classList.contains("valid"),
+    }))"""
+
     def __init__(self, page: Page, helper: BaseHelper):
         self.page = page
         self.helper = helper
@@ -592,106 +706,69 @@ class PasswordGenerationAndValidation:
             raise AssertionError(f"❌ Failed to enter new password: {e}")
 
     # ------------------- Password Policy Helpers -------------------
+    def read_password_rules(self) -> list[PasswordRuleState]:
+        """Text, visibility and pass/fail of every rendered rule, in one evaluate call."""
+        return [PasswordRuleState(**rule)
+                for rule in self.page.locator(self.PASSWORD_RULES).evaluate_all(self.READ_RULES_JS)]
+
+    def check_password(self, password: str) -> dict[str, bool]:
+        """Fill `password`, then read the validator's verdict per rule text in one call."""
+        self.txt_password.fill(password)
+        return {rule.text: rule.passed for rule in self.read_password_rules()}
+
+    def probe_password_rules(self) -> list[PasswordRuleState]:
+        """Every rule the validator renders once a character is typed (the field is cleared again)."""
+        field = self.txt_password
+        field.fill("a")  # trigger validation container
+        self.helper.wait_until_settled("password rules", legacy_ms=200)
+        rules = self.read_password_rules()
+        field.fill("")  # Clear temporary char
+        return rules
+
     def get_visible_password_rules(self) -> list[str]:
         """
         Returns all currently visible password rules.
         """
-        field = self.txt_password
-        field.fill("a")  # trigger validation container
-        self.page.wait_for_timeout(200)
-
-        rules_locator: Locator = self.page.locator("cf-password-policy-validate .password-validation ul li")
-        visible_rules: list[str] = [rules_locator.nth(i).inner_text().strip()
-                                    for i in range(rules_locator.count()) if rules_locator.nth(i).is_visible()]
-
-        field.fill("")  # Clear temporary char
+        visible_rules = [rule.text for rule in self.probe_password_rules() if rule.visible]
         if visible_rules:
-            print("🔍 Visible password validations:")
+            log.info("🔍 Visible password validations:")
             for idx, rule in enumerate(visible_rules, 1):
-                print(f"{idx}. {rule}")
+                log.debug("%s. %s", idx, rule)
         else:
-            print("✅ No visible password validations.")
+            log.info("✅ No visible password validations.")
         return visible_rules
 
-    @staticmethod
-    def parse_length_limits(rules: list[str]) -> tuple[int, int]:
-        """
-        Parses min and max length from visible rules.
-        """
-        min_len, max_len = 8, 20
-        for rule in rules:
-            r_lower = rule.lower()
-            if "at least" in r_lower:
-                min_len = max(min_len, int(''.join(filter(str.isdigit, rule))))
-            elif "less than" in r_lower:
-                max_len = min(max_len, int(''.join(filter(str.isdigit, rule))) - 1)
-        return min_len, max_len
+    def rendered_password_rules(self) -> list[str]:
+        """Every rule the validator has rendered, met or not (one read, nothing typed)."""
+        return [rule.text for rule in self.read_password_rules()]
 
-    @staticmethod
-    def add_char_for_rule(rules: list[str]) -> str:
-        """
-        Returns a character that satisfies one of the unmet rules.
+    def password_policy(self) -> PasswordPolicy:
         """
-        for rule in rules:
-            r_lower = rule.lower()
-            if "number" in r_lower:
-                return random.choice(string.digits)
-            if "uppercase" in r_lower:
-                return random.choice(string.ascii_uppercase)
-            if "alphabet" in r_lower:
-                return random.choice(string.ascii_lowercase)
-            if "special" in r_lower:
-                return random.choice("!@#$%^&*")
-            if "at least" in r_lower or "less than" in r_lower:
-                return random.choice(string.ascii_letters + string.digits + "!@#$%^&*")
-        return random.choice(string.ascii_letters + string.digits + "!@#$%^&*")
-
-
-    def _rule_satisfied(self, rule: str, password: str) -> bool:
+        The tenant's compiled rules (lengths, required character classes, allowed specials).
+        Taken from PasswordPolicyCache while it is fresh and the rendered rules match it;
+        otherwise the rules are read again (typing a character if none are rendered yet).
+        The same set — every rendered rule, met or not — is stored and fingerprinted.
         """
-        Checks if password satisfies a single rule.
-        """
-        r_lower = rule.lower()
-        if "number" in r_lower:
-            return any(c.isdigit() for c in password)
-        if "uppercase" in r_lower:
-            return any(c.isupper() for c in password)
-        if "alphabet" in r_lower:
-            return any(c.islower() for c in password)
-        if "special" in r_lower:
-            return any(c in "!@#$%^&*" for c in password)
-        if "at least" in r_lower:
-            min_len = int(''.join(filter(str.isdigit, rule)))
-            return len(password) >= min_len
-        if "less than" in r_lower:
-            max_len = int(''.join(filter(str.isdigit, rule))) - 1
-            return len(password) <= max_len
-        return True
+        cache = PasswordPolicyCache.shared()
+        rendered = self.rendered_password_rules()
+        policy = cache.get(rendered)
+        if policy is None:
+            policy = cache.put(rendered or [rule.text for rule in self.probe_password_rules()])
+        return policy
 
     def generate_valid_password(self) -> str:
         """
-        Generates a valid password based on visible rules.
+        Generates a valid password based on visible rules: built in Python from the compiled
+        policy, filled once, and confirmed with one read of the validator.
         """
-        password = ""
-        visible_rules = self.get_visible_password_rules()
-        min_len, max_len = self.parse_length_limits(visible_rules)
-
-        # Satisfy all rules
-        while True:
-            unmet_rules = [rule for rule in visible_rules if not self._rule_satisfied(rule, password)]
-            if not unmet_rules or len(password) >= max_len:
-                break
-            password += self.add_char_for_rule(unmet_rules)
-            self.txt_password.fill(password)
-            time.sleep(0.05)
-
-        # Ensure minimum length
-        while len(password) < min_len:
-            password += random.choice(string.ascii_letters + string.digits + "!@#$%^&*")
-            self.txt_password.fill(password)
-            time.sleep(0.02)
-
-        print(f"🔑 Generated valid password: {password}")
+        policy = self.password_policy()
+        password = policy.generate_valid()
+        unmet = [rule for rule, passed in self.check_password(password).items() if not passed]
+        if unmet:
+            self.helper.take_screenshot("GeneratedPasswordRejected")
+            raise AssertionError(f"❌ Generated password '{password}' rejected by the validator: {unmet}")
+
+        log.info("🔑 Generated valid password: %s", password)
         return password
 
     # ------------------- Reset Password Flow -------------------
@@ -714,17 +791,18 @@ class PasswordGenerationAndValidation:
         self.helper.click(self.locators.reset_password_link, "Reset Password link")
 
         # Step 2: Enter old password (expect failure)
-        print(f"🧪 Trying old password: {old_password}")
+        log.debug("🧪 Trying old password: %s", old_password)
         self.enter_new_password(old_password)
+        mark = self.helper.toasts.mark()
         self.helper.click(self.btn_update, "Update button (old password)")
-        self.page.wait_for_timeout(3000)
 
-        toast = self.page.locator("#toast-container div, #toast-container span").first
         try:
-            toast.wait_for(state="visible", timeout=5000)
-            message = toast.inner_text().strip()
+            toast = self.helper.toasts.wait_for(mark, timeout=5000)
+            if toast is None:
+                raise PlaywrightTimeoutError("No toast within 5000 ms")
+            message = toast.text
             if "old password" in message.lower() or "create a new password" in message.lower():
-                print(f"✅ Policy validation triggered correctly: '{message}'")
+                log.info("✅ Policy validation triggered correctly: '%s'", message)
             else:
                 self.helper.take_screenshot("UnexpectedToast_ResetPassword")
                 pytest.fail(f"❌ Unexpected toast after old password: {message}", pytrace=False)
@@ -737,15 +815,17 @@ class PasswordGenerationAndValidation:
         self.enter_new_password(new_password)
 
         # Step 4: Click update for new password
+        mark = self.helper.toasts.mark()
         self.helper.click(self.btn_update, "Update button (valid password)")
-        self.page.wait_for_timeout(3000)
 
-        # Step 4a: Verify success toast
+        # Step 4a: Verify success toast (only one raised by this Update counts)
         try:
-            toast.wait_for(state="visible", timeout=5000)
-            message = toast.inner_text().strip()
+            toast = self.helper.toasts.wait_for(mark, timeout=5000)
+            if toast is None:
+                raise PlaywrightTimeoutError("No toast within 5000 ms")
+            message = toast.text
             if "password updated successfully" in message.lower():
-                print(f"✅ Password reset successful: '{message}'")
+                log.info("✅ Password reset successful: '%s'", message)
             else:
                 self.helper.take_screenshot("UnexpectedToast_NewPassword")
                 pytest.fail(f"❌ Unexpected toast after new password: {message}", pytrace=False)
@@ -757,178 +837,157 @@ class PasswordGenerationAndValidation:
         return new_password
 
 
-# ---------------- Password Utilities ----------------
-class PasswordUtils:
-    @staticmethod
-    def parse_length_limits(rules: list[str]) -> tuple[int, int]:
-        """
-        Parse minimum and maximum length dynamically from visible rules.
-        """
-        min_len = 8
-        max_len = 20
-        for rule in rules:
-            r_lower = rule.lower()
-            if "at least" in r_lower:
-                min_len = max(min_len, int(''.join(filter(str.isdigit, rule))))
-            elif "less than" in r_lower:
-                max_len = min(max_len, int(''.join(filter(str.isdigit, rule))) - 1)
-        return min_len, max_len
-
 # ---------------- Invalid Password Tests ----------------
 class InvalidPasswordTests:
+    # Types each candidate into the password control (native setter + input event, as a user
+    # would), waits a tick for the validator and records which rules it then shows as failed.
+    # The field is cleared again at the end.
+    CHECK_CANDIDATES_JS = """async (control, [selector, candidates]) => {
+        const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+        const type = (value) => {
+            setter.call(control, value);
+            control.dispatchEvent(new Event("input", {bubbles: true}));
+        };
+        const verdicts = [];
+        for (const password of candidates) {
+            type(password);
+            await new Promise((resolve) => setTimeout(resolve));
+            const failed = Array.from(document.querySelectorAll(selector))
+                .filter((li) => !li.classList.contains("valid"))  // as READ_RULES_JS: only "valid" is met
+                .map((li) => li.textContent.trim());
+            verdicts.push(failed);
+        }
+        type("");
+        return verdicts;
+    }"""
+
     def __init__(self, page: Page, helper: BaseHelper, txt_password_locator, btn_save_locator):
         self.page = page
         self.helper = helper
         self.txt_password = txt_password_locator
         self.btn_save = btn_save_locator
 
-    def generate_invalid_passwords(self) -> list[tuple[str, str]]:
+    def generate_invalid_passwords(self, per_rule: int = 1) -> list[tuple[str, str]]:
         """
-        Dynamically generates invalid passwords for each visible validation rule.
+        Generates invalid passwords for each rule of the tenant's (cached) password policy,
+        boundary lengths first (see PasswordPolicy.invalid_candidates).
         Returns a list of tuples (rule_text, invalid_password).
         """
-        field = self.txt_password
-
-        # Trigger container by typing a character
-        field.fill("a")
-        self.page.wait_for_timeout(300)
-
-        rules = self.page.locator("cf-password-policy-validate .password-validation ul li")
+        policy = PasswordGenerationAndValidation(self.page, self.helper).password_policy()
         invalid_passwords: list[tuple[str, str]] = []
-
-        count = rules.count()
-        if count == 0:
-            print("✅ No visible password validations found — skipping invalid password generation.")
+        if not policy.rules:
+            log.info("✅ No password validations found — skipping invalid password generation.")
             return []
 
-        # Collect visible rules
-        visible_rules: list[str] = []
-        for i in range(count):
-            r = rules.nth(i)
-            if r.is_visible():
-                visible_rules.append(r.inner_text().strip())
-
-        print(f"\n🔍 Found {len(visible_rules)} visible password rules:")
-        for idx, rule in enumerate(visible_rules, start=1):
-            print(f"   {idx}. {rule}")
-
-        # Determine min and max from current rules
-        min_len, max_len = PasswordUtils.parse_length_limits(visible_rules)
-
-        # Generate invalid passwords for each rule
-        for rule in visible_rules:
-            rule_lower = rule.lower()
-            invalid_pwd = ""
+        log.info("🔍 Found %d password rules:", len(policy.rules))
+        for idx, rule in enumerate(policy.rules, start=1):
+            log.debug("%s. %s", idx, rule)
 
-            if "at least" in rule_lower:
-                target_len = max(1, min_len - 1)
-                invalid_pwd = ''.join(random.choices(string.ascii_letters + string.digits + "!@#$%^&*", k=target_len))
+        # Break each rule in turn
+        for rule in policy.rules:
+            for invalid_pwd in policy.invalid_candidates(rule)[:per_rule]:
+                log.debug("   -> Rule: '%s' -> invalid password length: %d -> pwd: %s",
+                          rule, len(invalid_pwd), invalid_pwd)
+                invalid_passwords.append((rule, invalid_pwd))
 
-            elif "less than" in rule_lower:
-                target_len = max_len + 3
-                invalid_pwd = ''.join(random.choices(string.ascii_letters + string.digits + "!@#$%^&*", k=target_len))
+        return invalid_passwords
 
-            elif "number" in rule_lower:
-                target_len = max(min_len, 8)
-                invalid_pwd = ''.join(random.choices(string.ascii_letters + "!@#$%^&*", k=target_len))
+    def check_invalid_passwords(self, invalid_passwords: list[tuple[str, str]]) -> list[tuple[str, str, list[str]]]:
+        """
+        Runs every candidate through the password control in one in-page loop.
+        Returns (rule, password, rules the validator showed as failed) per candidate.
+        """
+        start = time.perf_counter()
+        verdicts = self.txt_password.evaluate(
+            self.CHECK_CANDIDATES_JS,
+            [PasswordGenerationAndValidation.PASSWORD_RULES, [pwd for _, pwd in invalid_passwords]],
+        )
+        log.info("✅ Checked %d invalid password(s) in one call", len(invalid_passwords),
+                 extra=step_fields("check_invalid_passwords", start))
+        return [(rule, pwd, failed) for (rule, pwd), failed in zip(invalid_passwords, verdicts)]
 
-            elif "uppercase" in rule_lower:
-                target_len = max(min_len, 8)
-                invalid_pwd = ''.join(random.choices(string.ascii_lowercase + string.digits + "!@#$%^&*", k=target_len))
+    def save_is_rejected(self, rule: str, bad_pwd: str):
+        """
+        Fills one invalid password, clicks 'Save', and checks that the Save button is still visible.
+        Fails the test if the invalid password is accepted.
+        """
+        log.info("🧩 Testing invalid password for rule: %s", rule)
+        log.debug("➡ Invalid password used: %s (len=%s)", bad_pwd, len(bad_pwd))
 
-            elif "alphabet" in rule_lower:
-                target_len = max(min_len, 8)
-                invalid_pwd = ''.join(random.choices(string.digits + "!@#$%^&*", k=target_len))
+        # Clear and type password
+        self.txt_password.fill("")
+        self.helper.wait_until_settled("password cleared", legacy_ms=500)
+        self.txt_password.fill(bad_pwd)
 
+        # Wait for frontend validation to update
+        self.helper.wait_until_settled("password validation", legacy_ms=1000)
 
-            elif "special" in rule_lower:
-                target_len = max(min_len, 8)
-                invalid_pwd = random.choice(string.digits) + ''.join(
-                    random.choices(string.ascii_letters + string.digits, k=target_len - 1)
-                )
+        # Click Save
+        self.helper.click(self.btn_save, "Save button")
+        self.helper.wait_until_settled("Save with invalid password", legacy_ms=1000)
 
+        try:
+            if self.btn_save.is_visible():
+                log.info("✅ Negative case passed — Save button still visible for rule: '%s'", rule)
             else:
-                target_len = max(1, min_len - 1)
-                invalid_pwd = ''.join(random.choices(string.ascii_letters + string.digits + "!@#$%^&*", k=target_len))
-
-            print(f"   -> Rule: '{rule}' -> invalid password length: {len(invalid_pwd)} -> pwd: {invalid_pwd}")
-            invalid_passwords.append((rule, invalid_pwd))
+                screenshot_name = f"InvalidPassword_{re.sub(r'[^0-9a-zA-Z]+', '_', rule)[:30]}"
+                self.helper.take_screenshot(screenshot_name)
+                pytest.fail(f"❌ Invalid password accepted for rule '{rule}'. Screenshot: {screenshot_name}",
+                            pytrace=False)
 
-        return invalid_passwords
+        except Exception:
+            screenshot_name = f"CheckSaveVisibleError_{re.sub(r'[^0-9a-zA-Z]+', '_', rule)[:30]}"
+            self.helper.take_screenshot(screenshot_name)
+            pytest.fail(
+                f"⚠️ Exception while verifying Save button for rule '{rule}'. Screenshot: {screenshot_name}",
+                pytrace=False)
 
-    def test_invalid_passwords(self):
+    def test_invalid_passwords(self, fast: bool = True, per_rule: int = 3, save_samples: int = 1):
         """
-        Loops through each invalid password, fills it,
-        clicks 'Save', and checks that the Save button is still visible.
-        Fails the test if an invalid password is accepted.
+        Checks invalid passwords for every rule; fails the test if one is accepted.
+
+        fast=True : `per_rule` candidates per rule (boundary lengths first) are checked against the
+                    validator in one in-page loop; only the first `save_samples` per rule are
+                    also submitted with 'Save'.
+        fast=False: one candidate per rule, each filled and submitted with 'Save'.
         """
-        invalid_passwords = self.generate_invalid_passwords()
+        invalid_passwords = self.generate_invalid_passwords(per_rule if fast else 1)
 
         if not invalid_passwords:
-            print("✅ No password rules found — skipping invalid tests.")
+            log.info("✅ No password rules found — skipping invalid tests.")
             return
 
-        for rule, bad_pwd in invalid_passwords:
-            print(f"\n🧩 Testing invalid password for rule: {rule}")
-            print(f"   ➡ Invalid password used: {bad_pwd} (len={len(bad_pwd)})")
-
-            # Clear and type password
-            self.txt_password.fill("")
-            self.page.wait_for_timeout(500)
-            self.txt_password.fill(bad_pwd)
-
-            # Wait for frontend validation to update
-            self.page.wait_for_timeout(1000)
-
-            # Click Save
-            self.helper.click(self.btn_save, "Save button")
-            self.page.wait_for_timeout(1000)
-
-            try:
-                if self.btn_save.is_visible():
-                    print(f"✅ Negative case passed — Save button still visible for rule: '{rule}'")
-                else:
-                    screenshot_name = f"InvalidPassword_{re.sub(r'[^0-9a-zA-Z]+', '_', rule)[:30]}"
-                    self.helper.take_screenshot(screenshot_name)
-                    pytest.fail(f"❌ Invalid password accepted for rule '{rule}'. Screenshot: {screenshot_name}",
-                                pytrace=False)
-
-            except Exception:
-                screenshot_name = f"CheckSaveVisibleError_{re.sub(r'[^0-9a-zA-Z]+', '_', rule)[:30]}"
-                self.helper.take_screenshot(screenshot_name)
-                pytest.fail(
-                    f"⚠️ Exception while verifying Save button for rule '{rule}'. Screenshot: {screenshot_name}",
-                    pytrace=False)
+        if fast:
+            verdicts = self.check_invalid_passwords(invalid_passwords)
+            missed = [(rule, pwd) for rule, pwd, failed in verdicts if rule not in failed]
+            if missed:
+                self.helper.take_screenshot("InvalidPasswordNotFlagged")
+                pytest.fail(f"❌ Validator did not flag {len(missed)} invalid password(s): {missed}", pytrace=False)
+            log.info("✅ Validator flagged all %d invalid passwords (%d rules)",
+                     len(verdicts), len({rule for rule, _ in invalid_passwords}))
+
+            submitted: dict[str, int] = {}
+            for rule, bad_pwd in invalid_passwords:
+                if submitted.get(rule, 0) < save_samples:
+                    submitted[rule] = submitted.get(rule, 0) + 1
+                    self.save_is_rejected(rule, bad_pwd)
+            return
 
-            self.page.wait_for_timeout(1000)
+        for rule, bad_pwd in invalid_passwords:
+            self.save_is_rejected(rule, bad_pwd)
+            self.helper.wait_until_settled("next invalid password", legacy_ms=1000)
 
-    @staticmethod
-    def _rule_satisfied(rule: str, password: str) -> bool:
-        """
-        Checks if a password satisfies a single rule.
-        """
-        r_lower = rule.lower()
-        if "number" in r_lower:
-            return any(c.isdigit() for c in password)
-        if "uppercase" in r_lower:
-            return any(c.isupper() for c in password)
-        if "alphabet" in r_lower:
-            return any(c.islower() for c in password)
-        if "special" in r_lower:
-            return any(c in "!@#$%^&*" for c in password)
-        if "at least" in r_lower:
-            min_len = int(''.join(filter(str.isdigit, rule)))
-            return len(password) >= min_len
-        if "less than" in r_lower:
-            max_len = int(''.join(filter(str.isdigit, rule))) - 1
-            return len(password) <= max_len
-        return True
 
 class VerifyUserInEmployeesLookup:
 
     # Centralized locators
     MENU_EMPLOYEE_LOOKUP = "//span[normalize-space()='Employee Lookup']"
     TABLE_FIRST_ROW = "//table//tbody/tr[1]"
+    # Employee record fields by column (1-based, as td:nth-child)
+    RECORD_COLUMNS = {
+        3: "ID", 4: "Employee No", 5: "Employee Name", 6: "Login ID", 7: "Email ID", 8: "Department",
+        9: "Created By", 10: "Created Date", 11: "Updated By", 12: "Updated Date",
+    }
 
     def __init__(self, page: Page, helper: BaseHelper):
         self.page = page
@@ -947,53 +1006,58 @@ class VerifyUserInEmployeesLookup:
 
     # Verify latest employee record
     def verify_latest_employee_record(self, expected_data: dict):
-        print("🧭 Fetching latest employee record from lookup table...")
-
-        # Wait until the first row is visible
-        self.page.wait_for_selector(self.TABLE_FIRST_ROW)
-        latest_row = self.page.locator(self.TABLE_FIRST_ROW)
-
-        # Extract all useful details (adjust td index if table structure differs)
-        actual_data = {
-            "ID": latest_row.locator("td:nth-child(3)").inner_text().strip(),
-            "Employee No": latest_row.locator("td:nth-child(4)").inner_text().strip(),
-            "Employee Name": latest_row.locator("td:nth-child(5)").inner_text().strip(),
-            "Login ID": latest_row.locator("td:nth-child(6)").inner_text().strip(),
-            "Email ID": latest_row.locator("td:nth-child(7)").inner_text().strip(),
-            "Department": latest_row.locator("td:nth-child(8)").inner_text().strip(),
-            "Created By": latest_row.locator("td:nth-child(9)").inner_text().strip(),
-            "Created Date": latest_row.locator("td:nth-child(10)").inner_text().strip(),
-            "Updated By": latest_row.locator("td:nth-child(11)").inner_text().strip(),
-            "Updated Date": latest_row.locator("td:nth-child(12)").inner_text().strip(),
-        }
+        log.info("🧭 Fetching latest employee record from lookup table...")
+
+        # The user's own row: with parallel workers adding users, the first row may be someone else's
+        row = self.page.locator(self.TABLE_FIRST_ROW)
+        login_id = expected_data.get("Login ID")
+        if login_id:
+            row = self.page.locator("table tbody tr").filter(
+                has=self.page.locator("td").filter(has_text=re.compile(rf"^\s*{re.escape(login_id)}\s*$"))
+            ).first
+        row.wait_for(state="visible")
+
+        # Extract all useful details in one read (adjust column index if table structure differs)
+        actual_data = self.helper.read_row(
+            row,
+            header_map=self.RECORD_COLUMNS,
+            columns=list(self.RECORD_COLUMNS.values()),
+            description="latest employee record",
+        )
 
-        # Print the complete record
-        print("\n🧾 Employee Record (Full Details):")
-        for key, value in actual_data.items():
-            print(f"   {key}: {value}")
+        log.debug("🧾 Employee Record (Full Details): %s", actual_data)
 
         # Compare only required fields
-        print("\n📊 Comparing Employee Record Details:")
         for key, expected_value in expected_data.items():
             actual_value = actual_data.get(key)
             if actual_value != expected_value:
                 self.helper.take_screenshot(prefix=f"Mismatch_{key}")
-                print(f"❌ {key}: Expected '{expected_value}', Got '{actual_value}'")
+                log.error("❌ %s: Expected '%s', Got '%s'", key, expected_value, actual_value)
                 raise AssertionError(
                     f"Mismatch in '{key}': expected '{expected_value}', got '{actual_value}'"
                 )
-            else:
-                print(f"✅ {key} matches: '{actual_value}'")
+            log.debug("✅ %s matches: '%s'", key, actual_value)
 
-        print("\n🎯 All employee details correctly reflected in Employee Lookup table.")
+        log.info("🎯 All employee details correctly reflected in Employee Lookup table.")
 
 class ImportUserFromExcel:
+    # Import sheet column -> formcontrolname of the user details form
+    FORM_CONTROLS = {
+        "Name": "name",
+        "Login ID": "loginId",
+        "Email": "email",
+        "Role": "role",
+        "WhatsApp Number": "whatsappNo",
+        "Employee Number": "empNo",
+        "Department": "department",
+    }
 
     def __init__(self, page: Page, helper: BaseHelper):
         self.page = page
         self.helper = helper
         self.locators = Admin_Add_User_Locators(page)
         self.common = Common_Locators(page)
+        self.admin_nav = AdminNavigationAndAddUser(page, helper)
 
     # To Import the users
     def click_import(self):
@@ -1010,16 +1074,16 @@ class ImportUserFromExcel:
         Handles SweetAlert2 (swal2) info dialogs, toast messages, and ensures proper assertions.
         Checks toast message first, then validates Import Summary popup if it appears.
         """
+        mark = self.helper.toasts.mark()
         self.helper.click(self.locators.btn_upload, "Upload button")
 
         # --- Step 1: Check for Toast message first ---
-        # --- Step 1: Check for Toast message first ---
-        toast = self.page.locator("#toast-container div, #toast-container span").first
-
         try:
-            toast.wait_for(state="visible", timeout=8000)
-            message = " ".join(toast.inner_text().strip().split())
-            print(f"💬 Toast detected after upload: '{message}'")
+            toast = self.helper.toasts.wait_for(mark, timeout=8000)
+            if toast is None:
+                raise PlaywrightTimeoutError("No toast within 8000 ms")
+            message = toast.text
+            log.info("💬 Toast detected after upload: '%s'", message)
 
             # --- Handle toast types ---
             if re.search(r"(error|failed|invalid)", message, re.IGNORECASE):
@@ -1031,7 +1095,7 @@ class ImportUserFromExcel:
                 pytest.fail(f"⚠️ Duplicate data found: {message}. Screenshot: {screenshot_path}", pytrace=False)
 
             elif re.search(r"success|imported\s*\d+\s*users?", message, re.IGNORECASE):
-                print(f"✅ Upload successful based on toast: {message}")
+                log.info("✅ Upload successful based on toast: %s", message)
                 # ✅ No screenshot needed for success
 
             else:
@@ -1040,10 +1104,10 @@ class ImportUserFromExcel:
 
         except PlaywrightTimeoutError:
             # ✅ No toast appeared — treat as success without further checks
-            print("ℹ️ No toast appeared after clicking Upload.")
+            log.info("ℹ️ No toast appeared after clicking Upload.")
 
         except Exception as e:
-            print(f"⚠️ Unexpected error while handling upload toast: {e}")
+            log.warning("⚠️ Unexpected error while handling upload toast: %s", e)
             screenshot_path = self.helper.take_screenshot("UnexpectedUploadToastError")
             pytest.fail(f"⚠️ Unexpected error during toast validation: {e}. Screenshot: {screenshot_path}",
                         pytrace=False)
@@ -1054,18 +1118,18 @@ class ImportUserFromExcel:
 
         try:
             popup.wait_for(state="visible", timeout=5000)
-            print("✅ SweetAlert2 Import Summary popup appeared.")
+            log.info("✅ SweetAlert2 Import Summary popup appeared.")
 
             raw_html = popup_html_container.inner_html().strip()
             clean_text = re.sub(r"<[^>]+>", "", raw_html)
             clean_text = " ".join(clean_text.split())
-            print(f"ℹ️ Popup text detected: {clean_text}")
+            log.debug("ℹ️ Popup text detected: %s", clean_text)
 
             screenshot_path = self.helper.take_screenshot("ImportSummaryPopup")
 
             # --- Validate Import Summary ---
             if re.search(r"import\s+summary", clean_text, re.IGNORECASE):
-                print(f"✅ Import Summary detected: {clean_text}")
+                log.info("✅ Import Summary detected: %s", clean_text)
 
                 if re.search(r"found\s+\d+\s+existing\s+user", clean_text, re.IGNORECASE):
                     pytest.fail(
@@ -1074,7 +1138,7 @@ class ImportUserFromExcel:
                         pytrace=False
                     )
                 else:
-                    print("🎉 Import Summary confirmed without existing users.")
+                    log.info("🎉 Import Summary confirmed without existing users.")
             else:
                 pytest.fail(
                     f"⚠️ Unexpected popup content: {clean_text}. Screenshot: {screenshot_path}",
@@ -1084,106 +1148,67 @@ class ImportUserFromExcel:
 
 
         except PlaywrightTimeoutError:
-            print("ℹ️ No 'Import Summary' popup detected — continuing...")
+            log.info("ℹ️ No 'Import Summary' popup detected — continuing...")
 
         except Exception as e:
-            print(f"⚠️ Error while handling 'Import Summary' popup: {e}")
+            log.warning("⚠️ Error while handling 'Import Summary' popup: %s", e)
             self.helper.take_screenshot("PopupHandlingError")
 
     def verify_imported_users_from_excel(self, excel_path: str):
         """
         Verifies each imported user's details from Excel against the data in the application.
-        Uses existing locators for field validation (name, email, login ID, etc.)
+        Rows are streamed (ImportedUserReader), so the first user is checked before the
+        last row of a large file is read.
         """
         try:
-            df = pd.read_excel(excel_path)
-            print(f"📄 Loaded {len(df)} users from Excel for verification.\n")
+            users = ImportedUserReader(excel_path)
+            log.info("📄 Verifying users from %s as they are read.", excel_path)
 
-            for index, row in df.iterrows():
-                name = str(row["Name"]).strip()
-                login_id = str(row["Login ID"]).strip()
-                email = str(row["Email"]).strip()
-                role = str(row["Role"]).strip()
-                whatsapp = str(row["WhatsApp Number"]).strip()
-                emp_no = str(row["Employee Number"]).strip()
-                dept = str(row["Department"]).strip()
+            for user in users:
+                name, login_id = user.name, user.login_id
 
-                print(f"🔍 Verifying imported user: {name}")
+                start = time.perf_counter()
+                log.debug("🔍 Verifying imported user: %s", name)
 
                 # Step 1️⃣: Search user
-                search_box = self.page.locator('//input[@id="search-user-grid-records"]')
-                search_box.wait_for(state="visible", timeout=5000)
-                search_box.fill(name)
-                self.page.keyboard.press("Enter")
-                self.page.wait_for_timeout(2000)
+                rows = self.admin_nav.search_user(name)
+                if rows and not any(r.get("loginId") == login_id for r in rows):
+                    screenshot = self.helper.take_screenshot(f"ImportedUserNotFound_{login_id}")
+                    raise AssertionError(f"❌ Imported user '{login_id}' not returned by the user search. "
+                                         f"Screenshot: {screenshot}")
 
                 # Step 2️⃣: Open user record
                 user_card = self.page.locator(f'//p[normalize-space()="{name}"]')
                 expect(user_card).to_be_visible(timeout=5000)
                 user_card.click()
-                self.page.wait_for_timeout(2000)
-
-                # Step 3️⃣: Validate form fields
-                field_map = {
-                    "Name": self.locators.txt_name,
-                    "Login ID": self.locators.txt_login_id,
-                    "Email": self.locators.txt_email,
-                    "Role": self.locators.verify_role,
-                    "WhatsApp Number": self.locators.whatsapp_input,
-                    "Employee Number": self.locators.txt_employee_number,
-                    "Department": self.locators.txt_department,
-                }
-
-                expected_values = {
-                    "Name": name,
-                    "Login ID": login_id,
-                    "Email": email,
-                    "Role": role,
-                    "WhatsApp Number": whatsapp,
-                    "Employee Number": emp_no,
-                    "Department": dept,
-                }
-
-                for label, locator in field_map.items():
-                    try:
-                        locator.wait_for(state="visible", timeout=5000)
-
-                        # Try to get value intelligently
-                        tag_name = locator.evaluate("el => el.tagName.toLowerCase()")
-                        actual_value = ""
-
-                        if tag_name == "input" or tag_name == "textarea":
-                            actual_value = locator.input_value().strip()
-                        else:
-                            # For ng-select, span, div, or any wrapper element
-                            try:
-                                actual_value = locator.inner_text().strip()
-                            except Exception:
-                                actual_value = locator.text_content().strip()
-
-                        expected_value = expected_values[label]
-                        if actual_value != expected_value:
-                            screenshot = self.helper.take_screenshot(f"Mismatch_{login_id}_{label}")
-                            raise AssertionError(
-                                f"❌ {label} mismatch for {login_id}: "
-                                f"Expected '{expected_value}', Found '{actual_value}'. Screenshot: {screenshot}"
-                            )
-
-                        print(f"✅ {label} matches: {actual_value}")
-
-                    except Exception as e:
-                        screenshot = self.helper.take_screenshot(f"VerifyFieldError_{login_id}_{label}")
-                        raise AssertionError(f"❌ Error verifying {label} for {login_id}: {e}. Screenshot: {screenshot}")
-
-                print(f"🎯 Verification completed for '{name}'\n")
+
+                # Step 3️⃣: Validate form fields (Excel column -> formcontrolname), read in one call
+                expected_values = user.by_column()
+
+                expect(self.locators.txt_name).to_have_value(name, timeout=5000)  # details loaded
+                form_values = self.helper.read_form(self.locators.user_form, f"user details of '{name}'")
+
+                for label, control_name in self.FORM_CONTROLS.items():
+                    actual_value = form_values.get(control_name, "")
+                    expected_value = expected_values[label]
+                    if actual_value != expected_value:
+                        screenshot = self.helper.take_screenshot(f"Mismatch_{login_id}_{label}")
+                        raise AssertionError(
+                            f"❌ {label} mismatch for {login_id}: "
+                            f"Expected '{expected_value}', Found '{actual_value}'. Screenshot: {screenshot}"
+                        )
+
+                    log.debug("✅ %s matches: %s", label, actual_value)
+
+                log.info("🎯 Verification completed for '%s'", name, extra=step_fields("verify_imported_user", start))
 
                 # Step 4️⃣: Go back to list
                 back_button = self.page.locator("//a[@aria-label='Close']")
                 if back_button.is_visible():
                     back_button.click()
-                    self.page.wait_for_timeout(1500)
+                    self.helper.wait_until_settled("user details closed", legacy_ms=1500)
 
-            print("✅ All imported users verified successfully!")
+            log.info("✅ All %d imported users verified successfully!", users.rows_read)
 
         except Exception as e:
             screenshot_path = self.helper.take_screenshot("VerifyImportedUsersFailed")
@@ -1208,7 +1233,7 @@ class NewUserLoginVerification:
         self.button_login_xpath = "//button[contains(.,'Login')]"
 
     def verify_new_user_login(self, client_id: str, login_id: str, password: str, username: str):
-        print(f"\n🔐 Verifying login for new user: {username}")
+        log.info("🔐 Verifying login for new user: %s", username)
 
         # Navigate to login page
         self.page.goto(self.login_url)
@@ -1221,14 +1246,14 @@ class NewUserLoginVerification:
         # Click login
         self.helper.click(self.button_login_xpath, "Login button")
         self.page.wait_for_load_state("networkidle")
-        self.page.wait_for_timeout(5000)
+        self.helper.wait_until_settled("login of the new user", legacy_ms=5000)
 
         # Validate login success
         try:
             expected_fragment = "/dashboard"
             if expected_fragment.lower() not in self.page.url.lower():
                 raise AssertionError(f"Current URL: {self.page.url}")
-            print(f"✅ Login successful for user: {username}")
+            log.info("✅ Login successful for user: %s", username)
 
         except Exception as e:
             self.helper.take_screenshot(f"LoginFailed_{username}")
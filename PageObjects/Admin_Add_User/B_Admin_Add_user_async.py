@@ -0,0 +1,296 @@
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError, expect
+from Utilities.AsyncBaseHelpers import AsyncBaseHelper
+from Utilities.FrameworkLogger import get_logger, step_fields
+from Utilities.ImportedUsers import ImportedUser, ImportedUserReader
+from Locators.Locators_Admin_Add_User import Admin_Add_User_Locators
+from Locators.Locators_Common import Common_Locators
+from PageObjects.Admin_Add_User.B_Admin_Add_user import (
+    AdminNavigationAndAddUser,
+    ImportUserFromExcel,
+    VerifyUserInEmployeesLookup,
+)
+import re
+import pytest
+import time
+
+log = get_logger("admin_add_user_async")
+
+
+# ---------------------------------------------------------------
+# Async editions of the Admin Add User page objects.
+# They mirror the sync classes in B_Admin_Add_user.py step for step, so a flow can be
+# moved between the two APIs without changing its logic. Locator classes are shared:
+# building a locator never touches the browser, in either API.
+#
+# The edition is partial: it covers what concurrent async flows verify (navigation and
+# the form, the user grid, Employee Lookup, imported users). PasswordGenerationAndValidation,
+# InvalidPasswordTests, NewUserLoginVerification and the duplicate-user and enable-toggle steps of
+# UserVerificationAndDuplicateEmpNOLoginChecks exist in the sync API only.
+# ---------------------------------------------------------------
+
+
+class AsyncAdminNavigationAndAddUser:
+    def __init__(self, page: Page, helper: AsyncBaseHelper):
+        self.page = page
+        self.helper = helper
+        self.locators = Admin_Add_User_Locators(page)
+        self.common = Common_Locators(page)
+
+    # Test data generators are plain Python — reuse the sync ones
+    random_string = staticmethod(AdminNavigationAndAddUser.random_string)
+    random_email = staticmethod(AdminNavigationAndAddUser.random_email)
+    random_login_id = staticmethod(AdminNavigationAndAddUser.random_login_id)
+    random_employee_number = staticmethod(AdminNavigationAndAddUser.random_employee_number)
+
+    # Navigate to Admin Page
+    async def go_to_admin(self):
+        await self.helper.click(self.common.side_nav_admin, "Admin-side navigation link")
+
+    # Click Add User button to add a new user
+    async def click_add_user(self):
+        await self.helper.click(self.locators.btn_add_user, "Add User button in the Admin page")
+
+    async def enter_name(self, name=None):
+        if not name:
+            name = f"User_{self.random_string(5)}"
+        await self.helper.enter_text(self.locators.txt_name, name, "Name textbox")
+        return name
+
+    async def enter_department(self, dept):
+        await self.helper.enter_text(self.locators.txt_department, dept, "Department textbox")
+
+    async def enter_email(self, email=None):
+        if not email:
+            email = self.random_email()
+
+        if not re.match(AdminNavigationAndAddUser.EMAIL_PATTERN, email):
+            log.error("❌ Invalid email format: '%s'", email)
+            pytest.fail(f"Invalid Email Format: {email}", pytrace=False)
+
+        await self.helper.enter_text(self.locators.txt_email, email, "Email textbox")
+
+    async def enter_login_id(self, login_id=None):
+        if not login_id:
+            login_id = self.random_login_id()
+        await self.helper.enter_text(self.locators.txt_login_id, login_id, "Login ID textbox")
+        return login_id
+
+    async def enter_employee_number(self, emp_no=None):
+        if not emp_no:
+            emp_no = self.random_employee_number()
+        await self.helper.enter_text(self.locators.txt_employee_number, emp_no, "Employee Number textbox")
+        return emp_no
+
+    async def select_role(self, roles):
+        if isinstance(roles, str):
+            roles = [roles]
+
+        for role in roles:
+            await self.helper.click(self.locators.dropdown_role, "Roles dropdown")
+            role_option = self.page.locator(
+                f"//span[contains(@class,'ng-option-label') and normalize-space(text())='{role}']"
+            )
+            try:
+                await role_option.first.wait_for(state="visible", timeout=5000)
+                await role_option.first.click()
+                log.info("✅ Selected role: '%s'", role)
+            except Exception as e:
+                await self.helper.take_screenshot(prefix=f"ErrorSelecting_{role}")
+                pytest.fail(f"❌ Failed to select role '{role}': {e}")
+
+    async def select_country_code(self, country_code):
+        await self.helper.click(self.locators.country_code_dropdown, f"Country code dropdown ({country_code})")
+
+        dropdown_panel = self.page.locator(self.locators.country_code_panel)
+        await dropdown_panel.wait_for(state="visible", timeout=10000)
+
+        option = dropdown_panel.locator(f"div.ng-option >> text='{country_code}'")
+        await option.wait_for(state="visible", timeout=5000)
+        await option.click()
+        log.info("✅ Clicked: Country code dropdown, selected: %s", country_code)
+
+    async def enter_whatsapp_number(self, whatsapp_no="9876543210"):
+        await self.helper.enter_text(self.locators.whatsapp_input, whatsapp_no, "WhatsApp number input")
+
+    # To Search User in Admin Page (see AdminNavigationAndAddUser.search_user)
+    async def search_user(self, username: str, timeout: int = 5000) -> list[dict]:
+        start = time.perf_counter()
+        try:
+            log.info("🔍  Searching for user '%s'...", username)
+            await self.locators.search_box.wait_for(state="visible", timeout=timeout)
+            await self.locators.search_box.fill("")
+            await self.locators.search_box.fill(username)
+            pattern = AdminNavigationAndAddUser.SEARCH_RESPONSE_PATTERN
+            response_timeout = max(timeout, AdminNavigationAndAddUser.SEARCH_RESPONSE_TIMEOUT)
+            rows = []
+            if pattern:
+                async with self.page.expect_response(
+                        lambda r: AdminNavigationAndAddUser.is_search_response(r, username),
+                        timeout=response_timeout) as response_info:
+                    await self.page.keyboard.press("Enter")
+                try:
+                    rows = AdminNavigationAndAddUser.search_rows(await (await response_info.value).json())
+                except ValueError:
+                    pass
+            else:
+                await self.page.keyboard.press("Enter")
+            await self.page.wait_for_function(AdminNavigationAndAddUser.GRID_SHOWS_NAME_JS, arg=username,
+                                              timeout=timeout if pattern else response_timeout)
+            log.info("✅ User '%s' search completed — %d result(s).", username, len(rows),
+                     extra=step_fields("search_user", start))
+            return rows
+        except Exception as e:
+            await self.helper.take_screenshot(f"SearchUserFailed_{username}")
+            error_msg = f"❌ Failed to search user '{username}': {e}"
+            log.error(error_msg, extra=step_fields("search_user", start))
+            raise AssertionError(error_msg)
+
+    async def click_user_in_All_Users_page(self, username: str, description: str = "'All Users list'",
+                                           timeout: int = 10000):
+        try:
+            user_locator = self.page.locator(
+                f'//div[contains(@class,"admin-grid-item")]//p[normalize-space(text())="{username}"]'
+            )
+            await user_locator.wait_for(state="visible", timeout=timeout)
+            await user_locator.click()
+            log.info("✅ Clicked on user '%s' in %s.", username, description)
+        except Exception as e:
+            await self.helper.take_screenshot(f"ClickUserFailed_{username}")
+            error_msg = f"❌ Failed to click user '{username}' in {description}: {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+    async def click_All_Users_radio(self):
+        await self.locators.radio_btn_all_users.click(force=True)
+
+    async def click_Active_Users_radio_(self):
+        await self.locators.radio_btn_active_users.click(force=True)
+
+
+class AsyncUserVerification:
+
+    def __init__(self, page: Page, helper: AsyncBaseHelper, admin_nav: AsyncAdminNavigationAndAddUser):
+        self.page = page
+        self.helper = helper
+        self.locators = Admin_Add_User_Locators(page)
+        self.admin_nav = admin_nav
+
+    async def verify_user_in_all_users(self, username):
+        user_row = self.page.locator(
+            f"//div[contains(@class, 'admin-grid-item')]//p[normalize-space()='{username}']"
+        )
+        try:
+            await user_row.wait_for(state="visible", timeout=5000)
+            log.info("✅ User '%s' found in All Users Page.", username)
+        except PlaywrightTimeoutError:
+            await self.helper.take_screenshot(f"UserNotFound_{username}")
+            error_msg = f"❌ User '{username}' not found in All Users list."
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+    async def verify_user_status_toggle(self, username: str, timeout: int = 10000):
+        """Returns 'Active' or 'Disabled' for the user's status toggle."""
+        try:
+            toggle_locator = self.page.locator(
+                f'//p[normalize-space()="{username}"]/ancestor::div[contains(@class,"admin-grid-item")]'
+                f'//input[@aria-label="User Status"]'
+            )
+            await toggle_locator.wait_for(state="attached", timeout=timeout)
+            return "Active" if await toggle_locator.is_checked() else "Disabled"
+        except Exception as e:
+            await self.helper.take_screenshot(f"ToggleCheckFailed_{username}")
+            error_msg = f"❌ Test failed — Unable to verify toggle for '{username}': {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+
+class AsyncVerifyUserInEmployeesLookup:
+
+    TABLE_FIRST_ROW = VerifyUserInEmployeesLookup.TABLE_FIRST_ROW
+    RECORD_COLUMNS = VerifyUserInEmployeesLookup.RECORD_COLUMNS
+
+    def __init__(self, page: Page, helper: AsyncBaseHelper):
+        self.page = page
+        self.helper = helper
+        self.locators = Admin_Add_User_Locators(page)
+        self.common = Common_Locators(page)
+
+    async def go_to_lookup(self):
+        await self.helper.click(self.common.side_nav_lookup, "Lookup-side navigation link")
+
+    async def employees_lookup(self):
+        await self.helper.click(self.locators.click_employees_lookup, "Employees Lookup")
+
+    async def verify_latest_employee_record(self, expected_data: dict):
+        # The user's own row: with other flows and workers adding users, the first row may be someone else's
+        row = self.page.locator(self.TABLE_FIRST_ROW)
+        login_id = expected_data.get("Login ID")
+        if login_id:
+            row = self.page.locator("table tbody tr").filter(
+                has=self.page.locator("td").filter(has_text=re.compile(rf"^\s*{re.escape(login_id)}\s*$"))
+            ).first
+        await row.wait_for(state="visible")
+
+        actual_data = await self.helper.read_row(
+            row,
+            header_map=self.RECORD_COLUMNS,
+            columns=list(self.RECORD_COLUMNS.values()),
+            description="latest employee record",
+        )
+
+        for key, expected_value in expected_data.items():
+            actual_value = actual_data.get(key)
+            if actual_value != expected_value:
+                await self.helper.take_screenshot(prefix=f"Mismatch_{key}")
+                raise AssertionError(
+                    f"Mismatch in '{key}': expected '{expected_value}', got '{actual_value}'"
+                )
+            log.debug("✅ %s matches: '%s'", key, actual_value)
+
+
+class AsyncImportUserFromExcel:
+
+    def __init__(self, page: Page, helper: AsyncBaseHelper):
+        self.page = page
+        self.helper = helper
+        self.locators = Admin_Add_User_Locators(page)
+
+    @staticmethod
+    def load_users(excel_path: str) -> ImportedUserReader:
+        """Users of the import sheet, read lazily row by row (iterate it, or list() it)."""
+        return ImportedUserReader(excel_path)
+
+    async def verify_imported_user(self, user: ImportedUser):
+        """
+        Verify one imported user's form against its Excel row.
+        Runs on its own page, so several users can be checked concurrently.
+        """
+        name, login_id = user.name, user.login_id
+        expected_values = user.by_column()
+        start = time.perf_counter()
+        log.debug("🔍 Verifying imported user: %s", name)
+
+        rows = await AsyncAdminNavigationAndAddUser(self.page, self.helper).search_user(name)
+        if rows and not any(r.get("loginId") == login_id for r in rows):
+            screenshot = await self.helper.take_screenshot(f"ImportedUserNotFound_{login_id}")
+            raise AssertionError(f"❌ Imported user '{login_id}' not returned by the user search. "
+                                 f"Screenshot: {screenshot}")
+
+        user_card = self.page.locator(f'//p[normalize-space()="{name}"]')
+        await expect(user_card).to_be_visible(timeout=5000)
+        await user_card.click()
+
+        await expect(self.locators.txt_name).to_have_value(name, timeout=5000)  # details loaded
+        form_values = await self.helper.read_form(self.locators.user_form, f"user details of '{name}'")
+
+        for label, control_name in ImportUserFromExcel.FORM_CONTROLS.items():
+            actual_value = form_values.get(control_name, "")
+            if actual_value != expected_values[label]:
+                screenshot = await self.helper.take_screenshot(f"Mismatch_{login_id}_{label}")
+                raise AssertionError(
+                    f"❌ {label} mismatch for {login_id}: "
+                    f"Expected '{expected_values[label]}', Found '{actual_value}'. Screenshot: {screenshot}"
+                )
+
+        log.info("🎯 Verification completed for '%s'", name, extra=step_fields("verify_imported_user", start))
+        return name
@@ -10,167 +10,164 @@ from PageObjects.Admin_Add_User.B_Admin_Add_user import (
 )
 from Utilities.BaseHelpers import BaseHelper
 from Utilities.ReadProperties import ReadConfig
+from Utilities.SharedTestData import CreatedUser
 
 
 
 
 class Test_01AdminAddUserPositiveCases:
-    """✅ Admin Add User Positive Test Suite"""
-    created_username = None       # for first user (active)
-    created_password = None
-    created_emp_no = None
-    created_login_id = None
-    disabled_username = None      # for second user (disabled)
+    """✅ Admin Add User Positive Test Suite
+
+    Users created here are handed to later tests through the `shared_data` store
+    (not class attributes), so the dependent tests can run on any xdist worker.
+    """
 
 
     @pytest.mark.order(1)
-    def test_TC01_add_user_with_active_status(self,page, login):
+    @pytest.mark.produces("active_user")
+    def test_TC01_add_user_with_active_status(self,page, login, shared_data):
         page = login
         helper = BaseHelper(page)
         admin_nav = AdminNavigationAndAddUser(page, helper)
         user_verif = UserVerificationAndDuplicateEmpNOLoginChecks(page, helper, admin_nav)
-        password_util = PasswordGenerationAndValidation(page, helper)
 
         print("\n🚀 Starting Test: Add User with Active Status")
 
         # Navigate to Admin
         admin_nav.go_to_admin()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("Admin page", legacy_ms=1000)
         helper.verify_page_url("/user-role-permission", "Admin")
 
         # Add user
         admin_nav.click_add_user()
-        page.wait_for_timeout(1000)
-
-        username = admin_nav.enter_name()
-        admin_nav.enter_department("QA")
-        admin_nav.enter_email("dinesh123@yopmail.com")
-
-        # Capture the randomly generated Login ID
-        login_id = admin_nav.enter_login_id()
-
-        old_password = password_util.enter_password()
-        emp_no = admin_nav.enter_employee_number()
-        admin_nav.select_role(["User", "Admin"])
-        admin_nav.select_country_code("+91")
-        admin_nav.enter_whatsapp_number(whatsapp_no="9988776655")
-        admin_nav.enable_send_welcome_mail()
-        page.wait_for_timeout(500)
+        helper.wait_until_settled("Add User form", legacy_ms=1000)
+
+        # Name, Login ID, Employee No and password are generated; typed field by field,
+        # so this test covers real input into the form (the others set it up in bulk)
+        user = admin_nav.fill_user_form({
+            "department": "QA",
+            "email": "dinesh123@yopmail.com",
+            "role": ["User", "Admin"],
+            "countryCode": "+91",
+            "whatsappNo": "9988776655",
+            "sendMail": True,
+        }, typed=True)
+        username, login_id, emp_no, old_password = user["name"], user["loginId"], user["empNo"], user["password"]
 
         # Save
         admin_nav.click_save()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Save", legacy_ms=2000)
         print(f"✅ User '{username}' added successfully with Active status")
 
-        # Store user details for next test
-        Test_01AdminAddUserPositiveCases.created_username = username
-        Test_01AdminAddUserPositiveCases.created_password = old_password
-        Test_01AdminAddUserPositiveCases.created_emp_no = emp_no
-        Test_01AdminAddUserPositiveCases.created_login_id = login_id   # 👈 store login ID
-
         # Verify in All Users
         admin_nav.click_All_Users_radio()
-        page.wait_for_timeout(1500)
+        helper.wait_until_settled("All Users list", legacy_ms=1500)
         admin_nav.search_user(username, timeout=1000)
         user_verif.verify_user_in_all_users(username)
         user_verif.verify_user_status_toggle(username)
 
+        # Publish user details for the dependent tests (only once the user is verified)
+        shared_data.publish("active_user", CreatedUser(
+            username=username,
+            login_id=login_id,
+            emp_no=emp_no,
+            password=old_password,
+            email="dinesh123@yopmail.com",
+            department="QA",
+        ))
+
 
     @pytest.mark.order(2)
-    def test_TC02_verify_user_in_employee_lookup(self,page, login):
+    def test_TC02_verify_user_in_employee_lookup(self,page, login, seeded_user):
 
         page = login
         helper = BaseHelper(page)
         emp_lookup_verif = VerifyUserInEmployeesLookup(page, helper)
 
-        username = Test_01AdminAddUserPositiveCases.created_username
-        emp_no = Test_01AdminAddUserPositiveCases.created_emp_no
-        login_id = Test_01AdminAddUserPositiveCases.created_login_id  # 👈 fetch stored login ID
-
-        if not username or not emp_no or not login_id:
+        user = seeded_user
+        if not user:
             pytest.skip("⚠ No created user details from previous test — skipping lookup verification.")
+        username = user.username
 
         expected_data = {
-            "Employee No": emp_no,
-            "Employee Name": username,
-            "Login ID": login_id,       # 👈 updated
-            "Email ID": "dinesh123@yopmail.com",
-            "Department": "QA"
+            "Employee No": user.emp_no,
+            "Employee Name": user.username,
+            "Login ID": user.login_id,
+            "Email ID": user.email,
+            "Department": user.department
         }
 
         print(f"\n🔍 Verifying Employee Lookup entry for user: {username}")
 
         # Step 1️⃣ - Navigate to Lookup section
         emp_lookup_verif.go_to_lookup()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("Lookup page", legacy_ms=1000)
 
         # Step 2️⃣ - Click Employees Lookup tab
         emp_lookup_verif.employees_lookup()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Employees lookup", legacy_ms=2000)
 
         # Step 3️⃣ - Verify the latest employee record
         emp_lookup_verif.verify_latest_employee_record(expected_data)
 
 
     @pytest.mark.order(3)
-    def test_TC03_reset_password_of_created_user(self, login,page):
+    def test_TC03_reset_password_of_created_user(self, login,page, seeded_user):
 
         page = login
         helper = BaseHelper(page)
         admin_nav = AdminNavigationAndAddUser(page, helper)
         password_util = PasswordGenerationAndValidation(page, helper)
 
-        username = Test_01AdminAddUserPositiveCases.created_username
-        old_password = Test_01AdminAddUserPositiveCases.created_password
-        if not username or not old_password:
+        user = seeded_user
+        if not user or not user.password:
             pytest.skip("⚠ No user found from previous test — skipping password reset.")
+        username, old_password = user.username, user.password
 
         print("\n🚀 Resetting password for created user")
 
         admin_nav.go_to_admin()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("Admin page", legacy_ms=1000)
         admin_nav.click_All_Users_radio()
         admin_nav.search_user(username, timeout=2000)
         admin_nav.click_user_in_All_Users_page(username)
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("user details", legacy_ms=2000)
 
         password_util.reset_password_with_policy_check(old_password)
 
 
-    def test_TC04_add_user_with_disabled_status(self, login, page):
+    @pytest.mark.produces("disabled_user")
+    def test_TC04_add_user_with_disabled_status(self, login, page, shared_data):
         page = login
         helper = BaseHelper(page)
         admin_nav = AdminNavigationAndAddUser(page, helper)
         user_verif = UserVerificationAndDuplicateEmpNOLoginChecks(page, helper, admin_nav)
-        password_util = PasswordGenerationAndValidation(page, helper)
 
         print("\n🚀 Starting Test: Add User with Disabled Status")
         # page.reload()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("page", legacy_ms=1000)
 
         # Navigate and add user
         admin_nav.go_to_admin()
         helper.verify_page_url("/user-role-permission", "Admin")
         admin_nav.click_add_user()
-        page.wait_for_timeout(2000)
-
-        username = admin_nav.enter_name()
-        admin_nav.enter_department("QA")
-        admin_nav.enter_email("dinesh123@yopmail.com")
-        admin_nav.enter_login_id()
-        password_util.enter_password()
-        admin_nav.enter_employee_number()
-        admin_nav.select_role(["User"])
-        admin_nav.select_country_code("+91")
-        admin_nav.enter_whatsapp_number(whatsapp_no="9988776655")
-
-        # Disable status and enable welcome mail
-        admin_nav.disable_user_status_toggle()
-        admin_nav.enable_send_welcome_mail()
+        helper.wait_until_settled("Add User form", legacy_ms=2000)
+
+        # Disabled status, welcome mail on
+        user = admin_nav.fill_user_form({
+            "department": "QA",
+            "email": "dinesh123@yopmail.com",
+            "role": ["User"],
+            "countryCode": "+91",
+            "whatsappNo": "9988776655",
+            "status": False,
+            "sendMail": True,
+        })
+        username, login_id, emp_no, password = user["name"], user["loginId"], user["empNo"], user["password"]
 
         # Save
         admin_nav.click_save()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Save", legacy_ms=2000)
         print(f"✅ User '{username}' added successfully with Disabled status")
 
         # Verify
@@ -189,8 +186,15 @@ class Test_01AdminAddUserPositiveCases:
         user_verif.verify_user_in_Active_List(username)
         print(f"🎯 Verified '{username}' now appears in Active Users page\n")
 
-        # Store for next test
-        Test_01AdminAddUserPositiveCases.disabled_username = username
+        # Publish for other tests
+        shared_data.publish("disabled_user", CreatedUser(
+            username=username,
+            login_id=login_id,
+            emp_no=emp_no,
+            password=password,
+            email="dinesh123@yopmail.com",
+            department="QA",
+        ))
 
 
     def test_TC05_verify_imported_users(self,login, page):
@@ -205,31 +209,30 @@ class Test_01AdminAddUserPositiveCases:
 
         # --- Step 1️⃣: Navigate to Admin page ---
         admin_nav.go_to_admin()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Admin page", legacy_ms=2000)
 
         # --- Step 2️⃣: Start Import ---
         import_user_verify.click_import()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Import dialog", legacy_ms=2000)
 
         # --- Step 3️⃣: Upload Excel file ---
         import_user_verify.upload_file(file_path)
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("file upload", legacy_ms=2000)
 
         # --- Step 4️⃣: Click Upload and handle toast/popup ---
         import_user_verify.click_upload()
-        page.wait_for_timeout(5000)
+        helper.wait_until_settled("user import", legacy_ms=5000)
 
         # --- Step 5️⃣: Verify imported users data from Excel ---
         import_user_verify.verify_imported_users_from_excel(file_path)
 
 
-    def test_TC06_verify_new_user_login_standalone(self, browser, page, login):
+    def test_TC06_verify_new_user_login_standalone(self, new_context, page, login, request):
         """🧪 Create a user → Close session → Verify login in fresh browser"""
         page = login
         helper = BaseHelper(page)
         admin_nav = AdminNavigationAndAddUser(page, helper)
         user_verif = UserVerificationAndDuplicateEmpNOLoginChecks(page, helper, admin_nav)
-        password_util = PasswordGenerationAndValidation(page, helper)
 
         print("\n🚀 Starting Test: Standalone New User Login Verification")
 
@@ -237,18 +240,17 @@ class Test_01AdminAddUserPositiveCases:
         admin_nav.go_to_admin()
         admin_nav.click_add_user()
 
-        username = admin_nav.enter_name()
-        login_id = admin_nav.enter_login_id()
-        password = password_util.enter_password()
-        admin_nav.enter_department("QA")
-        admin_nav.enter_email("autotest@yopmail.com")
-        admin_nav.enter_employee_number()
-        admin_nav.select_role(["User"])
-        admin_nav.select_country_code("+91")
-        admin_nav.enter_whatsapp_number(whatsapp_no="9988776655")
-        admin_nav.enable_send_welcome_mail()
+        user = admin_nav.fill_user_form({
+            "department": "QA",
+            "email": "autotest@yopmail.com",
+            "role": ["User"],
+            "countryCode": "+91",
+            "whatsappNo": "9988776655",
+            "sendMail": True,
+        })
+        username, login_id, password = user["name"], user["loginId"], user["password"]
         admin_nav.click_save()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Save", legacy_ms=2000)
 
         # Verify user created
         admin_nav.click_All_Users_radio()
@@ -258,20 +260,20 @@ class Test_01AdminAddUserPositiveCases:
         print(f"🎯 User created successfully: {username} | {login_id}")
 
         # --------------- STEP 2: Open Fresh Browser to Verify Login ---------------
-        context2 = browser.new_context(viewport={"width": 1470, "height": 720})
+        region = request.config.getoption("--region")
+        context2 = new_context("new_user_login")
         page2 = context2.new_page()
 
         login_verifier = NewUserLoginVerification(
             page=page2,
-            login_url=ReadConfig.getURL("Test")
+            login_url=ReadConfig.getURL(region)
         )
 
         login_verifier.verify_new_user_login(
-            client_id=ReadConfig.getClientID("Test"),
+            client_id=ReadConfig.getClientID(region),
             login_id=login_id,
             password=password,
             username=username
         )
 
-        context2.close()
         print("✨ New user login verified successfully in standalone browser!")
@@ -26,11 +26,11 @@ class Test_002_Admin_Add_User_Negative_cases:
 
         # Navigate to Admin
         admin_nav.go_to_admin()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("Admin page", legacy_ms=1000)
 
         # Add User
         admin_nav.click_add_user()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Add User form", legacy_ms=2000)
 
         # Fill mandatory fields with duplicate login
         admin_nav.enter_name("Existing_User")
@@ -63,11 +63,11 @@ class Test_002_Admin_Add_User_Negative_cases:
 
         # Navigate to Admin
         admin_nav.go_to_admin()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("Admin page", legacy_ms=1000)
 
         # Add User
         admin_nav.click_add_user()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Add User form", legacy_ms=2000)
 
         # Fill mandatory fields with duplicate Employee No
         admin_nav.enter_name("Existing_Employee")
@@ -105,15 +105,15 @@ class Test_002_Admin_Add_User_Negative_cases:
         )
 
         print("🚨 Starting Negative Test: Invalid Password Validations")
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("page", legacy_ms=1000)
 
         # Navigate to Admin page
         admin_nav.go_to_admin()
-        page.wait_for_timeout(1000)
+        helper.wait_until_settled("Admin page", legacy_ms=1000)
 
         # Open Add User form
         admin_nav.click_add_user()
-        page.wait_for_timeout(2000)
+        helper.wait_until_settled("Add User form", legacy_ms=2000)
 
         # Fill mandatory fields (password will be tested dynamically)
         admin_nav.enter_name("Invalid_Password_User")
@@ -0,0 +1,61 @@
+import time
+import pytest
+from Utilities.BaseHelpers import BaseHelper
+
+# A fake Angular app: busy until window.finishWork(), which is what the button waits for
+FAKE_ANGULAR_APP = """
+<button id="save" hidden onclick="this.textContent = 'clicked'">Save</button>
+<script>
+    let busy = true;
+    const callbacks = [];
+    window.finishWork = () => {
+        busy = false;
+        document.getElementById("save").hidden = false;
+        callbacks.splice(0).forEach((cb) => cb());
+    };
+    window.getAllAngularTestabilities = () => [{
+        isStable: () => !busy,
+        whenStable: (cb) => busy ? callbacks.push(cb) : cb(),
+    }];
+</script>
+"""
+
+
+@pytest.fixture
+def angular_stable(monkeypatch):
+    monkeypatch.setattr(BaseHelper, "ANGULAR_STABLE", True)
+    monkeypatch.setattr(BaseHelper, "ANGULAR_TIMEOUT", 1500)
+
+
+class Test_001_Angular_Stable:
+    """--angular-stable: BaseHelper actions wait on Angular's testability API (offline pages)."""
+
+    def test_TC01_action_waits_until_angular_is_stable(self, page, angular_stable):
+        page.set_content(FAKE_ANGULAR_APP)
+        helper = BaseHelper(page)
+        page.evaluate("setTimeout(() => window.finishWork(), 1000)")
+
+        start = time.perf_counter()
+        helper.click("#save", "Save button", timeout=500)  # only visible once the app is stable
+        assert time.perf_counter() - start >= 0.95
+        assert page.inner_text("#save") == "clicked"
+
+    def test_TC02_pages_without_angular_are_not_delayed(self, page, angular_stable):
+        page.set_content("<button id='save'>Save</button>")
+        helper = BaseHelper(page)
+
+        start = time.perf_counter()
+        assert helper.wait_for_angular("plain page") == "absent"
+        assert time.perf_counter() - start < 0.5
+
+    def test_TC03_never_stable_app_falls_back_after_the_limit(self, page, angular_stable):
+        page.set_content(FAKE_ANGULAR_APP)
+        helper = BaseHelper(page)
+
+        start = time.perf_counter()
+        assert helper.wait_for_angular("busy app") == "timeout"
+        assert 1.4 <= time.perf_counter() - start < 3
+
+    def test_TC04_off_by_default(self, page):
+        page.set_content(FAKE_ANGULAR_APP)
+        assert BaseHelper(page).wait_for_angular() == "off"
@@ -0,0 +1,58 @@
+import pytest
+from Utilities.CflowApiClient import CflowApiClient, CflowApiError
+
+
+def new_user(login_id: str, emp_no: str) -> dict:
+    return {
+        "name": f"User_{login_id}", "department": "QA", "email": f"{login_id}@yopmail.com",
+        "loginId": login_id, "password": "Aa1@abcdefgh", "empNo": emp_no,
+        "role": ["User"], "countryCode": "+91", "whatsappNo": "9988776655",
+    }
+
+
+class Test_001_Api_Client_Local:
+    """Exercises CflowApiClient against the in-memory stand-in backend (no network needed)."""
+
+    def test_TC01_create_disable_enable_delete_user(self):
+        client = CflowApiClient.local()
+
+        created = client.create_user(new_user("user_api01", "90001"))
+        assert created["loginId"] == "user_api01"
+        assert created["status"] is True
+
+        assert client.disable_user("user_api01")["status"] is False
+        assert client.search_users("user_api01", active_only=True) == []
+
+        assert client.enable_user("user_api01")["status"] is True
+        assert [u["loginId"] for u in client.search_users("user_api01", active_only=True)] == ["user_api01"]
+
+        client.delete_user("user_api01")
+        assert client.search_users("user_api01") == []
+
+    def test_TC02_duplicate_login_id_and_employee_no_are_rejected(self):
+        client = CflowApiClient.local()
+        client.create_user(new_user("user_api02", "90002"))
+
+        with pytest.raises(CflowApiError, match="Username Already Exist"):
+            client.create_user(new_user("user_api02", "90003"))
+        with pytest.raises(CflowApiError, match="Employee No Already Exist"):
+            client.create_user(new_user("user_api03", "90002"))
+
+    def test_TC03_bulk_create_and_delete_keep_input_order(self):
+        client = CflowApiClient.local(pool_size=4)
+        users = [new_user(f"user_bulk{i:02d}", f"8{i:04d}") for i in range(20)]
+
+        created = client.create_users(users)
+        assert [u["loginId"] for u in created] == [u["loginId"] for u in users]
+        assert len(client.search_users("user_bulk")) == 20
+
+        client.disable_users([u["loginId"] for u in users[:5]])
+        assert len(client.search_users("user_bulk", active_only=True)) == 15
+
+        client.delete_users([u["loginId"] for u in users])
+        assert client.search_users("user_bulk") == []
+
+    def test_TC04_unknown_user_raises(self):
+        client = CflowApiClient.local()
+        with pytest.raises(CflowApiError, match="not found"):
+            client.delete_user("missing_user")
@@ -0,0 +1,60 @@
+import pytest
+from PageObjects.Admin_Add_User.B_Admin_Add_user import AdminNavigationAndAddUser
+from PageObjects.Admin_Add_User.B_Admin_Add_user_async import (
+    AsyncAdminNavigationAndAddUser,
+    AsyncImportUserFromExcel,
+    AsyncVerifyUserInEmployeesLookup,
+)
+from Utilities.AsyncBaseHelpers import AsyncBaseHelper
+from Utilities.ImportedUsers import ImportedUser
+from Utilities.PasswordPolicy import PasswordPolicy, PasswordPolicyCache
+
+
+@pytest.fixture(scope="module")
+def api_users(request):
+    """Three users created through the backend (regions with backendApi only), deleted afterwards."""
+    api_client = request.getfixturevalue("api_client")
+    policy = PasswordPolicyCache.shared().get() or PasswordPolicy(
+        require_digit=True, require_upper=True, require_lower=True, require_special=True)
+    suffix = AdminNavigationAndAddUser.random_string(4)
+    users = [
+        ImportedUser(name=f"async user {suffix} {i}", login_id=f"async_{suffix}_{i}",
+                     email=f"async_{suffix}_{i}@yopmail.com", role="User", whatsapp="9988776655",
+                     emp_no=f"AS{suffix}{i}", department="QA")
+        for i in range(3)
+    ]
+    api_client.create_users([{
+        "name": u.name, "department": u.department, "email": u.email, "loginId": u.login_id,
+        "password": policy.generate_valid(), "empNo": u.emp_no, "role": [u.role], "countryCode": "+91",
+        "whatsappNo": u.whatsapp, "status": True,
+    } for u in users])
+    yield users
+    api_client.delete_users([u.login_id for u in users])
+
+
+async def verify_user_form(page, user: ImportedUser) -> str:
+    helper = AsyncBaseHelper(page)
+    await AsyncAdminNavigationAndAddUser(page, helper).go_to_admin()
+    return await AsyncImportUserFromExcel(page, helper).verify_imported_user(user)
+
+
+async def verify_lookup_record(page, user: ImportedUser) -> str:
+    helper = AsyncBaseHelper(page)
+    lookup = AsyncVerifyUserInEmployeesLookup(page, helper)
+    await lookup.go_to_lookup()
+    await lookup.employees_lookup()
+    await lookup.verify_latest_employee_record({
+        "Employee No": user.emp_no, "Employee Name": user.name, "Login ID": user.login_id,
+        "Email ID": user.email, "Department": user.department,
+    })
+    return user.login_id
+
+
+class Test_001_Async_Flows:
+    """async_flows: several logged-in pages verified concurrently with the async page objects."""
+
+    def test_TC01_users_verified_concurrently(self, async_flows, api_users):
+        assert async_flows.map(verify_user_form, api_users) == [u.name for u in api_users]
+
+    def test_TC02_lookup_rows_found_by_login_id(self, async_flows, api_users):
+        assert async_flows.map(verify_lookup_record, api_users) == [u.login_id for u in api_users]
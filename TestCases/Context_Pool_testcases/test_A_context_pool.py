@@ -0,0 +1,50 @@
+import pytest
+from Utilities.ContextPool import ContextPool
+
+
+@pytest.fixture
+def pool_factory(browser, auth_cache):
+    reason = auth_cache.unavailable_reason()
+    if reason:
+        pytest.skip(reason)
+    pools = []
+
+    def make(size: int) -> ContextPool:
+        pools.append(ContextPool(browser, auth_cache, size=size, recycle="reset", default_timeout=10000))
+        return pools[-1]
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def pooled(pool: ContextPool) -> int:
+    return len(pool._ready) + len(pool._in_use)
+
+
+class Test_001_Context_Pool:
+    """Pre-warmed logged-in contexts, reset between tests (--region=Local)."""
+
+    def test_TC01_reset_drops_the_tests_cookies_and_keeps_the_login(self, pool_factory, auth_cache):
+        pool = pool_factory(size=1)
+        context, page = pool.acquire()
+        context.add_cookies([{"name": "test_leak", "value": "1", "url": page.url}])
+        pool.release(context, page)
+
+        again, page = pool.acquire()
+        assert again is context  # reset and handed out again
+        assert "test_leak" not in {cookie["name"] for cookie in again.cookies()}
+        assert auth_cache.is_logged_in(page)
+        pool.release(again, page)
+
+    def test_TC02_discarded_contexts_are_made_good(self, pool_factory):
+        pool = pool_factory(size=2)
+        context, page = pool.acquire()
+        pool.release(context, page, failed=True)  # closed, not parked
+        assert pooled(pool) == 2
+
+        pool._ready.popleft()[0].close()  # lost outside the pool's control
+        context, page = pool.acquire()
+        assert pooled(pool) == 2 and len(pool._ready) == 1  # refilled on acquire
+        pool.release(context, page)
+        assert pooled(pool) == 2
@@ -0,0 +1,58 @@
+import json
+import os
+import time
+import pytest
+from Utilities.FrameworkLogger import FrameworkLog, get_logger, step_fields
+
+log = get_logger("tests")
+
+
+@pytest.fixture
+def log_dir(tmp_path, request):
+    FrameworkLog.configure(str(tmp_path))
+    yield tmp_path
+    FrameworkLog.configure(request.config.getoption("--action-log-dir"),
+                           verbose=request.config.getoption("--verbose-actions"))
+
+
+def read_lines(path: str) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class Test_001_Framework_Log:
+    """Buffered JSON-lines sink of the framework logger (no browser needed)."""
+
+    def test_TC01_records_carry_test_step_and_duration(self, log_dir):
+        start = time.perf_counter()
+        log.info("✅ Clicked: %s", "Save button", extra=step_fields("click", start))
+        path = FrameworkLog.path
+        FrameworkLog.close()
+
+        [record] = read_lines(path)
+        assert record["message"] == "✅ Clicked: Save button" and record["step"] == "click"
+        assert record["test"].endswith("test_TC01_records_carry_test_step_and_duration")
+        assert record["duration_ms"] >= 0 and record["level"] == "INFO"
+
+    def test_TC02_buffered_until_an_error(self, log_dir):
+        for n in range(10):
+            log.info("step %d", n)
+        assert read_lines(FrameworkLog.path) == []  # still in memory
+
+        log.error("❌ something broke")
+        assert [r["message"] for r in read_lines(FrameworkLog.path)][-1] == "❌ something broke"
+        assert len(read_lines(FrameworkLog.path)) == 11
+
+    def test_TC03_debug_details_are_lazy_and_off_by_default(self, log_dir):
+        class Expensive:
+            formatted = False
+
+            def __str__(self):
+                Expensive.formatted = True
+                return "row"
+
+        log.debug("🧾 %s", Expensive())
+        FrameworkLog.flush()
+        assert not Expensive.formatted and read_lines(FrameworkLog.path) == []
@@ -0,0 +1,48 @@
+import os
+import pytest
+from openpyxl import Workbook
+from Utilities.ImportedUsers import ImportedUser, ImportedUserReader
+
+IMPORT_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "TestData", "User_Import.xlsx")
+
+
+def write_sheet(path, rows):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Users")
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+class Test_001_Imported_User_Reader:
+    """Streaming the user import sheet with openpyxl (no browser needed)."""
+
+    def test_TC01_reads_the_shipped_import_file(self):
+        users = list(ImportedUserReader(IMPORT_FILE))
+
+        assert users == [ImportedUser(name="import user 7", login_id="importuser07",
+                                      email="importuser01@yopmail.com", role="User", whatsapp="9994397461",
+                                      emp_no="IM46", department="QA")]
+        assert users[0].by_column()["WhatsApp Number"] == "9994397461"
+
+    def test_TC02_columns_by_name_blank_rows_skipped_rows_lazy(self, tmp_path):
+        header = ["Department", "Notes", "Employee Number", "WhatsApp Number", "Role", "Email", "Login ID", "Name"]
+        rows = [header] + [
+            ["QA", "x", f"E{i}", 9990000000.0 + i, "User", f"u{i}@x.com", f" user{i} ", f"user {i}"]
+            for i in range(1000)
+        ]
+        rows.insert(2, [None] * len(header))
+        reader = ImportedUserReader(write_sheet(tmp_path / "big.xlsx", rows))
+
+        users = iter(reader)
+        first = next(users)
+        assert (first.login_id, first.whatsapp, first.emp_no) == ("user0", "9990000000", "E0")
+        assert reader.rows_read == 1  # nothing beyond the first row parsed yet
+        assert sum(1 for _ in users) == 999 and reader.rows_read == 1000
+
+    def test_TC03_missing_columns_are_reported_once(self, tmp_path):
+        path = write_sheet(tmp_path / "bad.xlsx", [["Name", "Email"], ["user 1", "u1@x.com"]])
+
+        with pytest.raises(ValueError, match="Login ID, Role, WhatsApp Number, Employee Number, Department"):
+            list(ImportedUserReader(path))
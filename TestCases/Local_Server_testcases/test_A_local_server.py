@@ -0,0 +1,70 @@
+import os
+import time
+import pytest
+import requests
+from Utilities.LocalCflowServer import LocalCflowServer
+from Utilities.CflowApiClient import CflowApiClient, CflowApiError
+
+IMPORT_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "TestData", "User_Import.xlsx")
+
+
+@pytest.fixture
+def local_server():
+    with LocalCflowServer.from_config("Local", port=0, latency_ms=0, jitter_ms=0) as server:
+        yield server
+
+
+def admin_session(server: LocalCflowServer) -> requests.Session:
+    session = requests.Session()
+    response = session.post(server.base_url + server.LOGIN_API, json={
+        "clientId": server.client_id, "username": server.username, "password": server.password,
+    })
+    assert response.status_code == 200, response.text
+    return session
+
+
+class Test_001_Local_Server:
+    """HTTP-level checks of the local stand-in server (no browser needed)."""
+
+    def test_TC01_pages_need_a_session(self, local_server):
+        anonymous = requests.get(local_server.base_url + "/cflow/user-role-permission", allow_redirects=False)
+        assert anonymous.status_code == 302
+        assert anonymous.headers["Location"] == local_server.LOGIN_PATH
+
+        rejected = requests.post(local_server.base_url + local_server.LOGIN_API, json={
+            "clientId": local_server.client_id, "username": local_server.username, "password": "wrong",
+        })
+        assert rejected.status_code == 401
+
+        page = admin_session(local_server).get(local_server.base_url + "/cflow/user-role-permission")
+        assert page.status_code == 200
+        assert "window.CFLOW_CONFIG" in page.text
+
+    def test_TC02_api_client_works_against_the_server(self, local_server):
+        session = admin_session(local_server)
+        client = CflowApiClient(local_server.base_url, session=session)
+        client.create_user({"name": "User_srv01", "loginId": "user_srv01", "empNo": "70001",
+                            "password": "Aa1@abcdefgh", "role": ["User"]})
+
+        assert [u["loginId"] for u in client.search_users("user_srv01")] == ["user_srv01"]
+        with pytest.raises(CflowApiError, match="Username Already Exist"):
+            client.create_user({"name": "Dup", "loginId": "dinesh01", "empNo": "70002"})  # seeded user
+
+    def test_TC03_import_reports_existing_users(self, local_server):
+        session = admin_session(local_server)
+        with open(IMPORT_FILE, "rb") as f:
+            workbook = f.read()
+        url = local_server.base_url + "/cflow/api/admin/users/import"
+
+        first = session.post(url, data=workbook).json()["data"]
+        assert first == {"imported": ["importuser07"], "existing": [], "rejected": []}
+        assert local_server.directory.find_user("importuser07")["whatsappNo"] == "9994397461"
+
+        second = session.post(url, data=workbook).json()["data"]
+        assert second["imported"] == [] and second["existing"] == ["importuser07"]
+
+    def test_TC04_latency_is_applied(self):
+        with LocalCflowServer.from_config("Local", port=0, latency_ms=150, jitter_ms=0) as server:
+            start = time.perf_counter()
+            requests.get(server.login_url)
+            assert time.perf_counter() - start >= 0.15
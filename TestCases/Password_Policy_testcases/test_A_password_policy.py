@@ -0,0 +1,69 @@
+import random
+from Utilities.PasswordPolicy import PasswordPolicy
+
+
+RULES = [
+    "Password should be at least 10 characters long",
+    "Password should be less than 16 characters",
+    "Password should contain a number",
+    "Password should contain an uppercase letter",
+    "Password should contain a lowercase alphabet",
+    "Password should contain a special character (!@#)",
+]
+
+
+class Test_001_Password_Policy:
+    """Rule parsing and password generation, in pure Python (no browser needed)."""
+
+    def test_TC01_rules_are_compiled_once(self):
+        policy = PasswordPolicy.from_rules(RULES)
+
+        assert (policy.min_length, policy.max_length) == (10, 15)
+        assert policy.require_digit and policy.require_upper and policy.require_lower and policy.require_special
+        assert policy.specials == "!@#"
+        assert PasswordPolicy.from_rules([]) == PasswordPolicy()
+
+    def test_TC02_generated_passwords_meet_every_rule(self):
+        random.seed(21)
+        policy = PasswordPolicy.from_rules(RULES)
+
+        for length in (None, 4, 12, 40):
+            password = policy.generate_valid(length)
+            assert policy.is_valid(password), password
+            assert policy.violations(password) == []
+            assert 10 <= len(password) <= 15
+
+    def test_TC03_each_invalid_password_breaks_its_rule(self):
+        random.seed(21)
+        policy = PasswordPolicy.from_rules(RULES)
+
+        for rule in RULES:
+            password = policy.generate_invalid(rule)
+            assert rule in policy.violations(password), (rule, password)
+            assert not policy.is_valid(password)
+
+    def test_TC04_candidates_break_only_their_rule_at_boundary_lengths(self):
+        random.seed(24)
+        policy = PasswordPolicy.from_rules(RULES)
+
+        assert [len(p) for p in policy.invalid_candidates(RULES[0])] == [9, 1]
+        assert [len(p) for p in policy.invalid_candidates(RULES[1])] == [16, 25]
+        for rule in RULES[2:]:
+            candidates = policy.invalid_candidates(rule)
+            assert [len(p) for p in candidates] == [10, 12, 15]
+            assert all(policy.violations(p) == [rule] for p in candidates), (rule, candidates)
+
+    def test_TC05_bounds_outside_the_defaults_come_from_the_rules(self):
+        random.seed(21)
+        rules = ["Password should be at least 6 characters long", "Password should be less than 31 characters",
+                 *RULES[2:]]
+        policy = PasswordPolicy.from_rules(rules)
+
+        assert (policy.min_length, policy.max_length) == (6, 30)
+        assert [len(p) for p in policy.invalid_candidates(rules[0])] == [5, 1]
+        assert [len(p) for p in policy.invalid_candidates(rules[1])] == [31, 40]
+        for rule in rules[:2]:
+            assert policy.violations(policy.generate_invalid(rule)) == [rule], rule  # boundary: only this rule
+        assert 6 <= len(policy.generate_valid(40)) <= 30
+        assert PasswordPolicy.from_rules(rules[:1]).max_length == 20
+        assert PasswordPolicy.from_rules(["Password should be at least 25 characters long"]).max_length == 25
@@ -0,0 +1,46 @@
+import time
+from Utilities.PasswordPolicy import PasswordPolicyCache
+
+
+RULES = [
+    "Password should be at least 8 characters long",
+    "Password should be less than 21 characters",
+    "Password should contain a number",
+]
+
+
+class Test_002_Password_Policy_Cache:
+    """Per-tenant cache of the scraped rules: memory, disk, TTL and fingerprint."""
+
+    def test_TC01_rules_are_shared_through_disk(self, tmp_path):
+        path = str(tmp_path / "policies.json")
+        worker_1 = PasswordPolicyCache("Local", "cflowlocal.com", path=path)
+        assert worker_1.get(RULES) is None
+
+        stored = worker_1.put(RULES)
+        worker_2 = PasswordPolicyCache("Local", "cflowlocal.com", path=path)
+        other_tenant = PasswordPolicyCache("Local", "other.com", path=path)
+
+        assert worker_1.get(RULES) is stored
+        assert worker_2.get(RULES) == stored and worker_2.get([]) == stored
+        assert other_tenant.get(RULES) is None
+
+    def test_TC02_changed_rules_miss_the_fingerprint(self, tmp_path):
+        cache = PasswordPolicyCache("Local", "cflowlocal.com", path=str(tmp_path / "policies.json"))
+        cache.put(RULES)
+
+        changed = RULES[:2] + ["Password should contain an uppercase letter"]
+        assert cache.get(changed) is None
+        assert cache.put(changed).require_upper and cache.get(changed).require_upper
+
+    def test_TC03_expired_or_disabled_cache_misses(self, tmp_path):
+        path = str(tmp_path / "policies.json")
+        cache = PasswordPolicyCache("Local", "cflowlocal.com", ttl_seconds=0.2, path=path)
+        cache.put(RULES)
+        assert cache.get(RULES) is not None
+        time.sleep(0.3)
+        assert cache.get(RULES) is None
+
+        disabled = PasswordPolicyCache("Local", "cflowlocal.com", ttl_seconds=0, path=str(tmp_path / "off.json"))
+        assert disabled.put(RULES).min_length == 8 and disabled.get(RULES) is None
+        assert not (tmp_path / "off.json").exists()
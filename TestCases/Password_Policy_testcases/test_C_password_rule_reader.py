@@ -0,0 +1,116 @@
+from PageObjects.Admin_Add_User.B_Admin_Add_user import PasswordGenerationAndValidation, InvalidPasswordTests
+from Utilities.BaseHelpers import BaseHelper
+from Utilities.PasswordPolicy import PasswordPolicyCache
+
+# Same markup and behaviour as the Add User form's <cf-password-policy-validate>
+PASSWORD_FORM = """
+<input formcontrolname="password">
+<cf-password-policy-validate><div class="password-validation" hidden><ul>
+    <li data-rule="min">Password should be at least 8 characters long</li>
+    <li data-rule="number">Password should contain a number</li>
+    <li data-rule="upper">Password should contain an uppercase letter</li>
+</ul></div></cf-password-policy-validate>
+<script>(() => {
+    const checks = {min: (v) => v.length >= 8, number: (v) => /[0-9]/.test(v), upper: (v) => /[A-Z]/.test(v)};
+    const input = document.querySelector("input");
+    const update = () => {
+        document.querySelector(".password-validation").hidden = !input.value;
+        document.querySelectorAll("li").forEach((li) => {
+            const met = checks[li.dataset.rule](input.value);
+            if (window.withClasses) {
+                li.classList.toggle("valid", met);
+                li.classList.toggle("invalid", !met);
+            }
+            li.hidden = met;
+        });
+    };
+    input.addEventListener("input", update);
+})();</script>
+"""
+
+
+def password_form(page, with_classes: bool) -> PasswordGenerationAndValidation:
+    page.set_content(PASSWORD_FORM)
+    page.evaluate(f"window.withClasses = {str(with_classes).lower()}")
+    return PasswordGenerationAndValidation(page, BaseHelper(page))
+
+
+class Test_003_Password_Rule_Reader:
+    """Rule texts and pass/fail read in one call (offline page)."""
+
+    def test_TC01_rules_and_state_in_one_read(self, page):
+        form = password_form(page, with_classes=True)
+        form.txt_password.fill("abc1")
+
+        rules = {rule.text: (rule.visible, rule.passed) for rule in form.read_password_rules()}
+
+        assert rules == {
+            "Password should be at least 8 characters long": (True, False),
+            "Password should contain a number": (False, True),
+            "Password should contain an uppercase letter": (True, False),
+        }
+
+    def test_TC02_check_password_rereads_the_verdicts(self, page):
+        form = password_form(page, with_classes=True)
+
+        assert list(form.check_password("Abcdefg1").values()) == [True, True, True]
+        assert form.check_password("abcdefgh") == {
+            "Password should be at least 8 characters long": True,
+            "Password should contain a number": False,
+            "Password should contain an uppercase letter": False,
+        }
+
+        form = password_form(page, with_classes=False)  # hidden but unclassed: not taken as met
+        assert list(form.check_password("Abcdefg1").values()) == [False, False, False]
+
+    def test_TC03_visible_rules_after_typing(self, page):
+        form = password_form(page, with_classes=True)
+
+        assert form.rendered_password_rules()[1] == "Password should contain a number"
+        assert form.get_visible_password_rules() == [
+            "Password should be at least 8 characters long",
+            "Password should contain a number",
+            "Password should contain an uppercase letter",
+        ]
+        assert form.txt_password.input_value() == ""
+
+    def test_TC04_invalid_candidates_checked_in_one_loop(self, page):
+        form = password_form(page, with_classes=True)
+        negative = InvalidPasswordTests(page, form.helper, form.txt_password, btn_save_locator=None)
+        min_rule, number_rule, upper_rule = form.rendered_password_rules()
+
+        verdicts = negative.check_invalid_passwords([
+            (min_rule, "Abcdef1"),
+            (number_rule, "Abcdefgh"),
+            (upper_rule, "abcdefg1"),
+            (upper_rule, "Abcdefg1"),  # not invalid at all
+        ])
+
+        assert [failed for _, _, failed in verdicts] == [[min_rule], [number_rule], [upper_rule], []]
+        assert form.txt_password.input_value() == ""
+
+    def test_TC05_policy_cached_from_the_probe_matches_the_rendered_rules(self, page, tmp_path, monkeypatch):
+        # Rules rendered only once the field has a value (*ngIf); met ones are hidden
+        page.set_content("""
+            <input formcontrolname="password"><cf-password-policy-validate></cf-password-policy-validate>
+            <script>(() => {
+                const rules = {number: ["Password should contain a number", /[0-9]/],
+                               lower: ["Password should contain a lowercase alphabet", /[a-z]/]};
+                const input = document.querySelector("input");
+                input.addEventListener("input", () => {
+                    const host = document.querySelector("cf-password-policy-validate");
+                    host.innerHTML = input.value ? '<div class="password-validation"><ul>' + Object.values(rules)
+                        .map(([text, re]) => `<li class="${re.test(input.value) ? "valid" : "invalid"}"`
+                                             + `${re.test(input.value) ? " hidden" : ""}>${text}</li>`)
+                        .join("") + "</ul></div>" : "";
+                });
+            })();</script>""")
+        cache = PasswordPolicyCache("Local", "cflowlocal.com", path=str(tmp_path / "policies.json"))
+        monkeypatch.setattr(PasswordPolicyCache, "_shared", cache)
+        form = PasswordGenerationAndValidation(page, BaseHelper(page))
+
+        policy = form.password_policy()  # nothing rendered: probed by typing "a" (lowercase rule hidden)
+        assert policy.require_digit and policy.require_lower
+
+        form.txt_password.fill("b")
+        assert form.password_policy() is policy  # the rendered rules hash to the stored fingerprint
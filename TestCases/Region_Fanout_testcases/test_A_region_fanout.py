@@ -0,0 +1,46 @@
+import os
+import pytest
+from Utilities.RegionFanout import RegionFanout
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="3">
+  <testcase classname="TestCases.test_A.Test_001" name="test_TC01" time="1.5"/>
+  <testcase classname="TestCases.test_A.Test_001" name="test_TC02" time="2.0">
+    <failure message="AssertionError: toast not found">trace</failure></testcase>
+  <testcase classname="TestCases.test_A.Test_001" name="test_TC03" time="0.0">
+    <skipped message="no user"/></testcase>
+</testsuite></testsuites>
+"""
+
+
+class Test_001_Region_Fanout:
+    """Command line handling and report merging of multi-region runs (no browser needed)."""
+
+    def test_TC01_region_selection(self):
+        assert RegionFanout.parse_regions("Test") is None
+        assert RegionFanout.parse_regions("all") == ["AP", "ME", "US", "EU", "Test"]
+        assert RegionFanout.parse_regions("US, AP,US") == ["US", "AP"]
+        with pytest.raises(ValueError, match="Mars"):
+            RegionFanout.parse_regions("AP,Mars")
+
+    def test_TC02_per_region_options_are_not_forwarded(self):
+        args = ["-q", "--region", "all", "-n4", "--html=Reports/x.html", "-k", "TC01",
+                "--region-workers", "3", "--numprocesses=2", "TestCases/Admin_add_user_testcases"]
+        fanout = RegionFanout(["AP", "US"], args, workers=3)
+
+        assert fanout.args == ["-q", "-k", "TC01", "TestCases/Admin_add_user_testcases"]
+        command = fanout.command("US")
+        assert "--region=US" in command and command[command.index("-n") + 1] == "3"
+
+    def test_TC03_combined_report_is_labelled_by_region(self, tmp_path):
+        for region in ("AP", "US"):
+            os.makedirs(tmp_path / region)
+            (tmp_path / region / "junit.xml").write_text(JUNIT, encoding="utf-8")
+        fanout = RegionFanout(["AP", "US"], [], report_dir=str(tmp_path))
+
+        results = [fanout.read_junit(r, str(tmp_path / r / "junit.xml")) for r in ("AP", "US")]
+        assert (results[0].passed, results[0].failed, results[0].skipped) == (1, 1, 1)
+
+        report = open(fanout.write_report(results, wall_time=3.5), encoding="utf-8").read()
+        assert report.count("toast not found") == 2
+        assert "<td>AP</td>" in report and "<td>US</td>" in report
@@ -0,0 +1,31 @@
+from Utilities.RoutePolicy import RoutePolicy
+
+PAGE = "<img src='http://analytics.invalid/pixel.png'><img src='http://127.0.0.1:9/logo.png'>"
+
+
+class Test_001_Route_Policy:
+    """Request routing (offline pages; blocked and unreachable URLs only)."""
+
+    def test_TC01_url_patterns_match_like_fnmatch(self):
+        regex = RoutePolicy.url_regex("*google-analytics.com*")
+
+        assert regex.search("https://www.google-analytics.com/collect?v=1&tid=UA-1")
+        assert not regex.search("https://cflow.example.com/app/")
+        assert RoutePolicy.url_regex("http://a.test/?.png").search("http://a.test/1.png")
+
+    def test_TC02_only_blocked_urls_reach_the_handler(self, browser, monkeypatch):
+        policy = RoutePolicy(block_url_patterns=["*analytics.invalid*"])
+        handled = []
+        handle = policy._handle
+        monkeypatch.setattr(policy, "_handle", lambda route, request, stats: (
+            handled.append(request.url), handle(route, request, stats)))
+
+        context = browser.new_context()
+        try:
+            stats = policy.apply(context)
+            context.new_page().set_content(PAGE)
+        finally:
+            context.close()
+
+        assert handled == ["http://analytics.invalid/pixel.png"]
+        assert stats.blocked == 1 and stats.by_type["image"] == 1
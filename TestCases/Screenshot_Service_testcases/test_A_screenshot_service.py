@@ -0,0 +1,60 @@
+import os
+import struct
+from Utilities.ScreenshotService import ScreenshotService
+
+PAGE = "<div id='box' style='width:120px;height:80px;background:#c00'></div><p>Cflow</p>"
+
+
+def png_size(path: str) -> tuple[int, int]:
+    """Width and height from a PNG's IHDR chunk."""
+    with open(path, "rb") as f:
+        return struct.unpack(">II", f.read(24)[16:24])
+
+
+class Test_001_Screenshot_Service:
+    """Background screenshot writer (offline pages, files go to a temporary folder)."""
+
+    def test_TC01_names_are_unique_and_files_written_in_background(self, page, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path))
+        page.set_content(PAGE)
+
+        paths = [service.capture(page, "Same Prefix") for _ in range(3)]
+        service.close()
+
+        assert len(set(paths)) == 3
+        assert all(os.path.isfile(path) and path.endswith(".png") for path in paths)
+        assert "test_TC01_names_are_unique" in os.path.basename(paths[0])
+
+    def test_TC02_jpeg_format(self, page, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path), image_format="jpg", quality=50)
+        page.set_content(PAGE)
+
+        path = service.capture(page, "Box")
+        service.close()
+
+        with open(path, "rb") as f:
+            assert f.read(3) == b"\xff\xd8\xff"  # JPEG signature
+        assert path.endswith(".jpg")
+
+    def test_TC03_oldest_files_are_rotated_out_over_budget(self, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path), budget_mb=0.25)
+        paths = []
+        for n in range(5):
+            paths.append(service.save(os.urandom(100 * 1024), f"Shot{n}"))
+            service.flush()
+        service.close()
+
+        remaining = [path for path in paths if os.path.exists(path)]
+        assert remaining == paths[-2:]
+
+    def test_TC04_element_clip_and_page_fallback(self, page, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path))
+        page.set_viewport_size({"width": 800, "height": 600})
+        page.set_content(PAGE)
+
+        clipped = service.capture(page, "Box", locator="#box")
+        fallback = service.capture(page, "Missing", locator="#not-there")  # not visible: whole page
+        service.close()
+
+        assert png_size(clipped) == (120, 80)
+        assert png_size(fallback) == (800, 600)
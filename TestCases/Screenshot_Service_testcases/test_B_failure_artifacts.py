@@ -0,0 +1,76 @@
+import os
+import struct
+import pytest
+from Utilities.BaseHelpers import BaseHelper
+from Utilities.FailureArtifacts import FailureArtifacts
+from Utilities.ScreenshotService import ScreenshotService
+
+PAGE = ("<button id='save' style='width:90px;height:30px'>Save</button>"
+        "<script>console.log('form ready')</script>")
+
+
+@pytest.fixture
+def screenshots(tmp_path, monkeypatch):
+    service = ScreenshotService(directory=str(tmp_path))
+    monkeypatch.setattr(ScreenshotService, "_shared", service)
+    yield service
+    service.close()
+
+
+class Test_002_Failure_Artifacts:
+    """One screenshot / DOM snapshot / console log per failing test (offline pages)."""
+
+    def test_TC01_nested_failures_only_leave_breadcrumbs(self, page, screenshots):
+        page.set_content(PAGE)
+        helper = BaseHelper(page)
+
+        inner = helper.take_screenshot("EnableToggleFailed_user1")
+        outer = helper.take_screenshot("EnableToggleFailed_user1", "#save")
+        screenshots.flush()
+
+        assert inner == outer
+        assert not os.path.exists(inner)  # nothing captured until the test is known to fail
+        assert len(helper.artifacts.breadcrumbs) == 2
+
+    def test_TC02_collect_captures_once(self, page, screenshots):
+        page.set_content(PAGE)
+        helper = BaseHelper(page)
+        path = helper.take_screenshot("ClickFailed_Save")
+
+        artifacts = helper.artifacts.collect(page)
+        assert helper.artifacts.collect(page) == {}
+        screenshots.flush()
+
+        assert artifacts["screenshot"] == path and os.path.isfile(path)
+        assert "Save</button>" in artifacts["dom_html"] and os.path.isfile(artifacts["dom"])
+        assert "ClickFailed_Save" in artifacts["log"] and "[log] form ready" in artifacts["log"]
+        assert len(os.listdir(screenshots.directory)) == 3
+
+    def test_TC03_reset_for_a_reused_page(self, page, screenshots):
+        page.set_content(PAGE)
+        artifacts = FailureArtifacts.for_page(page)
+        first = artifacts.breadcrumb("FirstTest")
+        artifacts.collect(page)
+
+        artifacts.reset()
+        assert not artifacts.breadcrumbs and not artifacts.captured and artifacts.reserve_path() != first
+
+    def test_TC04_other_pages_are_captured_on_first_failure(self, browser, screenshots):
+        context = browser.new_context()
+        try:
+            other = context.new_page()  # not the test's page: conftest would never collect it
+            other.set_content(PAGE)
+            helper = BaseHelper(other)
+            FailureArtifacts.drain_side_captures()
+
+            path = helper.take_screenshot("LoginFailed_user2", "#save")
+            helper.take_screenshot("LoginFailed_user2")
+            screenshots.flush()
+
+            captures = FailureArtifacts.drain_side_captures()
+            assert [captured for captured, _ in captures] == [path] and os.path.isfile(path)
+            assert captures[0][1] and FailureArtifacts.drain_side_captures() == []
+            with open(path, "rb") as f:
+                assert struct.unpack(">II", f.read(24)[16:24]) == (90, 30)  # clipped to the failed element
+        finally:
+            context.close()
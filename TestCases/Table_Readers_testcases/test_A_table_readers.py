@@ -0,0 +1,69 @@
+import pytest
+from Utilities.BaseHelpers import BaseHelper
+
+LOOKUP_TABLE = """
+<table>
+    <thead><tr><th><input type="checkbox"></th><th>Actions</th><th>ID</th><th>Employee No</th><th>Email ID</th></tr></thead>
+    <tbody>
+        <tr><td><input type="checkbox"></td><td>Edit</td><td>12</td><td> E12 </td><td>a@x.com</td></tr>
+        <tr><td><input type="checkbox"></td><td>Edit</td><td>11</td><td>E11</td><td>b@x.com</td></tr>
+        <tr><td><input type="checkbox"></td><td>Edit</td><td>10</td><td>E10</td><td>c@x.com</td></tr>
+    </tbody>
+</table>
+"""
+
+USER_FORM = """
+<form>
+    <input formcontrolname="name" value="import user 7">
+    <input type="checkbox" formcontrolname="status" checked>
+    <ng-select formcontrolname="role">
+        <span class="ng-value-label">User</span><span class="ng-value-label">Admin</span>
+    </ng-select>
+</form>
+"""
+
+
+class Test_001_Table_Readers:
+    """BaseHelper.read_table / read_row / read_form and fill_form (offline pages)."""
+
+    def test_TC01_read_table_keys_rows_by_header(self, page):
+        page.set_content(LOOKUP_TABLE)
+        helper = BaseHelper(page)
+
+        rows = helper.read_table("table", columns=["ID", "Employee No"], max_rows=2)
+        assert rows == [{"ID": "12", "Employee No": "E12"}, {"ID": "11", "Employee No": "E11"}]
+
+        renamed = helper.read_table("table", header_map={"Email ID": "email", 1: "select"}, columns=["email"])
+        assert [r["email"] for r in renamed] == ["a@x.com", "b@x.com", "c@x.com"]
+
+    def test_TC02_read_row_and_form(self, page):
+        page.set_content(LOOKUP_TABLE + USER_FORM)
+        helper = BaseHelper(page)
+
+        assert helper.read_row("tbody tr >> nth=1", header_map={3: "id"}, columns=["id", "Email ID"]) == \
+            {"id": "11", "Email ID": "b@x.com"}
+        assert helper.read_form("form") == {"name": "import user 7", "status": True, "role": "User, Admin"}
+
+    def test_TC03_missing_table_fails_like_other_helpers(self, page):
+        page.set_content("<p>no table</p>")
+        with pytest.raises(AssertionError, match="Unable to read employees"):
+            BaseHelper(page).read_table("table", description="employees", timeout=300)
+
+    def test_TC04_fill_form_falls_back_for_rejected_controls(self, page):
+        page.set_content("""
+            <form>
+                <input formcontrolname="name" class="ng-pristine">
+                <input formcontrolname="email" class="ng-pristine">
+                <input formcontrolname="empNo" class="ng-pristine" maxlength="5">
+            </form>
+            <script>
+                // like Angular: typing marks the control dirty — except empNo, whose accessor ignores script events
+                document.querySelectorAll("[formcontrolname]:not([formcontrolname=empNo])").forEach((c) =>
+                    c.addEventListener("input", () => c.classList.replace("ng-pristine", "ng-dirty")));
+            </script>""")
+        helper = BaseHelper(page)
+
+        helper.fill_form({"name": "User_abcde", "email": "a@x.com", "empNo": "12345", "unknown": None})
+
+        assert helper.read_form("form") == {"name": "User_abcde", "email": "a@x.com", "empNo": "12345"}
+        assert page.locator("[formcontrolname=name]").get_attribute("class") == "ng-dirty"
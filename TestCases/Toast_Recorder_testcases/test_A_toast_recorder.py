@@ -0,0 +1,43 @@
+from Utilities.ToastRecorder import ToastRecorder
+
+# ngx-toastr-like markup: toasts are children of #toast-container, removed after `ms`
+TOAST_PAGE = """
+<div id="toast-container"></div>
+<script>
+    window.showToast = (text, level, ms) => {
+        const toast = document.createElement("div");
+        toast.className = "ngx-toastr toast-" + level;
+        toast.innerHTML = '<div class="toast-message">' + text + '</div>';
+        document.getElementById("toast-container").prepend(toast);
+        setTimeout(() => toast.remove(), ms);
+    };
+</script>
+"""
+
+
+class Test_001_Toast_Recorder:
+    """Toast buffer recorded in the page (offline pages, no server needed)."""
+
+    def test_TC01_short_lived_toast_is_still_caught(self, page):
+        page.set_content(TOAST_PAGE)
+        toasts = ToastRecorder(page)
+
+        mark = toasts.mark()
+        page.evaluate("setTimeout(() => showToast('User Added Successfully', 'success', 30), 200)")
+        toast = toasts.wait_for(mark, timeout=2000)
+
+        assert toast is not None and toast.text == "User Added Successfully" and toast.level == "success"
+        assert page.locator("#toast-container > *").count() == 0  # already gone from the DOM
+
+    def test_TC02_mark_hides_toasts_of_earlier_actions(self, page):
+        page.set_content(TOAST_PAGE)
+        toasts = ToastRecorder(page)
+        page.evaluate("showToast('Username Already Exist', 'error', 4000)")
+
+        mark = toasts.mark()
+        assert toasts.wait_for(mark, timeout=300) is None  # the visible toast is not this action's
+        page.evaluate("showToast('Employee No Already Exist', 'error', 4000)")
+
+        assert toasts.wait_for(mark, pattern=r"employee\s*no", timeout=2000).text == "Employee No Already Exist"
+        assert [t.text for t in toasts.since(mark)] == ["Employee No Already Exist"]
+        assert [t.text for t in toasts.timeline()] == ["Username Already Exist", "Employee No Already Exist"]
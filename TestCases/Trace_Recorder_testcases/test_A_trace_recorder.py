@@ -0,0 +1,54 @@
+import os
+import zipfile
+import pytest
+from Utilities.TraceRecorder import TraceRecorder
+
+
+@pytest.fixture
+def context(browser):
+    context = browser.new_context()
+    yield context
+    context.close()
+
+
+def traced_step(recorder: TraceRecorder, context, nodeid: str, failed: bool):
+    start_ms = recorder.start(context, nodeid)
+    page = context.pages[0] if context.pages else context.new_page()
+    page.set_content(f"<h1>{nodeid}</h1>")
+    return recorder.stop(context, nodeid, failed=failed, start_ms=start_ms)
+
+
+class Test_001_Trace_Recorder:
+    """--trace-mode: one chunk per test on a shared context (no server needed)."""
+
+    def test_TC01_retain_on_failure_keeps_only_failing_chunks(self, context, tmp_path):
+        recorder = TraceRecorder("retain-on-failure", trace_dir=str(tmp_path))
+
+        passed_path, passed_ms = traced_step(recorder, context, "tests/a.py::test_passes", failed=False)
+        failed_path, failed_ms = traced_step(recorder, context, "tests/a.py::test_fails", failed=True)
+
+        assert passed_path is None and passed_ms > 0
+        assert failed_path == recorder.path_for("tests/a.py::test_fails") and zipfile.is_zipfile(failed_path)
+        assert os.listdir(recorder.trace_dir) == [os.path.basename(failed_path)]
+        assert recorder.stats.chunks == 2 and recorder.stats.kept == 1
+
+    def test_TC02_without_sources_or_snapshots(self, context, tmp_path):
+        recorder = TraceRecorder("on", trace_dir=str(tmp_path), snapshots=False, sources=False)
+
+        path, _ = traced_step(recorder, context, "tests/a.py::test_lean", failed=False)
+
+        names = zipfile.ZipFile(path).namelist()
+        assert not any(name.startswith("src/") for name in names)
+        assert not any(name.endswith(".jpeg") for name in names)
+
+    def test_TC03_off_and_closed_contexts_cost_nothing(self, browser, tmp_path):
+        untraced = browser.new_context()
+        assert TraceRecorder("off", trace_dir=str(tmp_path)).start(untraced, "x") == 0.0
+        untraced.close()
+
+        recorder = TraceRecorder("retain-on-failure", trace_dir=str(tmp_path))
+        closed = browser.new_context()
+        start_ms = recorder.start(closed, "tests/a.py::test_closes_its_context")
+        closed.close()
+        assert recorder.stop(closed, "tests/a.py::test_closes_its_context", failed=True, start_ms=start_ms) \
+            == (None, start_ms)
@@ -0,0 +1,241 @@
+import time
+import weakref
+from playwright.async_api import Page, TimeoutError
+from Utilities.BaseHelpers import BaseHelper
+from Utilities.FailureArtifacts import FailureArtifacts
+from Utilities.FrameworkLogger import get_logger, step_fields
+from Utilities.ScreenshotService import ScreenshotService
+from Utilities.SettleProbe import ANGULAR_STABLE_JS, SETTLE_PROBE_JS, settled_condition
+
+
+log = get_logger("async_helpers")
+
+
+class AsyncBaseHelper:
+    """
+    playwright.async_api edition of BaseHelper.
+    Same actions, messages and failure behaviour — every call is awaited so one
+    event loop can drive many pages at once.
+    """
+
+    _probed_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    # ---------------------------------------------------------------
+    # Utility: Screenshot
+    # ---------------------------------------------------------------
+    async def take_screenshot(self, prefix="Error", locator=None):
+        # Async flow pages are not the test's `page`, so conftest cannot capture them after
+        # the fact: the first failure of the page captures, later ones only add breadcrumbs.
+        artifacts = FailureArtifacts.for_page(self.page)
+        screenshot_path = artifacts.breadcrumb(prefix, locator)
+        if not artifacts.captured:
+            artifacts.captured = True
+            service = ScreenshotService.shared()
+            image = None
+            if artifacts.locator is not None:  # clipped to the failed element, as ScreenshotService.grab does
+                locator = artifacts.locator
+                element = self.page.locator(locator) if isinstance(locator, str) else locator
+                try:
+                    image = await element.first.screenshot(**service.screenshot_options(element=True))
+                except Exception:
+                    pass
+            image = image or await self.page.screenshot(**service.screenshot_options())
+            service.save(image, path=screenshot_path)
+        log.debug("📸 %s — failure screenshot: %s", prefix, screenshot_path)
+        return screenshot_path
+
+    # ---------------------------------------------------------------
+    # Common Actions
+    # ---------------------------------------------------------------
+    async def click(self, locator, description: str = "element", timeout: int = 5000):
+        """Click an element and stop test on failure."""
+        start = time.perf_counter()
+        try:
+            await self.wait_for_angular(description)
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            await element.wait_for(state="visible", timeout=timeout)
+            await element.scroll_into_view_if_needed()
+            await element.click(timeout=timeout)
+            log.info("✅ Clicked: %s", description, extra=step_fields("click", start))
+
+        except Exception as e:
+            await self.take_screenshot(f"ClickFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to click {description}: {e}"
+            log.error(error_msg, extra=step_fields("click", start))
+            raise AssertionError(error_msg)
+
+    async def enter_text(self, locator, text: str, description: str = "textbox", timeout: int = 5000):
+        """Enter text into a field and stop test on failure."""
+        start = time.perf_counter()
+        try:
+            await self.wait_for_angular(description)
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            await element.wait_for(state="visible", timeout=timeout)
+            await element.scroll_into_view_if_needed()
+            await element.fill("")  # Clear any existing text
+            await element.fill(text)
+            log.info("✅ Entered '%s' into %s", text, description, extra=step_fields("enter_text", start))
+
+        except Exception as e:
+            await self.take_screenshot(f"EnterTextFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to enter text in {description}: {e}"
+            log.error(error_msg, extra=step_fields("enter_text", start))
+            raise AssertionError(error_msg)
+
+    async def upload_file(self, locator, file_path, description="File upload field", timeout: int = 5000):
+        """Upload a file using a file input element and stop test on failure."""
+        start = time.perf_counter()
+        try:
+            await self.wait_for_angular(description)
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            await element.wait_for(state="visible", timeout=timeout)
+            await element.set_input_files(file_path)
+            log.info("✅ File '%s' successfully uploaded using %s", file_path, description,
+                     extra=step_fields("upload_file", start))
+
+        except Exception as e:
+            screenshot_path = await self.take_screenshot(f"UploadFailed_{description.replace(' ', '_')}")
+            error_msg = (
+                f"❌ Test failed — Unable to upload file using {description}: {e}\n"
+                f"📸 Screenshot captured at: {screenshot_path}"
+            )
+            log.error(error_msg, extra=step_fields("upload_file", start))
+            raise AssertionError(error_msg)
+
+    async def scroll_to_label(self, locator, friendly_name: str = None, timeout: int = 5000):
+        """Scroll to any element, confirm it's visible and return its locator."""
+        start = time.perf_counter()
+        try:
+            await self.wait_for_angular(friendly_name or "element")
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            await element.wait_for(state="visible", timeout=timeout)
+            await element.scroll_into_view_if_needed()
+
+            label_text = friendly_name or await element.inner_text(timeout=1000) or "Unnamed Element"
+            log.info("✅ Element visible — %s", label_text.strip(), extra=step_fields("scroll_to_label", start))
+
+            return element
+
+        except Exception as e:
+            await self.take_screenshot(f"ElementNotVisible_{friendly_name or 'Unknown'}")
+            error_msg = f"❌ Test failed — Element not visible or scroll failed: {friendly_name or locator}: {e}"
+            log.error(error_msg, extra=step_fields("scroll_to_label", start))
+            raise AssertionError(error_msg)
+
+    # ---------------------------------------------------------------
+    # Settled Waits (instead of fixed sleeps) — see BaseHelper.wait_until_settled
+    # ---------------------------------------------------------------
+    async def _ensure_settle_probe(self):
+        if self.page in AsyncBaseHelper._probed_pages:
+            return
+        AsyncBaseHelper._probed_pages.add(self.page)
+        await self.page.add_init_script(SETTLE_PROBE_JS)
+        try:
+            await self.page.evaluate(SETTLE_PROBE_JS)
+        except Exception:
+            pass  # page is mid-navigation; the init script covers the next document
+
+    async def wait_until_settled(self, description: str = "page", legacy_ms: int | None = None,
+                                 predicate: str | None = None, locator=None, quiet_ms: int | None = None,
+                                 timeout: int | None = None) -> float:
+        quiet_ms = BaseHelper.SETTLE_QUIET_MS if quiet_ms is None else quiet_ms
+        timeout = timeout or legacy_ms or BaseHelper.SETTLE_TIMEOUT
+        await self._ensure_settle_probe()
+
+        start = time.perf_counter()
+        settled = True
+        try:
+            await self.page.wait_for_function(settled_condition(quiet_ms, predicate), timeout=timeout, polling=50)
+            if locator is not None:
+                element = self.page.locator(locator) if isinstance(locator, str) else locator
+                remaining = timeout - (time.perf_counter() - start) * 1000
+                await element.wait_for(state="visible", timeout=max(remaining, 1))
+        except TimeoutError:
+            settled = False
+
+        waited_ms = (time.perf_counter() - start) * 1000
+        BaseHelper.settle_stats.record(waited_ms, legacy_ms, settled)  # one tally per process
+        if not settled:
+            log.warning("⚠ %s: not settled after %s ms — continuing", description, timeout,
+                        extra=step_fields("settle", start))
+        elif legacy_ms:
+            log.info("⏳ %s: settled in %.0f ms (fixed wait was %s ms)", description, waited_ms, legacy_ms,
+                     extra=step_fields("settle", start))
+        return waited_ms
+
+    async def wait_for_angular(self, description: str = "page", timeout: int | None = None) -> str:
+        if not BaseHelper.ANGULAR_STABLE:
+            return "off"
+        timeout = timeout or BaseHelper.ANGULAR_TIMEOUT
+        await self._ensure_settle_probe()
+        try:
+            status = await self.page.evaluate(ANGULAR_STABLE_JS, timeout)
+        except Exception:
+            return "navigating"  # document replaced mid-wait; the next document starts fresh
+        if status == "timeout":
+            log.warning("⚠ %s: Angular not stable after %s ms — continuing", description, timeout)
+        return status
+
+    # ---------------------------------------------------------------
+    # Table / Form Readers (one evaluate per read) — see BaseHelper.read_row / read_form
+    # ---------------------------------------------------------------
+    async def read_row(self, locator, header_map: dict | None = None, columns: list[str] | None = None,
+                       description: str = "table row", timeout: int = 5000) -> dict:
+        """Read one <tr> as {column key: cell text} with a single evaluate."""
+        try:
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            header_map = {str(k): v for k, v in (header_map or {}).items()}
+            return (await element.evaluate(BaseHelper.READ_CELLS_JS, [header_map, columns, 1], timeout=timeout))[0]
+
+        except Exception as e:
+            await self.take_screenshot(f"ReadRowFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to read {description}: {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+    async def read_form(self, locator, description: str = "form", timeout: int = 5000) -> dict:
+        """Read every [formcontrolname] value inside `locator` with a single evaluate."""
+        try:
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            return await element.evaluate(BaseHelper.READ_FORM_JS, timeout=timeout)
+
+        except Exception as e:
+            await self.take_screenshot(f"ReadFormFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to read {description}: {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+    # ---------------------------------------------------------------
+    # Page Verification
+    # ---------------------------------------------------------------
+    async def verify_page_url(self, expected_url_fragment: str, description: str = "page", timeout: int = 10000):
+        """Verify the page URL contains the expected fragment."""
+        try:
+            start = time.perf_counter()
+            log.debug("🌍 Verifying %s URL ...", description)
+            await self.page.wait_for_url(f"**{expected_url_fragment}**", timeout=timeout)
+            actual_url = self.page.url
+
+            if expected_url_fragment in actual_url:
+                log.info("🏆 %s URL verification passed! ✅ Actual URL: '%s'", description, actual_url,
+                         extra=step_fields("verify_page_url", start))
+            else:
+                raise AssertionError(
+                    f"❌ {description} URL verification failed.\n"
+                    f"Expected fragment: '{expected_url_fragment}'\n"
+                    f"Actual URL: '{actual_url}'"
+                )
+
+        except Exception as e:
+            await self.take_screenshot(f"URL_Verification_Failed_{description.replace(' ', '_')}")
+            actual_url = getattr(self.page, "url", "N/A")
+            error_msg = (
+                f"❌ Test failed — {description} URL verification failed: {e}\n"
+                f"Expected fragment (url to be): '{expected_url_fragment}'\n"
+                f"Actual URL: '{actual_url}'"
+            )
+            log.error(error_msg)
+            raise AssertionError(error_msg)
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from playwright.async_api import async_playwright
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("async_flows")
+
+
+class AsyncFlowRunner:
+    """
+    Runs independent async flows side by side on one browser, each in its own context.
+
+    The event loop lives in a background thread, so the runner can be used from regular
+    (sync) pytest tests next to the sync Playwright fixtures without the two loops meeting.
+
+    A flow is `async def flow(page, *args)`; every page starts already logged in
+    (from `storage_state`) on `start_url`.
+    """
+
+    def __init__(self, browser_name: str = "chromium", headless: bool = True, storage_state: str | None = None,
+                 start_url: str | None = None, concurrency: int = 4, default_timeout: int = 10000,
+                 **context_options):
+        self.browser_name = browser_name.lower()
+        self.headless = headless
+        self.storage_state = storage_state
+        self.start_url = start_url
+        self.concurrency = concurrency
+        self.default_timeout = default_timeout
+        self.context_options = context_options
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-playwright", daemon=True)
+        self._thread.start()
+        self._playwright = None
+        self._browser = None
+        self._call(self._start())
+
+    # ---------------------------------------------------------------
+    # Event Loop Plumbing
+    # ---------------------------------------------------------------
+    def _call(self, coro):
+        """Run a coroutine on the runner's loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _start(self):
+        self._playwright = await async_playwright().start()
+        if self.browser_name not in ("chromium", "firefox", "webkit"):
+            raise ValueError(f"Unsupported browser: {self.browser_name}")
+        browser_type = getattr(self._playwright, self.browser_name)
+        self._browser = await browser_type.launch(headless=self.headless)
+
+    async def _stop(self):
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+    # ---------------------------------------------------------------
+    # Flows
+    # ---------------------------------------------------------------
+    async def _run_flow(self, semaphore: asyncio.Semaphore, flow, args: tuple):
+        async with semaphore:
+            context = await self._browser.new_context(storage_state=self.storage_state, **self.context_options)
+            try:
+                page = await context.new_page()
+                page.set_default_timeout(self.default_timeout)
+                if self.start_url:
+                    await page.goto(self.start_url)
+                return await flow(page, *args)
+            finally:
+                await context.close()
+
+    async def _gather(self, calls: list[tuple], concurrency: int):
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *(self._run_flow(semaphore, flow, args) for flow, args in calls),
+            return_exceptions=True,
+        )
+
+    def _run_calls(self, calls: list[tuple], concurrency: int | None) -> list:
+        results = self._call(self._gather(calls, concurrency or self.concurrency))
+
+        failures = [(i, r) for i, r in enumerate(results) if isinstance(r, BaseException)]
+        if failures:
+            details = "\n".join(f"   flow #{i + 1}: {error}" for i, error in failures)
+            raise AssertionError(f"❌ {len(failures)} of {len(results)} async flows failed:\n{details}")
+
+        log.info("✅ %d async flows completed", len(results))
+        return results
+
+    def run(self, *flows, concurrency: int | None = None) -> list:
+        """Run `flow(page)` for every flow concurrently; results come back in the same order."""
+        return self._run_calls([(flow, ()) for flow in flows], concurrency)
+
+    def map(self, flow, items, concurrency: int | None = None) -> list:
+        """Run `flow(page, item)` for every item concurrently, e.g. one page per imported user."""
+        return self._run_calls([(flow, (item,)) for item in items], concurrency)
+
+    def close(self):
+        try:
+            self._call(self._stop())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+            self._loop.close()
@@ -0,0 +1,155 @@
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from PageObjects.Login_Page.A_loginpage import LoginPage
+from Utilities.BaseHelpers import BaseHelper
+from Utilities.FrameworkLogger import get_logger
+from Utilities.RunCache import RunCache
+
+
+log = get_logger("auth_session")
+
+
+class AuthSessionCache:
+    """
+    Logs in once per region + account and stores the Playwright storage state
+    (cookies + localStorage) in the run cache. Later tests restore that state into
+    their context and only fall back to the UI login when the session has expired.
+    """
+
+    DASHBOARD_FRAGMENT = "/dashboard"
+
+    def __init__(self, region: str, url: str, client_id: str, username: str, password: str,
+                 probe_timeout: int = 5000):
+        self.region = region
+        self.url = url
+        self.client_id = client_id
+        self.username = username
+        self.password = password
+        self.probe_timeout = probe_timeout
+
+        key = RunCache.safe_name(f"{region}_{client_id}_{username}")
+        self.state_path = RunCache.path("auth", f"{key}.json")
+        self.meta_path = RunCache.path("auth", f"{key}.meta.json")
+        self.lock_path = RunCache.path("auth", f"{key}.lock")
+
+    # ---------------------------------------------------------------
+    # Cache Files
+    # ---------------------------------------------------------------
+    def has_state(self) -> bool:
+        return os.path.exists(self.state_path) and os.path.exists(self.meta_path)
+
+    def _state_version(self) -> float:
+        return os.path.getmtime(self.state_path) if os.path.exists(self.state_path) else 0.0
+
+    def landing_url(self) -> str:
+        """URL the app landed on after the cached login (the dashboard)."""
+        with open(self.meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)["landing_url"]
+
+    def _save(self, page: Page):
+        page.context.storage_state(path=self.state_path)
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump({"landing_url": page.url, "saved_at": time.time()}, f)
+        log.info("💾 Login session cached for %s (%s)", self.username, self.region)
+
+    # ---------------------------------------------------------------
+    # Login / Restore
+    # ---------------------------------------------------------------
+    def unavailable_reason(self, timeout: float = 5) -> str | None:
+        """Why a login cannot work here (no credentials, app unreachable), or None; checked before any browser starts."""
+        missing = [name for name, value in (("client ID", self.client_id), ("username", self.username),
+                                            ("password", self.password)) if not value]
+        if missing:
+            return f"No {', '.join(missing)} configured for region {self.region}"
+        try:
+            urllib.request.urlopen(self.url, timeout=timeout).close()
+        except urllib.error.HTTPError:
+            pass  # the server answered; the login page decides the rest
+        except (urllib.error.URLError, OSError) as e:
+            return f"{self.url} is not reachable ({self.region}): {getattr(e, 'reason', e)}"
+        return None
+
+    def ui_login(self, page: Page):
+        """Full login through the Login page."""
+        log.info("➡️ Launching URL: %s (%s)", self.url, self.region)
+        page.goto(self.url)
+
+        lp = LoginPage(page)
+        lp.setClientid(self.client_id)
+        lp.setUserName(self.username)
+        lp.setPassword(self.password)
+        lp.clickLogin()
+
+        helper = BaseHelper(page)
+        helper.verify_page_url(self.DASHBOARD_FRAGMENT, description="Dashboard")
+
+    def is_logged_in(self, page: Page) -> bool:
+        """
+        Cheap probe: whichever shows up first, the login form or the side navigation,
+        tells whether the session is still accepted by the server.
+        """
+        login_form = page.locator("#client-id")
+        side_nav = page.get_by_role("link", name="Admin")
+        try:
+            login_form.or_(side_nav).first.wait_for(state="visible", timeout=self.probe_timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return self.DASHBOARD_FRAGMENT in page.url and not login_form.is_visible()
+
+    def restore(self, page: Page) -> bool:
+        """Load the cached state into the page's context and open the dashboard."""
+        if not self.has_state():
+            return False
+
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        version = str(self._state_version())
+        page.context.add_cookies(state.get("cookies", []))
+        for origin in state.get("origins", []):
+            args = [origin["origin"], origin.get("localStorage", []), version]
+            page.context.add_init_script(
+                script=(
+                    "(([origin, items, version]) => {"
+                    "  if (window.location.origin !== origin) return;"
+                    # Apply once per tab, so a later UI login is not overwritten on navigation
+                    "  if (window.sessionStorage.getItem('__cflowStateRestored') === version) return;"
+                    "  window.sessionStorage.setItem('__cflowStateRestored', version);"
+                    "  for (const {name, value} of items) window.localStorage.setItem(name, value);"
+                    f"}})({json.dumps(args)});"
+                )
+            )
+
+        page.goto(self.landing_url())
+        return self.is_logged_in(page)
+
+    def authenticate(self, page: Page):
+        """
+        Restore the cached session, or log in through the UI and refresh the cache.
+        Only one worker logs in at a time; the others pick up its fresh state.
+        """
+        version = self._state_version()
+        if self.restore(page):
+            log.info("♻️ Reused cached login for %s (%s)", self.username, self.region)
+            return
+
+        with RunCache.file_lock(self.lock_path):
+            # Another worker may have refreshed the session while we waited for the lock
+            if self._state_version() != version and self.restore(page):
+                log.info("♻️ Reused cached login for %s (%s)", self.username, self.region)
+                return
+
+            self.ui_login(page)
+            self._save(page)
+
+    def ensure_state(self, browser, **context_options):
+        """Make sure a valid cached session exists, logging in with a throwaway context if needed."""
+        context = browser.new_context(**context_options)
+        try:
+            self.authenticate(context.new_page())
+        finally:
+            context.close()
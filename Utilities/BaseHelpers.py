@@ -1,22 +1,45 @@
-import os
-from datetime import datetime
+import time
+import weakref
 from playwright.sync_api import Page, TimeoutError
+from Utilities.FailureArtifacts import FailureArtifacts
+from Utilities.FrameworkLogger import get_logger, step_fields
+from Utilities.SettleProbe import ANGULAR_STABLE_JS, SETTLE_PROBE_JS, SettleStats, settled_condition
+from Utilities.ToastRecorder import ToastRecorder
+
+
+log = get_logger("helpers")
 
 
 class BaseHelper:
+    # Settled waits: quiet period that counts as "idle", and the limit when no fixed sleep is replaced
+    SETTLE_QUIET_MS = 100
+    SETTLE_TIMEOUT = 10000
+    settle_stats = SettleStats()
+    _probed_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+    # --angular-stable: every action first waits for Angular's whenStable (at most ANGULAR_TIMEOUT)
+    ANGULAR_STABLE = False
+    ANGULAR_TIMEOUT = 5000
+
     def __init__(self, page: Page):
         self.page = page
-        self.screenshot_dir = r"D:\CFLOW PLAYWRIGHT\Screenshots"
+        self._ensure_settle_probe()
+        self.toasts = ToastRecorder(page)  # mark() before an action, wait_for(mark) after it
+        self.artifacts = FailureArtifacts.for_page(page)
 
     # ---------------------------------------------------------------
     # Utility: Screenshot
     # ---------------------------------------------------------------
-    def take_screenshot(self, prefix="Error"):
-        os.makedirs(self.screenshot_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
-        screenshot_path = os.path.join(self.screenshot_dir, f"{prefix}_{timestamp}.png")
-        self.page.screenshot(path=screenshot_path)
-        print(f"📸 Screenshot saved at: {screenshot_path}")
+    def take_screenshot(self, prefix="Error", locator=None):
+        """
+        Record a failure breadcrumb. The test's one screenshot, DOM snapshot and console log
+        are captured by conftest if the test fails; this returns where the screenshot will be.
+        Pages other than the test's page are captured right away (first failure only).
+        With `locator`, the screenshot is clipped to that element when it is visible.
+        """
+        screenshot_path = self.artifacts.breadcrumb(prefix, locator)
+        self.artifacts.capture_now(self.page)
+        log.debug("📸 %s — failure screenshot: %s", prefix, screenshot_path)
         return screenshot_path
 
     # ---------------------------------------------------------------
@@ -24,42 +47,49 @@ class BaseHelper:
     # ---------------------------------------------------------------
     def click(self, locator, description: str = "element", timeout: int = 5000):
         """Click an element and stop test on failure."""
+        start = time.perf_counter()
         try:
+            self.wait_for_angular(description)
             element = self.page.locator(locator) if isinstance(locator, str) else locator
             element.wait_for(state="visible", timeout=timeout)
             element.scroll_into_view_if_needed()
             element.click(timeout=timeout)
-            print(f"✅ Clicked: {description}")
+            log.info("✅ Clicked: %s", description, extra=step_fields("click", start))
 
         except Exception as e:
             self.take_screenshot(f"ClickFailed_{description.replace(' ', '_')}")
             error_msg = f"❌ Test failed — Unable to click {description}: {e}"
-            print(error_msg)
+            log.error(error_msg, extra=step_fields("click", start))
             raise AssertionError(error_msg)
 
     def enter_text(self, locator, text: str, description: str = "textbox", timeout: int = 5000):
         """Enter text into a field and stop test on failure."""
+        start = time.perf_counter()
         try:
+            self.wait_for_angular(description)
             element = self.page.locator(locator) if isinstance(locator, str) else locator
             element.wait_for(state="visible", timeout=timeout)
             element.scroll_into_view_if_needed()
             element.fill("")  # Clear any existing text
             element.fill(text)
-            print(f"✅ Entered '{text}' into {description}")
+            log.info("✅ Entered '%s' into %s", text, description, extra=step_fields("enter_text", start))
 
         except Exception as e:
             self.take_screenshot(f"EnterTextFailed_{description.replace(' ', '_')}")
             error_msg = f"❌ Test failed — Unable to enter text in {description}: {e}"
-            print(error_msg)
+            log.error(error_msg, extra=step_fields("enter_text", start))
             raise AssertionError(error_msg)
 
     def upload_file(self, locator, file_path, description="File upload field", timeout: int = 5000):
         """Upload a file using a file input element and stop test on failure."""
+        start = time.perf_counter()
         try:
+            self.wait_for_angular(description)
             element = self.page.locator(locator) if isinstance(locator, str) else locator
             element.wait_for(state="visible", timeout=timeout)
             element.set_input_files(file_path)
-            print(f"✅ File '{file_path}' successfully uploaded using {description}")
+            log.info("✅ File '%s' successfully uploaded using %s", file_path, description,
+                     extra=step_fields("upload_file", start))
 
         except Exception as e:
             screenshot_path = self.take_screenshot(f"UploadFailed_{description.replace(' ', '_')}")
@@ -67,7 +97,7 @@ class BaseHelper:
                 f"❌ Test failed — Unable to upload file using {description}: {e}\n"
                 f"📸 Screenshot captured at: {screenshot_path}"
             )
-            print(error_msg)
+            log.error(error_msg, extra=step_fields("upload_file", start))
             raise AssertionError(error_msg)
 
     def scroll_to_label(self, locator, friendly_name: str = None, timeout: int = 5000):
@@ -82,7 +112,10 @@ class BaseHelper:
         Returns:
             Locator: The visible locator object for further actions (click, type, etc.)
         """
+        start = time.perf_counter()
         try:
+            self.wait_for_angular(friendly_name or "element")
+
             # Allow both string and Locator objects
             element = self.page.locator(locator) if isinstance(locator, str) else locator
 
@@ -94,14 +127,251 @@ class BaseHelper:
 
             # Print readable element info
             label_text = friendly_name or element.inner_text(timeout=1000) or "Unnamed Element"
-            print(f"✅ Element visible — {label_text.strip()}")
+            log.info("✅ Element visible — %s", label_text.strip(), extra=step_fields("scroll_to_label", start))
 
             return element
 
         except Exception as e:
             self.take_screenshot(f"ElementNotVisible_{friendly_name or 'Unknown'}")
             error_msg = f"❌ Test failed — Element not visible or scroll failed: {friendly_name or locator}: {e}"
-            print(error_msg)
+            log.error(error_msg, extra=step_fields("scroll_to_label", start))
+            raise AssertionError(error_msg)
+
+    # ---------------------------------------------------------------
+    # Settled Waits (instead of fixed sleeps)
+    # ---------------------------------------------------------------
+    def _ensure_settle_probe(self):
+        """Install the XHR / DOM activity probe once per page (this and every later document)."""
+        if self.page in BaseHelper._probed_pages:
+            return
+        BaseHelper._probed_pages.add(self.page)
+        self.page.add_init_script(SETTLE_PROBE_JS)
+        try:
+            self.page.evaluate(SETTLE_PROBE_JS)
+        except Exception:
+            pass  # page is mid-navigation; the init script covers the next document
+
+    def wait_until_settled(self, description: str = "page", legacy_ms: int | None = None,
+                           predicate: str | None = None, locator=None, quiet_ms: int | None = None,
+                           timeout: int | None = None) -> float:
+        """
+        Wait until the app is idle: no XHR / fetch in flight and no DOM change for `quiet_ms`.
+
+        Args:
+            description (str): What is being waited for (console log).
+            legacy_ms (int): The fixed sleep this wait replaces. It is also the default time
+                limit, so a settled wait is never slower than the sleep it replaced.
+            predicate (str): Optional JS expression that must also be true.
+            locator (str | Locator): Optional element that must also be visible.
+            quiet_ms (int): How long the page must stay quiet (default SETTLE_QUIET_MS).
+            timeout (int): Time limit in ms (default legacy_ms, else SETTLE_TIMEOUT).
+
+        Never fails — on the time limit it logs and returns, like the sleep it replaces.
+
+        Returns:
+            float: Milliseconds waited.
+        """
+        quiet_ms = self.SETTLE_QUIET_MS if quiet_ms is None else quiet_ms
+        timeout = timeout or legacy_ms or self.SETTLE_TIMEOUT
+        self._ensure_settle_probe()
+
+        start = time.perf_counter()
+        settled = True
+        try:
+            self.page.wait_for_function(settled_condition(quiet_ms, predicate), timeout=timeout, polling=50)
+            if locator is not None:
+                element = self.page.locator(locator) if isinstance(locator, str) else locator
+                remaining = timeout - (time.perf_counter() - start) * 1000
+                element.wait_for(state="visible", timeout=max(remaining, 1))
+        except TimeoutError:
+            settled = False
+
+        waited_ms = (time.perf_counter() - start) * 1000
+        BaseHelper.settle_stats.record(waited_ms, legacy_ms, settled)
+        if not settled:
+            log.warning("⚠ %s: not settled after %s ms — continuing", description, timeout,
+                        extra=step_fields("settle", start))
+        elif legacy_ms:
+            log.info("⏳ %s: settled in %.0f ms (fixed wait was %s ms)", description, waited_ms, legacy_ms,
+                     extra=step_fields("settle", start))
+        return waited_ms
+
+    def wait_for_angular(self, description: str = "page", timeout: int | None = None) -> str:
+        """
+        Wait until Angular reports the app stable (getAllAngularTestabilities().whenStable).
+
+        Only with --angular-stable. Returns at once on pages without Angular, and after
+        `timeout` ms (default ANGULAR_TIMEOUT) if the app never settles, so the element
+        wait of the action that follows still decides.
+
+        Returns:
+            str: "stable", "timeout", "absent", "navigating" or "off".
+        """
+        if not BaseHelper.ANGULAR_STABLE:
+            return "off"
+        timeout = timeout or self.ANGULAR_TIMEOUT
+        self._ensure_settle_probe()
+        try:
+            status = self.page.evaluate(ANGULAR_STABLE_JS, timeout)
+        except Exception:
+            return "navigating"  # document replaced mid-wait; the next document starts fresh
+        if status == "timeout":
+            log.warning("⚠ %s: Angular not stable after %s ms — continuing", description, timeout)
+        return status
+
+    # ---------------------------------------------------------------
+    # Bulk Form Fill (Angular reactive forms)
+    # ---------------------------------------------------------------
+    # Sets plain text controls through the native value setter and fires the events Angular's
+    # DefaultValueAccessor listens to. Returns the names it could not set (missing / not plain text).
+    FILL_FORM_JS = """(root, values) => {
+        const skipped = [];
+        for (const [name, value] of Object.entries(values)) {
+            const control = root.querySelector(`[formcontrolname="${name}"]`);
+            const plain = control && !control.disabled && !control.readOnly && (control.tagName === "TEXTAREA"
+                || (control.tagName === "INPUT" && !["checkbox", "radio", "file", "button", "submit"].includes(control.type)));
+            if (!plain) {
+                skipped.push(name);
+                continue;
+            }
+            const proto = control.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, "value").set.call(control, value);
+            control.dispatchEvent(new Event("input", {bubbles: true}));
+            control.dispatchEvent(new Event("change", {bubbles: true}));
+            control.dispatchEvent(new FocusEvent("blur"));
+        }
+        return skipped;
+    }"""
+
+    # Controls whose value did not stick, or that Angular never saw change (still ng-pristine)
+    FORM_REJECTED_JS = """(root, values) => Object.keys(values).filter((name) => {
+        const control = root.querySelector(`[formcontrolname="${name}"]`);
+        return !control || control.value !== values[name] || control.classList.contains("ng-pristine");
+    })"""
+
+    def fill_form(self, values: dict, container=None, description: str = "form", timeout: int = 5000):
+        """
+        Fill several form controls, keyed by formcontrolname, in one in-page call.
+
+        Plain text inputs are set together; the form is then checked once and any control
+        that was skipped or rejected the value (ng-select, custom widgets, ...) is filled
+        with enter_text instead. None values are left untouched.
+
+        Args:
+            values (dict): {formcontrolname: text}.
+            container (str | Locator): Element holding the form (default: the whole page).
+        """
+        values = {name: str(value) for name, value in values.items() if value is not None}
+        start = time.perf_counter()
+        try:
+            container = "body" if container is None else container
+            root = self.page.locator(container) if isinstance(container, str) else container
+            skipped = root.evaluate(self.FILL_FORM_JS, values, timeout=timeout)
+            filled = {name: value for name, value in values.items() if name not in skipped}
+            rejected = root.evaluate(self.FORM_REJECTED_JS, filled, timeout=timeout) if filled else []
+        except Exception as e:
+            self.take_screenshot(f"FillFormFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to fill {description}: {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+        log.info("✅ Filled %d field(s) of %s in one call", len(filled) - len(rejected), description,
+                 extra=step_fields("fill_form", start))
+        for name in [*skipped, *rejected]:
+            self.enter_text(root.locator(f'[formcontrolname="{name}"]'), values[name], f"'{name}' field")
+
+    # ---------------------------------------------------------------
+    # Table / Form Readers (one evaluate per read, not one round trip per cell)
+    # ---------------------------------------------------------------
+    # Body rows of a <table> (or the single <tr> given) as objects keyed by header text.
+    # headerMap renames columns by header text or 1-based index; columns keeps only those keys.
+    READ_CELLS_JS = """(root, [headerMap, columns, maxRows]) => {
+        const table = root.tagName === "TABLE" ? root : (root.closest("table") || root.querySelector("table"));
+        const rows = root.tagName === "TR" ? [root] : Array.from(table.tBodies).flatMap((b) => Array.from(b.rows));
+        const headerCells = table && table.tHead && table.tHead.rows.length ? Array.from(table.tHead.rows[0].cells) : [];
+        const headers = headerCells.map((c) => c.innerText.trim());
+        return rows.slice(0, maxRows || rows.length).map((row) => {
+            const record = {};
+            Array.from(row.cells).forEach((cell, i) => {
+                const key = headerMap[String(i + 1)] || headerMap[headers[i]] || headers[i] || String(i + 1);
+                if (!columns || columns.includes(key)) {
+                    record[key] = cell.innerText.trim();
+                }
+            });
+            return record;
+        });
+    }"""
+
+    # Values of every [formcontrolname] control inside the element: text inputs give their
+    # value, checkboxes true/false, ng-select the selected labels joined with ", ".
+    READ_FORM_JS = """(root) => {
+        const values = {};
+        root.querySelectorAll("[formcontrolname]").forEach((control) => {
+            const name = control.getAttribute("formcontrolname");
+            if (control.tagName === "NG-SELECT") {
+                values[name] = Array.from(control.querySelectorAll(".ng-value-label"))
+                    .map((label) => label.innerText.trim()).join(", ");
+            } else if (control.type === "checkbox" || control.type === "radio") {
+                values[name] = control.checked;
+            } else if ("value" in control) {
+                values[name] = control.value.trim();
+            }
+        });
+        return values;
+    }"""
+
+    def read_table(self, locator, header_map: dict | None = None, columns: list[str] | None = None,
+                   max_rows: int | None = None, description: str = "table", timeout: int = 5000) -> list[dict]:
+        """
+        Read a table's body rows with a single evaluate call.
+
+        Args:
+            locator (str | Locator): The <table>, or an element inside / around it.
+            header_map (dict): Column keys by header text or 1-based index,
+                e.g. {"Email ID": "email"} or {3: "ID"}. Unmapped columns keep their header text.
+            columns (list): Only return these keys.
+            max_rows (int): Only read the first N rows.
+
+        Returns:
+            list[dict]: One dict per row, {column key: cell text}.
+        """
+        try:
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            header_map = {str(k): v for k, v in (header_map or {}).items()}
+            rows = element.evaluate(self.READ_CELLS_JS, [header_map, columns, max_rows], timeout=timeout)
+            log.debug("✅ Read %d row(s) from %s", len(rows), description)
+            return rows
+
+        except Exception as e:
+            self.take_screenshot(f"ReadTableFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to read {description}: {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+    def read_row(self, locator, header_map: dict | None = None, columns: list[str] | None = None,
+                 description: str = "table row", timeout: int = 5000) -> dict:
+        """Read one <tr> as {column key: cell text} with a single evaluate (see read_table)."""
+        try:
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            header_map = {str(k): v for k, v in (header_map or {}).items()}
+            return element.evaluate(self.READ_CELLS_JS, [header_map, columns, 1], timeout=timeout)[0]
+
+        except Exception as e:
+            self.take_screenshot(f"ReadRowFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to read {description}: {e}"
+            log.error(error_msg)
+            raise AssertionError(error_msg)
+
+    def read_form(self, locator, description: str = "form", timeout: int = 5000) -> dict:
+        """Read every [formcontrolname] value inside `locator` with a single evaluate."""
+        try:
+            element = self.page.locator(locator) if isinstance(locator, str) else locator
+            return element.evaluate(self.READ_FORM_JS, timeout=timeout)
+
+        except Exception as e:
+            self.take_screenshot(f"ReadFormFailed_{description.replace(' ', '_')}")
+            error_msg = f"❌ Test failed — Unable to read {description}: {e}"
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
     # ---------------------------------------------------------------
@@ -110,13 +380,14 @@ class BaseHelper:
     def verify_page_url(self, expected_url_fragment: str, description: str = "page", timeout: int = 10000):
         """Verify the page URL contains the expected fragment."""
         try:
-            print(f"🌍 Verifying {description} URL ...")
+            start = time.perf_counter()
+            log.debug("🌍 Verifying %s URL ...", description)
             self.page.wait_for_url(f"**{expected_url_fragment}**", timeout=timeout)
             actual_url = self.page.url
 
             if expected_url_fragment in actual_url:
-                print(f"🏆 {description} URL verification passed! ✅")
-                print(f"Actual URL: '{actual_url}'")
+                log.info("🏆 %s URL verification passed! ✅ Actual URL: '%s'", description, actual_url,
+                         extra=step_fields("verify_page_url", start))
             else:
                 raise AssertionError(
                     f"❌ {description} URL verification failed.\n"
@@ -133,7 +404,7 @@ class BaseHelper:
                 f"Expected fragment (url to be): '{expected_url_fragment}'\n"
                 f"Actual URL: '{actual_url}'"
             )
-            print(error_msg)
+            log.error(error_msg)
             raise AssertionError(error_msg)
 
 
@@ -0,0 +1,150 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from Utilities.ReadProperties import ReadConfig
+from Utilities.FrameworkLogger import get_logger
+from Utilities.LocalCflowBackend import LocalUserDirectory, LocalCflowAdapter
+
+
+log = get_logger("api_client")
+
+
+class CflowApiError(AssertionError):
+    """Backend call failed; raised as AssertionError so it fails the test like UI checks do."""
+
+
+class CflowApiClient:
+    """
+    Seeds test data through the same backend endpoints the Add User form calls.
+
+    Built on one requests.Session with a pooled HTTPAdapter, so bulk calls reuse
+    keep-alive connections instead of opening one per request. Authenticates with
+    the session cookie of the cached login (see AuthSessionCache).
+
+    User payloads use the Add User form's control names:
+    name, department, email, loginId, password, empNo, role, countryCode, whatsappNo, status, sendMail.
+    """
+
+    LOCAL_BASE_URL = "http://cflow.local"
+
+    def __init__(self, base_url: str, session: requests.Session | None = None, pool_size: int = 10,
+                 retries: int = 2, timeout: int = 30):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=retries, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
+
+    # ---------------------------------------------------------------
+    # Construction
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_cookies(cls, base_url: str, cookies: list[dict], **kwargs) -> "CflowApiClient":
+        """Client authenticated with Playwright-format cookies (context.cookies())."""
+        client = cls(base_url, **kwargs)
+        for cookie in cookies:
+            client.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/")
+            )
+        return client
+
+    @classmethod
+    def from_storage_state(cls, base_url: str, state_path: str, **kwargs) -> "CflowApiClient":
+        """Client authenticated with the cookies of a saved storage state file."""
+        with open(state_path, "r", encoding="utf-8") as f:
+            return cls.from_cookies(base_url, json.load(f).get("cookies", []), **kwargs)
+
+    @classmethod
+    def from_page(cls, page, **kwargs) -> "CflowApiClient":
+        """Client sharing the session of a logged-in Playwright page."""
+        origin = "/".join(page.url.split("/")[:3])
+        return cls.from_cookies(origin, page.context.cookies(), **kwargs)
+
+    @classmethod
+    def local(cls, directory: LocalUserDirectory | None = None, **kwargs) -> "CflowApiClient":
+        """Offline client answered by an in-memory LocalUserDirectory."""
+        client = cls(cls.LOCAL_BASE_URL, **kwargs)
+        client.directory = directory or LocalUserDirectory()
+        client.session.mount(cls.LOCAL_BASE_URL, LocalCflowAdapter(client.directory))
+        return client
+
+    # ---------------------------------------------------------------
+    # Transport
+    # ---------------------------------------------------------------
+    def _call(self, method: str, endpoint: str, payload: dict | None = None, params: dict | None = None):
+        url = self.base_url + ReadConfig.getAPIEndpoint(endpoint)
+        try:
+            response = self.session.request(method, url, json=payload, params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise CflowApiError(f"❌ {method} {url} failed: {e}")
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"message": response.text[:200]}
+
+        if response.status_code >= 400 or body.get("status") == "error":
+            raise CflowApiError(
+                f"❌ {method} {endpoint} returned {response.status_code}: {body.get('message', body)}"
+            )
+        return body.get("data")
+
+    def _bulk(self, func, items: list) -> list:
+        """Run `func` for every item over the pooled connections, keeping the input order."""
+        with ThreadPoolExecutor(max_workers=self.pool_size) as pool:
+            return list(pool.map(func, items))
+
+    # ---------------------------------------------------------------
+    # Users
+    # ---------------------------------------------------------------
+    def create_user(self, user: dict) -> dict:
+        created = self._call("POST", "addUser", user)
+        log.info("✅ Created user via API: %s", user.get("loginId"))
+        return created
+
+    def set_user_status(self, login_id: str, active: bool) -> dict:
+        return self._call("POST", "userStatus", {"loginId": login_id, "status": active})
+
+    def disable_user(self, login_id: str) -> dict:
+        return self.set_user_status(login_id, False)
+
+    def enable_user(self, login_id: str) -> dict:
+        return self.set_user_status(login_id, True)
+
+    def reset_password(self, login_id: str, password: str) -> dict:
+        return self._call("POST", "resetPassword", {"loginId": login_id, "password": password})
+
+    def delete_user(self, login_id: str):
+        self._call("POST", "deleteUser", {"loginId": login_id})
+        log.info("🗑 Deleted user via API: %s", login_id)
+
+    def search_users(self, term: str = "", active_only: bool = False) -> list[dict]:
+        return self._call("GET", "searchUsers", params={"search": term, "activeOnly": str(active_only).lower()})
+
+    # ---------------------------------------------------------------
+    # Bulk Variants
+    # ---------------------------------------------------------------
+    def create_users(self, users: list[dict]) -> list[dict]:
+        return self._bulk(self.create_user, users)
+
+    def disable_users(self, login_ids: list[str]) -> list[dict]:
+        return self._bulk(self.disable_user, login_ids)
+
+    def enable_users(self, login_ids: list[str]) -> list[dict]:
+        return self._bulk(self.enable_user, login_ids)
+
+    def delete_users(self, login_ids: list[str]):
+        self._bulk(self.delete_user, login_ids)
+
+    def close(self):
+        self.session.close()
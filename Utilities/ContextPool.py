@@ -0,0 +1,138 @@
+import json
+from collections import deque
+from playwright.sync_api import Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
+from Utilities.AuthSession import AuthSessionCache
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("context_pool")
+
+
+class ContextPool:
+    """
+    Keeps `size` logged-in BrowserContexts parked on the dashboard and hands one to each test.
+
+    Contexts are created from the cached storage state and their navigation is only
+    *started* (not awaited), so the browser loads the next test's dashboard while the
+    current test is running. After a test the context is either reset and parked again
+    (recycle="reset") or closed and replaced by a fresh one (recycle="replace").
+    Failed tests always get their context replaced, since its state is unknown.
+
+    Every acquire tops the pool up: with "replace" to `size` parked contexts, with "reset"
+    to `size` contexts in total (parked + in use), so discarded contexts are made good.
+    """
+
+    RECYCLE_POLICIES = ("reset", "replace")
+
+    def __init__(self, browser: Browser, auth_cache: AuthSessionCache, size: int = 2,
+                 recycle: str = "reset", default_timeout: int = 10000, setup_context=None, **context_options):
+        if recycle not in self.RECYCLE_POLICIES:
+            raise ValueError(f"Unsupported recycle policy: {recycle} (use one of {self.RECYCLE_POLICIES})")
+
+        self.browser = browser
+        self.auth_cache = auth_cache
+        self.size = max(1, size)
+        self.recycle = recycle
+        self.default_timeout = default_timeout
+        self.setup_context = setup_context  # called with every new context (routing, tracing, ...)
+        self.context_options = context_options
+
+        self._ready: deque[tuple[BrowserContext, Page]] = deque()
+        self._in_use: set[Page] = set()
+
+        self.auth_cache.ensure_state(browser, **context_options)
+        self._fill()
+
+    # ---------------------------------------------------------------
+    # Warm-up
+    # ---------------------------------------------------------------
+    def _start_navigation(self, page: Page):
+        """Kick off navigation to the dashboard without waiting for it to load."""
+        page.evaluate("url => { window.location.href = url; }", self.auth_cache.landing_url())
+
+    def _warm_context(self) -> tuple[BrowserContext, Page]:
+        context = self.browser.new_context(storage_state=self.auth_cache.state_path, **self.context_options)
+        if self.setup_context:
+            self.setup_context(context)
+        page = context.new_page()
+        page.set_default_timeout(self.default_timeout)
+        self._start_navigation(page)
+        return context, page
+
+    def _fill(self):
+        target = self.size if self.recycle == "replace" else self.size - len(self._in_use)
+        while len(self._ready) < target:
+            self._ready.append(self._warm_context())
+
+    # ---------------------------------------------------------------
+    # Check-out / Check-in
+    # ---------------------------------------------------------------
+    def owns(self, page: Page) -> bool:
+        return page in self._in_use
+
+    def acquire(self) -> tuple[BrowserContext, Page]:
+        """Hand out the context that has been warming the longest."""
+        if not self._ready:
+            self._fill()
+        context, page = self._ready.popleft() if self._ready else self._warm_context()
+        self._in_use.add(page)
+        self._fill()  # replacements (and contexts discarded earlier) warm up while this test runs
+
+        try:
+            page.wait_for_url(f"**{self.auth_cache.DASHBOARD_FRAGMENT}**", wait_until="domcontentloaded")
+        except PlaywrightTimeoutError:
+            pass  # the probe below decides whether we need to log in again
+        if not self.auth_cache.is_logged_in(page):
+            log.warning("⚠️ Pooled session expired — logging in again")
+            self.auth_cache.authenticate(page)
+        return context, page
+
+    def release(self, context: BrowserContext, page: Page, failed: bool = False):
+        self._in_use.discard(page)
+
+        if self.recycle == "replace" or failed or page.is_closed():
+            context.close()
+            self._fill()
+            return
+
+        try:
+            self._reset(context, page)
+        except Exception as e:
+            log.warning("⚠️ Context reset failed, replacing it: %s", e)
+            context.close()
+            self._fill()
+            return
+
+        if len(self._ready) + len(self._in_use) < self.size:
+            self._ready.append((context, page))
+        else:
+            context.close()
+
+    def _reset(self, context: BrowserContext, page: Page):
+        """Close extra tabs, restore cookies and storage to the logged-in state and head back to the dashboard."""
+        for extra_page in context.pages:
+            if extra_page is not page:
+                extra_page.close()
+
+        with open(self.auth_cache.state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        context.clear_cookies()  # cookies the test set must not reach the next test
+        context.add_cookies(state.get("cookies", []))
+        origins = state.get("origins", [])
+        local_storage = next(
+            (o.get("localStorage", []) for o in origins if page.url.startswith(o["origin"])), []
+        )
+        page.evaluate(
+            """items => {
+                window.sessionStorage.clear();
+                window.localStorage.clear();
+                for (const {name, value} of items) window.localStorage.setItem(name, value);
+            }""",
+            local_storage,
+        )
+        self._start_navigation(page)
+
+    def close(self):
+        while self._ready:
+            context, _ = self._ready.popleft()
+            context.close()
@@ -0,0 +1,135 @@
+import time
+import weakref
+from collections import deque
+from Utilities.ScreenshotService import ScreenshotService
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("failure_artifacts")
+
+
+class FailureArtifacts:
+    """
+    One screenshot, DOM snapshot and console log per failing test.
+
+    A failure used to be photographed at every layer it passed through (inner branch,
+    outer `except`, the caller's `except`, ...). Now helpers only leave breadcrumbs via
+    take_screenshot(), which returns the path the screenshot *will* have, and conftest's
+    pytest_runtest_makereport calls `collect()` once when the test really failed; the
+    files are attached to the pytest-html report.
+
+    Only the test's own page (marked `deferred` by the page fixture) is left to conftest.
+    Any other page — a second login page, a page of new_context — is captured by its first
+    failure (capture_now), and conftest attaches those screenshots as well.
+
+    The locator of the first breadcrumb — the step that failed — clips the screenshot to
+    that element (see ScreenshotService.grab).
+
+    Console messages are recorded from the moment the page fixture opens the page.
+    The object holds no reference to its page, so closed pages are released.
+    """
+
+    CONSOLE_LIMIT = 200  # newest console lines kept per page
+
+    _pages: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _side_captures: list[tuple[str, bytes]] = []  # (path, image) of other pages, since the last drain
+
+    def __init__(self, page):
+        self.deferred = False  # True for the test's page: conftest collects it once the test failed
+        self.console: deque[str] = deque(maxlen=self.CONSOLE_LIMIT)
+        self.reset()
+        page.on("console", lambda message: self.console.append(f"[{message.type}] {message.text}"))
+        page.on("pageerror", lambda error: self.console.append(f"[pageerror] {error}"))
+
+    @classmethod
+    def for_page(cls, page) -> "FailureArtifacts":
+        """The page's artifacts (sync or async page), created on first use."""
+        artifacts = cls._pages.get(page)
+        if artifacts is None:
+            artifacts = cls._pages[page] = cls(page)
+        return artifacts
+
+    def reset(self) -> "FailureArtifacts":
+        """Start over for the next test (context-pool pages outlive a test)."""
+        self.breadcrumbs: list[str] = []
+        self.console.clear()
+        self.screenshot_path: str | None = None
+        self.locator = None  # the failed step's element; the screenshot is clipped to it
+        self.captured = False
+        self._start = time.perf_counter()
+        return self
+
+    # ---------------------------------------------------------------
+    # Breadcrumbs (cheap; recorded by helpers on every failure branch)
+    # ---------------------------------------------------------------
+    def breadcrumb(self, label: str, locator=None) -> str:
+        """Note where a helper gave up; returns the path of this test's failure screenshot."""
+        line = f"{time.perf_counter() - self._start:7.2f}s  {label}"
+        if locator is not None:
+            line += f"  ({locator})"
+            if self.locator is None:
+                self.locator = locator
+        self.breadcrumbs.append(line)
+        return self.reserve_path()
+
+    def reserve_path(self) -> str:
+        if self.screenshot_path is None:
+            self.screenshot_path = ScreenshotService.shared().next_path("Failure")
+        return self.screenshot_path
+
+    def log_text(self) -> str:
+        """Breadcrumbs followed by the recorded console output."""
+        lines = ["Breadcrumbs:"] + (self.breadcrumbs or ["  (none — failed outside the helpers)"])
+        lines += ["", f"Console (last {self.CONSOLE_LIMIT} lines):"] + (list(self.console) or ["  (empty)"])
+        return "\n".join(lines)
+
+    # ---------------------------------------------------------------
+    # Capture (once per failing test)
+    # ---------------------------------------------------------------
+    def capture_now(self, page):
+        """Screenshot a sync page conftest will not collect; only its first failure captures."""
+        if self.deferred or self.captured:
+            return
+        self.captured = True
+        service = ScreenshotService.shared()
+        try:
+            image = service.grab(page, self.locator)
+        except Exception as e:
+            log.warning("⚠ Failure screenshot not captured: %s", e)
+            return
+        FailureArtifacts._side_captures.append((service.save(image, path=self.reserve_path()), image))
+
+    @classmethod
+    def drain_side_captures(cls) -> list[tuple[str, bytes]]:
+        """Screenshots capture_now took since the last call (for the current test's report)."""
+        captures, cls._side_captures = cls._side_captures, []
+        return captures
+
+    def collect(self, page) -> dict:
+        """
+        Capture the artifacts of a failed test (sync page); later calls return {}.
+
+        Returns:
+            dict: screenshot / dom / log paths, plus `image` (bytes), `dom_html` and
+            `log` contents for the report. Parts the page can no longer give are left out.
+        """
+        if self.captured:
+            return {}
+        self.captured = True
+        service = ScreenshotService.shared()
+        path = self.reserve_path()
+        base = path.rsplit(".", 1)[0]
+        text = self.log_text()
+        result = {"log": text, "log_path": service.save(text.encode(), path=f"{base}.log")}
+
+        try:
+            result["image"] = service.grab(page, self.locator)
+            result["screenshot"] = service.save(result["image"], path=path)
+        except Exception as e:
+            log.warning("⚠ Failure screenshot not captured: %s", e)
+        try:
+            result["dom_html"] = page.content()
+            result["dom"] = service.save(result["dom_html"].encode(), path=f"{base}.html")
+        except Exception as e:
+            log.warning("⚠ DOM snapshot not captured: %s", e)
+        return result
@@ -0,0 +1,152 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from logging.handlers import MemoryHandler
+from Utilities.RunCache import RunCache
+
+
+ROOT_LOGGER = "cflow"
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Framework logger (child of "cflow"); use lazy formatting: log.info("Clicked: %s", what)."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def step_fields(step: str, start: float) -> dict:
+    """`extra=` for a timed step record: step name and ms since `start` (time.perf_counter())."""
+    return {"step": step, "duration_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+
+@dataclass
+class LogStats:
+    """Records of this process by level, and the timed steps among them."""
+    records: int = 0
+    warnings: int = 0
+    errors: int = 0
+    steps: int = 0
+    step_ms: float = 0.0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()  # async flows log from their own thread
+
+    def record(self, record: logging.LogRecord):
+        with self._lock:
+            self.records += 1
+            self.warnings += record.levelno == logging.WARNING
+            self.errors += record.levelno >= logging.ERROR
+            if getattr(record, "duration_ms", None) is not None:
+                self.steps += 1
+                self.step_ms += record.duration_ms
+
+    def summary(self) -> str:
+        return (f"{self.records} records ({self.warnings} warnings, {self.errors} errors); "
+                f"{self.steps} steps took {self.step_ms / 1000:.1f}s")
+
+
+class _TestContext(logging.Filter):
+    """Stamps the running test on each record when it is logged (the file is written later)."""
+
+    def __init__(self, stats: LogStats):
+        super().__init__()
+        self.stats = stats
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.test = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0]
+        record.worker = RunCache.worker_id()
+        self.stats.record(record)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": getattr(record, "worker", None),
+            "test": getattr(record, "test", None),
+            "step": getattr(record, "step", None),
+            "duration_ms": getattr(record, "duration_ms", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """Writes to the current sys.stdout, so pytest's output capture still sees the lines."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class FrameworkLog:
+    """
+    Logging for helpers and page objects, set up once per process by conftest.
+
+    - File sink: <directory>/<run id>/<worker>.jsonl, one JSON object per record with the
+      test id, step and duration. Records are buffered in memory and written in batches
+      (immediately on ERROR, and at session end).
+    - Console: warnings and errors only, plus the summary at session end. With verbose=True
+      (--verbose-actions) every action is echoed like the old print() output and DEBUG
+      records (per-field comparisons) are kept too.
+
+    Records also propagate to pytest's log capture, so a failing test's report shows its steps.
+    """
+
+    BUFFER_RECORDS = 500
+
+    stats = LogStats()
+    path: str | None = None
+    _handlers: list[logging.Handler] = []
+
+    @classmethod
+    def configure(cls, directory: str = "Logs", verbose: bool = False) -> str:
+        cls.close()
+        logger = logging.getLogger(ROOT_LOGGER)
+        logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+        run_dir = os.path.join(directory, RunCache.run_id())
+        os.makedirs(run_dir, exist_ok=True)
+        cls.path = os.path.join(run_dir, f"{RunCache.worker_id()}.jsonl")
+        target = logging.FileHandler(cls.path, encoding="utf-8", delay=True)
+        target.setFormatter(JsonLinesFormatter())
+        buffer = MemoryHandler(cls.BUFFER_RECORDS, flushLevel=logging.ERROR, target=target)
+        buffer.addFilter(_TestContext(cls.stats))
+
+        console = _ConsoleHandler()
+        console.setLevel(logging.DEBUG if verbose else logging.WARNING)
+        console.setFormatter(logging.Formatter("%(message)s"))
+
+        cls._handlers = [buffer, console]
+        for handler in cls._handlers:
+            logger.addHandler(handler)
+        return cls.path
+
+    @classmethod
+    def flush(cls):
+        for handler in cls._handlers:
+            handler.flush()
+
+    @classmethod
+    def close(cls):
+        """Write what is buffered and detach the handlers."""
+        logger = logging.getLogger(ROOT_LOGGER)
+        for handler in cls._handlers:
+            logger.removeHandler(handler)
+            target = getattr(handler, "target", None)
+            handler.close()  # a MemoryHandler writes its buffer to the file here
+            if target:
+                target.close()
+        cls._handlers = []
@@ -0,0 +1,56 @@
+import os
+import random
+from playwright.sync_api import BrowserContext
+from Utilities.RunCache import RunCache
+
+
+class HarArchive:
+    """
+    Per-test HAR record / replay.
+
+    mode="record" : every test's context records its traffic to <har_dir>/<region>/<test>.zip
+    mode="replay" : the context is served from that archive (route_from_har); anything not in
+                    the archive is aborted, so the run never touches the network
+    mode="off"    : normal live run
+
+    Test data generators (random names, login IDs, employee numbers, passwords) draw from
+    the `random` module; it is seeded with the test id in both modes, so the replayed test
+    sends exactly the requests that were recorded.
+    """
+
+    MODES = ("off", "record", "replay")
+
+    def __init__(self, mode: str, har_dir: str, region: str):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported HAR mode: {mode} (use one of {self.MODES})")
+        self.mode = mode
+        self.har_dir = os.path.join(har_dir, region)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def path_for(self, nodeid: str) -> str:
+        return os.path.join(self.har_dir, f"{RunCache.safe_name(nodeid)}.zip")
+
+    def seed(self, nodeid: str):
+        """Make the random test data of `nodeid` identical between record and replay."""
+        random.seed(nodeid)
+
+    def context_options(self, nodeid: str) -> dict:
+        """Extra browser.new_context() options for the test."""
+        if self.mode != "record":
+            return {}
+        os.makedirs(self.har_dir, exist_ok=True)
+        return {"record_har_path": self.path_for(nodeid), "record_har_mode": "full"}
+
+    def attach(self, context: BrowserContext, nodeid: str):
+        """Serve the context from the test's recorded archive (replay mode)."""
+        if self.mode != "replay":
+            return
+        har_path = self.path_for(nodeid)
+        if not os.path.exists(har_path):
+            raise FileNotFoundError(
+                f"❌ No HAR recorded for {nodeid}: {har_path}. Run once with --har-mode=record."
+            )
+        context.route_from_har(har_path, not_found="abort")
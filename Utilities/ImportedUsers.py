@@ -0,0 +1,78 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from openpyxl import load_workbook
+
+
+@dataclass(frozen=True)
+class ImportedUser:
+    """One row of the user import sheet, as the Add User form should show it."""
+    name: str
+    login_id: str
+    email: str
+    role: str
+    whatsapp: str
+    emp_no: str
+    department: str
+
+    # Sheet column -> field
+    COLUMNS = {
+        "Name": "name",
+        "Login ID": "login_id",
+        "Email": "email",
+        "Role": "role",
+        "WhatsApp Number": "whatsapp",
+        "Employee Number": "emp_no",
+        "Department": "department",
+    }
+
+    def by_column(self) -> dict[str, str]:
+        """Values keyed by sheet column ("Name", "Login ID", ...)."""
+        return {column: getattr(self, attribute) for column, attribute in self.COLUMNS.items()}
+
+
+class ImportedUserReader:
+    """
+    Streams the users of an import .xlsx, one ImportedUser per data row.
+
+    The workbook is opened in openpyxl's read-only mode and rows are parsed as they are
+    iterated, so memory stays flat for 10k+ row files and the caller can verify the first
+    user before the last row is read. The header row is checked once; columns are matched
+    by name, in any order, and extra columns are ignored. Blank rows are skipped.
+    """
+
+    def __init__(self, path: str, sheet: str | None = None):
+        self.path = path
+        self.sheet = sheet
+        self.rows_read = 0
+
+    @staticmethod
+    def cell_text(value) -> str:
+        """Cell value as the form shows it (numbers stored as numbers lose the trailing .0)."""
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip()
+
+    def _column_indexes(self, header: tuple) -> dict[str, int]:
+        header = [self.cell_text(cell) for cell in header]
+        missing = [column for column in ImportedUser.COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"Missing columns in {self.path}: {', '.join(missing)} (found: {header})")
+        return {column: header.index(column) for column in ImportedUser.COLUMNS}
+
+    def __iter__(self) -> Iterator[ImportedUser]:
+        workbook = load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[self.sheet] if self.sheet else workbook.active
+            rows = worksheet.iter_rows(values_only=True)
+            indexes = self._column_indexes(next(rows, ()))
+            for row in rows:
+                values = {ImportedUser.COLUMNS[column]: self.cell_text(row[i]) if i < len(row) else ""
+                          for column, i in indexes.items()}
+                if not any(values.values()):
+                    continue
+                self.rows_read += 1
+                yield ImportedUser(**values)
+        finally:
+            workbook.close()
@@ -0,0 +1,570 @@
+/*
+ * Local Cflow stand-in — page script.
+ *
+ * Renders the login page, dashboard, admin user grid, Add / Edit User drawer, Excel import
+ * and the Employees lookup with the same markup the suite's locators expect
+ * (formcontrolname inputs, ng-select, #toast-container, swal2 popup, ...).
+ * Settings come from window.CFLOW_CONFIG, written into the page by LocalCflowServer.
+ */
+(function () {
+    "use strict";
+
+    const CFG = window.CFLOW_CONFIG;
+    const SPECIAL = "!@#$%^&*";
+
+    // ---------------------------------------------------------------
+    // Helpers
+    // ---------------------------------------------------------------
+    function esc(value) {
+        return String(value == null ? "" : value).replace(/[&<>"']/g, (c) => (
+            {"&": "&amp;", "<": "&lt;", ">": "&gt;", "\"": "&quot;", "'": "&#39;"}[c]
+        ));
+    }
+
+    function el(html) {
+        const template = document.createElement("template");
+        template.innerHTML = html.trim();
+        return template.content.firstElementChild;
+    }
+
+    // Angular testability stand-in (what Protractor / --angular-stable wait on): the app is
+    // stable when no API call is pending and the caller has rendered its result.
+    const testability = {
+        pending: 0,
+        callbacks: [],
+        isStable() {
+            return this.pending === 0;
+        },
+        whenStable(callback) {
+            if (this.isStable()) {
+                setTimeout(callback, 0);
+            } else {
+                this.callbacks.push(callback);
+            }
+        },
+        done() {
+            this.pending--;
+            while (this.isStable() && this.callbacks.length) {
+                this.callbacks.shift()();
+            }
+        },
+    };
+    window.getAllAngularTestabilities = () => [testability];
+
+    async function api(name, options) {
+        testability.pending++;
+        try {
+            return await callApi(name, options);
+        } finally {
+            setTimeout(() => testability.done(), 0);  // after the caller's render continuation
+        }
+    }
+
+    async function callApi(name, options) {
+        const opts = options || {};
+        let url = CFG.api[name];
+        if (opts.params) {
+            url += "?" + new URLSearchParams(opts.params);
+        }
+        const request = {method: opts.method || "GET", credentials: "same-origin", headers: {}};
+        if (opts.body instanceof ArrayBuffer) {
+            request.body = opts.body;
+            request.headers["Content-Type"] = "application/octet-stream";
+        } else if (opts.body !== undefined) {
+            request.body = JSON.stringify(opts.body);
+            request.headers["Content-Type"] = "application/json";
+        }
+
+        const response = await fetch(url, request);
+        let payload;
+        try {
+            payload = await response.json();
+        } catch (e) {
+            payload = {status: "error", message: response.statusText};
+        }
+        if (!response.ok || payload.status === "error") {
+            throw new Error(payload.message || ("HTTP " + response.status));
+        }
+        return payload.data;
+    }
+
+    // ngx-toastr: newest on top, removed after CFG.toastTimeout
+    function toast(message, type) {
+        const item = el(`<div class="toast toast-${type}" role="alert">` +
+                        `<div class="toast-message">${esc(message)}</div></div>`);
+        document.getElementById("toast-container").prepend(item);
+        setTimeout(() => item.remove(), CFG.toastTimeout);
+    }
+
+    // ---------------------------------------------------------------
+    // Password Policy
+    // ---------------------------------------------------------------
+    function ruleSatisfied(rule, password) {
+        switch (rule.key) {
+            case "min": return password.length >= rule.value;
+            case "max": return password.length <= rule.value;
+            case "number": return /[0-9]/.test(password);
+            case "uppercase": return /[A-Z]/.test(password);
+            case "lowercase": return /[a-z]/.test(password);
+            case "special": return [...password].some((c) => SPECIAL.includes(c));
+            default: return true;
+        }
+    }
+
+    function passwordValid(password) {
+        return CFG.passwordPolicy.every((rule) => ruleSatisfied(rule, password));
+    }
+
+    // <cf-password-policy-validate>: unmet rules are listed while the field has a value
+    function passwordPolicyHints(input) {
+        const host = el(`<cf-password-policy-validate><div class="password-validation" hidden><ul>` +
+            CFG.passwordPolicy.map((rule) => `<li data-rule="${rule.key}">${esc(rule.text)}</li>`).join("") +
+            `</ul></div></cf-password-policy-validate>`);
+        const container = host.querySelector(".password-validation");
+        const update = () => {
+            container.hidden = !input.value;
+            host.querySelectorAll("li").forEach((li, i) => {
+                const met = ruleSatisfied(CFG.passwordPolicy[i], input.value);
+                li.classList.toggle("valid", met);
+                li.classList.toggle("invalid", !met);
+                li.hidden = met;
+            });
+        };
+        input.addEventListener("input", update);
+        update();
+        return host;
+    }
+
+    // ---------------------------------------------------------------
+    // ng-select (single / multiple)
+    // ---------------------------------------------------------------
+    function ngSelect(name, options, multiple, placeholder) {
+        const host = el(`<ng-select formcontrolname="${name}" class="ng-select ${multiple ? "ng-select-multiple" : "ng-select-single"}">` +
+                        `<div class="ng-select-container"><div class="ng-value-container"></div></div></ng-select>`);
+        host.ngValue = [];
+
+        const render = () => {
+            const values = host.querySelector(".ng-value-container");
+            values.innerHTML = host.ngValue.length
+                ? host.ngValue.map((v) => `<div class="ng-value">` +
+                    (multiple ? `<span class="ng-value-icon left" data-value="${esc(v)}">×</span>` : "") +
+                    `<span class="ng-value-label">${esc(v)}</span></div>`).join("")
+                : `<div class="ng-placeholder">${esc(placeholder)}</div>`;
+        };
+        const close = () => host.querySelectorAll("ng-dropdown-panel").forEach((panel) => panel.remove());
+        const open = () => {
+            host.append(el(`<ng-dropdown-panel class="ng-dropdown-panel ng-star-inserted ng-select-bottom">` +
+                `<div class="ng-dropdown-panel-items scroll-host" role="listbox">` +
+                options.map((o) => `<div class="ng-option${host.ngValue.includes(o) ? " ng-option-selected" : ""}" ` +
+                    `role="option" data-value="${esc(o)}"><span class="ng-option-label">${esc(o)}</span></div>`).join("") +
+                `</div></ng-dropdown-panel>`));
+        };
+
+        host.setValue = (values) => {
+            host.ngValue = (values || []).filter((v) => v !== "");
+            render();
+        };
+        host.addEventListener("click", (event) => {
+            const remove = event.target.closest(".ng-value-icon");
+            const option = event.target.closest(".ng-option");
+            if (remove) {
+                host.setValue(host.ngValue.filter((v) => v !== remove.dataset.value));
+            } else if (option) {
+                const value = option.dataset.value;
+                if (!multiple) {
+                    host.setValue([value]);
+                } else if (host.ngValue.includes(value)) {
+                    host.setValue(host.ngValue.filter((v) => v !== value));
+                } else {
+                    host.setValue(host.ngValue.concat(value));
+                }
+                close();
+            } else if (host.querySelector("ng-dropdown-panel")) {
+                close();
+            } else {
+                open();
+            }
+        });
+        render();
+        return host;
+    }
+
+    // Clicking anywhere else closes open dropdowns
+    document.addEventListener("click", (event) => {
+        document.querySelectorAll("ng-dropdown-panel").forEach((panel) => {
+            if (!panel.parentElement.contains(event.target)) {
+                panel.remove();
+            }
+        });
+    });
+
+    // ---------------------------------------------------------------
+    // Login
+    // ---------------------------------------------------------------
+    function renderLogin(root) {
+        root.innerHTML = `
+            <div class="login-card">
+                <h2>Sign in to Cflow</h2>
+                <input id="client-id" type="text" placeholder="Client ID">
+                <input id="username" type="text" placeholder="Username">
+                <input id="password" type="password" placeholder="Password">
+                <button type="button" class="button-primary" id="btn-login">Login</button>
+            </div>`;
+
+        const submit = async () => {
+            try {
+                const data = await api("login", {method: "POST", body: {
+                    clientId: root.querySelector("#client-id").value,
+                    username: root.querySelector("#username").value,
+                    password: root.querySelector("#password").value,
+                }});
+                window.location.href = data.redirect;
+            } catch (e) {
+                toast(e.message, "error");
+            }
+        };
+        root.querySelector("#btn-login").addEventListener("click", submit);
+        root.querySelector("#password").addEventListener("keydown", (e) => {
+            if (e.key === "Enter") {
+                submit();
+            }
+        });
+    }
+
+    function renderShell(root) {
+        root.innerHTML = `
+            <div class="layout">
+                <nav class="side-nav">
+                    <a href="${CFG.landing}">Home</a>
+                    <a href="/cflow/user-role-permission">Admin</a>
+                    <a href="/cflow/lookups">Lookups</a>
+                </nav>
+                <main class="content" id="content"></main>
+            </div>`;
+        return root.querySelector("#content");
+    }
+
+    function renderDashboard(content) {
+        content.innerHTML = `<h2>Dashboard</h2><div class="welcome">Welcome, ${esc(CFG.user)}</div>`;
+    }
+
+    // ---------------------------------------------------------------
+    // Admin: User Grid
+    // ---------------------------------------------------------------
+    function renderAdmin(content) {
+        content.innerHTML = `
+            <div class="admin-header">
+                <label class="radio"><input type="radio" name="user-filter" value="active" checked><span>Active Users</span></label>
+                <label class="radio"><input type="radio" name="user-filter" value="all"><span>All Users</span></label>
+                <input id="search-user-grid-records" type="text" placeholder="Search users">
+                <button type="button" id="btn-import"><span>Import</span></button>
+                <button type="button" class="button-primary" id="btn-add-user">Add User</button>
+            </div>
+            <div class="admin-grid" id="admin-grid"></div>`;
+
+        const grid = content.querySelector("#admin-grid");
+        const search = content.querySelector("#search-user-grid-records");
+        let users = [];
+        let latest = 0;
+
+        const load = async () => {
+            const requestNo = ++latest;
+            const activeOnly = content.querySelector("input[name=user-filter]:checked").value === "active";
+            const data = await api("searchUsers", {params: {search: search.value, activeOnly: String(activeOnly)}});
+            if (requestNo !== latest) {
+                return;  // a newer search is on its way
+            }
+            users = data;
+            grid.innerHTML = users.map((u, i) => `
+                <div class="admin-grid-item" data-index="${i}">
+                    <div class="grid-info"><p>${esc(u.name)}</p><span class="grid-sub">${esc(u.loginId)}</span></div>
+                    <label class="switch"><input type="checkbox" aria-label="User Status"${u.status ? " checked" : ""}><span class="slider"></span></label>
+                </div>`).join("");
+        };
+
+        search.addEventListener("keydown", (e) => {
+            if (e.key === "Enter") {
+                load();
+            }
+        });
+        content.querySelectorAll("input[name=user-filter]").forEach((radio) => radio.addEventListener("change", load));
+        content.querySelector("#btn-add-user").addEventListener("click", () => openUserDrawer(null, load));
+        content.querySelector("#btn-import").addEventListener("click", () => openImportDialog(load));
+
+        grid.addEventListener("click", (event) => {
+            const item = event.target.closest(".admin-grid-item");
+            if (!item) {
+                return;
+            }
+            const user = users[Number(item.dataset.index)];
+            const toggle = event.target.closest("label.switch");
+            if (toggle) {
+                event.preventDefault();  // the status only changes once confirmed
+                confirmStatusChange(user, toggle.querySelector("input"));
+            } else if (event.target.closest("p")) {
+                openUserDrawer(user, load);
+            }
+        });
+
+        load();
+    }
+
+    function confirmStatusChange(user, checkbox) {
+        const activate = !checkbox.checked;
+        const dialog = el(`
+            <div class="backdrop">
+                <div class="dialog">
+                    <h3>${activate ? "Activate" : "Deactivate"} user</h3>
+                    <div>Are you sure you want to ${activate ? "activate" : "deactivate"} ${esc(user.name)}?</div>
+                    <div class="drawer-footer">
+                        <button type="button" class="button-light">No</button>
+                        <button type="button" class="button-danger">Yes</button>
+                    </div>
+                </div>
+            </div>`);
+        dialog.querySelector(".button-light").addEventListener("click", () => dialog.remove());
+        dialog.querySelector(".button-danger").addEventListener("click", async () => {
+            dialog.remove();
+            try {
+                const updated = await api("userStatus", {method: "POST", body: {loginId: user.loginId, status: activate}});
+                user.status = updated.status;
+                checkbox.checked = updated.status;
+                toast("User status updated successfully", "success");
+            } catch (e) {
+                toast(e.message, "error");
+            }
+        });
+        document.body.append(dialog);
+    }
+
+    // ---------------------------------------------------------------
+    // Admin: Add / Edit User Drawer
+    // ---------------------------------------------------------------
+    function openUserDrawer(user, onSaved) {
+        const editing = Boolean(user);
+        const field = (name, label, type) => `
+            <div class="form-field"><label>${label}</label>
+                <input type="${type || "text"}" formcontrolname="${name}" autocomplete="off"></div>`;
+        const toggleItem = (name, label, checked) => `
+            <div class="item"><label>${label}</label>
+                <label class="switch"><input type="checkbox" formcontrolname="${name}"${checked ? " checked" : ""}><span class="slider"></span></label></div>`;
+
+        const drawer = el(`
+            <div class="backdrop">
+                <aside class="drawer" role="dialog">
+                    <div class="drawer-header">
+                        <h3>${editing ? "User Details" : "Add User"}</h3>
+                        <a aria-label="Close">×</a>
+                    </div>
+                    <form class="user-form" novalidate>
+                        ${field("name", "Name")}
+                        ${field("department", "Department")}
+                        ${field("email", "Email", "email")}
+                        ${field("loginId", "Login ID")}
+                        <div class="form-field" id="password-field"><label>Password</label>
+                            <input type="password" formcontrolname="password" autocomplete="new-password"></div>
+                        ${field("empNo", "Employee Number")}
+                        <div class="form-field" id="role-field"><label>Role</label></div>
+                        <div class="form-field"><label>WhatsApp Number</label>
+                            <div class="d-flex" id="whatsapp-field">
+                                <input type="text" formcontrolname="whatsappNo" autocomplete="off">
+                            </div>
+                        </div>
+                        ${editing ? "" : toggleItem("sendMail", "Send welcome mail to the user?", false)}
+                        ${editing ? "" : toggleItem("status", "Status", true)}
+                    </form>
+                    <div class="drawer-footer">
+                        ${editing ? `<a class="footer-icon txt-primary" title="Reset Password">Reset Password</a>` : "<span></span>"}
+                        ${editing ? "" : `<button type="button" class="button-primary btn-save">Save</button>`}
+                    </div>
+                    <div class="reset-password" hidden>
+                        <label>New Password</label>
+                        <input type="password" name="reset=password-user" autocomplete="new-password">
+                        <button type="button" class="button-primary">Update</button>
+                    </div>
+                </aside>
+            </div>`);
+
+        const control = (name) => drawer.querySelector(`[formcontrolname="${name}"]`);
+        // Angular form-control state classes: pristine until the user types
+        drawer.querySelectorAll("input[formcontrolname]").forEach((input) => {
+            input.classList.add("ng-untouched", "ng-pristine");
+            input.addEventListener("input", () => input.classList.replace("ng-pristine", "ng-dirty"));
+            input.addEventListener("blur", () => input.classList.replace("ng-untouched", "ng-touched"));
+        });
+        const password = control("password");
+        password.after(passwordPolicyHints(password));
+
+        const roles = ngSelect("role", CFG.roles, true, "Select Role");
+        drawer.querySelector("#role-field").append(roles);
+        const countryCode = ngSelect("countryCode", CFG.countryCodes, false, "Code");
+        drawer.querySelector("#whatsapp-field").prepend(countryCode);
+
+        if (editing) {
+            ["name", "department", "email", "loginId", "empNo", "whatsappNo"].forEach((name) => {
+                control(name).value = user[name] || "";
+            });
+            roles.setValue(user.role);
+            countryCode.setValue([user.countryCode]);
+        }
+
+        drawer.querySelector("a[aria-label=Close]").addEventListener("click", () => drawer.remove());
+
+        const save = drawer.querySelector(".btn-save");
+        if (save) {
+            save.addEventListener("click", async () => {
+                const data = {};
+                ["name", "department", "email", "loginId", "password", "empNo", "whatsappNo"].forEach((name) => {
+                    data[name] = control(name).value.trim();
+                });
+                data.role = roles.ngValue;
+                data.countryCode = countryCode.ngValue[0] || "";
+                data.sendMail = control("sendMail").checked;
+                data.status = control("status").checked;
+
+                const missing = ["name", "email", "loginId", "password"].filter((name) => !data[name]);
+                if (missing.length || !data.role.length) {
+                    toast("Please fill all the mandatory fields", "warning");
+                    return;
+                }
+                if (!passwordValid(data.password)) {
+                    toast("Password does not meet the password policy", "warning");
+                    return;
+                }
+                try {
+                    await api("addUser", {method: "POST", body: data});
+                    toast("User Added Successfully", "success");
+                    drawer.remove();
+                    onSaved();
+                } catch (e) {
+                    toast(e.message, "error");
+                }
+            });
+        }
+
+        const reset = drawer.querySelector(".reset-password");
+        const resetLink = drawer.querySelector(".footer-icon");
+        if (resetLink) {
+            resetLink.addEventListener("click", () => {
+                reset.hidden = false;
+            });
+            reset.querySelector("button").addEventListener("click", async () => {
+                const newPassword = reset.querySelector("input").value;
+                if (!passwordValid(newPassword)) {
+                    toast("Password does not meet the password policy", "warning");
+                    return;
+                }
+                try {
+                    await api("resetPassword", {method: "POST", body: {loginId: user.loginId, password: newPassword}});
+                    toast("Password Updated Successfully", "success");
+                } catch (e) {
+                    toast(e.message, "error");
+                }
+            });
+        }
+
+        document.body.append(drawer);
+    }
+
+    // ---------------------------------------------------------------
+    // Admin: Excel Import
+    // ---------------------------------------------------------------
+    function openImportDialog(onImported) {
+        const dialog = el(`
+            <div class="backdrop">
+                <div class="dialog">
+                    <div class="drawer-header"><h3>Import Users</h3><a aria-label="Close">×</a></div>
+                    <input type="file" id="file" accept=".xlsx">
+                    <button type="button" class="button-primary">Upload</button>
+                </div>
+            </div>`);
+        dialog.querySelector("a[aria-label=Close]").addEventListener("click", () => dialog.remove());
+        dialog.querySelector("button").addEventListener("click", async () => {
+            const file = dialog.querySelector("#file").files[0];
+            if (!file) {
+                toast("Please choose a file to upload", "warning");
+                return;
+            }
+            try {
+                const summary = await api("importUsers", {method: "POST", body: await file.arrayBuffer()});
+                dialog.remove();
+                toast(`Imported ${summary.imported.length} users successfully`, "success");
+                showImportSummary(summary);
+                onImported();
+            } catch (e) {
+                toast(e.message, "error");
+            }
+        });
+        document.body.append(dialog);
+    }
+
+    // SweetAlert2-style summary, closed by OK or after CFG.importSummaryTimer
+    function showImportSummary(summary) {
+        const lines = [`<b>Import Summary</b>`, `Imported ${summary.imported.length} user(s).`];
+        if (summary.existing.length) {
+            lines.push(`Found ${summary.existing.length} existing user(s): ${esc(summary.existing.join(", "))}`);
+        }
+        if (summary.rejected.length) {
+            lines.push(`Skipped ${summary.rejected.length} row(s): ${esc(summary.rejected.join("; "))}`);
+        }
+        const popup = el(`
+            <div class="swal2-container swal2-center swal2-backdrop-show">
+                <div class="swal2-popup swal2-modal swal2-show" role="dialog">
+                    <h2 class="swal2-title">Import Users</h2>
+                    <div class="swal2-html-container" id="swal2-html-container">${lines.join("<br>")}</div>
+                    <div class="swal2-actions"><button type="button" class="swal2-confirm swal2-styled">OK</button></div>
+                </div>
+            </div>`);
+        const close = () => popup.remove();
+        popup.querySelector(".swal2-confirm").addEventListener("click", close);
+        setTimeout(close, CFG.importSummaryTimer);
+        document.body.append(popup);
+    }
+
+    // ---------------------------------------------------------------
+    // Lookups
+    // ---------------------------------------------------------------
+    function renderLookups(content) {
+        content.innerHTML = `
+            <h2>Lookups</h2>
+            <a class="lookup-card" href="/cflow/lookups/employees"><p>Employees</p></a>`;
+    }
+
+    async function renderEmployees(content) {
+        const columns = ["ID", "Employee No", "Employee Name", "Login ID", "Email ID", "Department",
+                         "Created By", "Created Date", "Updated By", "Updated Date"];
+        content.innerHTML = `
+            <h2>Employees</h2>
+            <table class="lookup-table">
+                <thead><tr><th><input type="checkbox" aria-label="Select all"></th><th>Actions</th>
+                    ${columns.map((c) => `<th>${c}</th>`).join("")}</tr></thead>
+                <tbody></tbody>
+            </table>`;
+
+        const users = await api("searchUsers", {params: {search: "", activeOnly: "false"}});
+        content.querySelector("tbody").innerHTML = users.map((u) => `
+            <tr>
+                <td><input type="checkbox" aria-label="Select row"></td><td><a class="txt-primary">Edit</a></td>
+                <td>${u.id}</td><td>${esc(u.empNo)}</td><td>${esc(u.name)}</td><td>${esc(u.loginId)}</td>
+                <td>${esc(u.email)}</td><td>${esc(u.department)}</td><td>${esc(u.createdBy)}</td>
+                <td>${esc(u.createdDate)}</td><td>${esc(u.updatedBy)}</td><td>${esc(u.updatedDate)}</td>
+            </tr>`).join("");
+    }
+
+    // ---------------------------------------------------------------
+    // Routing (one page per path; navigation is full page loads)
+    // ---------------------------------------------------------------
+    const root = document.getElementById("root");
+    const path = window.location.pathname.replace(/\/$/, "");
+    const pages = {
+        "/cflow/user-role-permission": renderAdmin,
+        "/cflow/lookups": renderLookups,
+        "/cflow/lookups/employees": renderEmployees,
+    };
+
+    if (path === CFG.loginPath) {
+        renderLogin(root);
+    } else {
+        (pages[path] || renderDashboard)(renderShell(root));
+    }
+})();
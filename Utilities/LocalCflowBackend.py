@@ -0,0 +1,145 @@
+import io
+import json
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+import requests
+from requests.adapters import BaseAdapter
+from Utilities.ReadProperties import ReadConfig
+
+
+class LocalUserDirectory:
+    """
+    In-memory stand-in for the Cflow user backend.
+    Implements the same endpoints (config.ini [API]) and the same duplicate checks as the
+    real tenant, so API clients and tests can run without a live *.cflowapps.com account.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users: dict[str, dict] = {}  # loginId -> user
+        self._next_id = 1
+
+    # ---------------------------------------------------------------
+    # User Operations
+    # ---------------------------------------------------------------
+    def add_user(self, user: dict) -> dict:
+        with self._lock:
+            login_id = str(user.get("loginId", "")).strip()
+            emp_no = str(user.get("empNo", "")).strip()
+            if not login_id or not str(user.get("name", "")).strip():
+                raise ValueError("Name and Login ID are required")
+            if login_id.lower() in (k.lower() for k in self._users):
+                raise ValueError("Username Already Exist")
+            if emp_no and any(u["empNo"] == emp_no for u in self._users.values()):
+                raise ValueError("Employee No Already Exist")
+
+            now = time.strftime("%d-%m-%Y %H:%M")
+            record = {
+                "id": self._next_id,
+                "name": str(user["name"]).strip(),
+                "department": str(user.get("department", "")),
+                "email": str(user.get("email", "")),
+                "loginId": login_id,
+                "password": str(user.get("password", "")),
+                "empNo": emp_no,
+                "role": list(user.get("role") or ["User"]),
+                "countryCode": str(user.get("countryCode", "+91")),
+                "whatsappNo": str(user.get("whatsappNo", "")),
+                "status": bool(user.get("status", True)),
+                "sendMail": bool(user.get("sendMail", False)),
+                "createdBy": "Admin", "createdDate": now, "updatedBy": "Admin", "updatedDate": now,
+            }
+            self._next_id += 1
+            self._users[login_id] = record
+            return dict(record)
+
+    def find_user(self, login_id: str) -> dict | None:
+        with self._lock:
+            user = self._users.get(login_id)
+            return dict(user) if user else None
+
+    def set_status(self, login_id: str, active: bool) -> dict:
+        with self._lock:
+            if login_id not in self._users:
+                raise KeyError(f"User '{login_id}' not found")
+            self._users[login_id]["status"] = bool(active)
+            self._users[login_id]["updatedDate"] = time.strftime("%d-%m-%Y %H:%M")
+            return dict(self._users[login_id])
+
+    def set_password(self, login_id: str, password: str) -> dict:
+        with self._lock:
+            user = self._users.get(login_id)
+            if not user:
+                raise KeyError(f"User '{login_id}' not found")
+            if user["password"] == password:
+                raise ValueError("Old password cannot be reused. Please create a new password")
+            user["password"] = password
+            return dict(user)
+
+    def delete_user(self, login_id: str):
+        with self._lock:
+            if self._users.pop(login_id, None) is None:
+                raise KeyError(f"User '{login_id}' not found")
+
+    def search(self, term: str = "", active_only: bool = False) -> list[dict]:
+        """Users whose name or login ID contains `term`, newest first."""
+        term = term.strip().lower()
+        with self._lock:
+            users = [
+                dict(u) for u in self._users.values()
+                if (not term or term in u["name"].lower() or term in u["loginId"].lower())
+                and (u["status"] or not active_only)
+            ]
+        return sorted(users, key=lambda u: u["id"], reverse=True)
+
+    # ---------------------------------------------------------------
+    # HTTP Dispatch (shared by the requests adapter and the local server)
+    # ---------------------------------------------------------------
+    def handle(self, method: str, path: str, query: dict, body: dict) -> tuple[int, dict]:
+        """Serve one API call. Returns (HTTP status, JSON payload)."""
+        endpoints = {
+            ("POST", ReadConfig.getAPIEndpoint("addUser")): lambda: self.add_user(body),
+            ("POST", ReadConfig.getAPIEndpoint("userStatus")):
+                lambda: self.set_status(body["loginId"], body["status"]),
+            ("POST", ReadConfig.getAPIEndpoint("resetPassword")):
+                lambda: self.set_password(body["loginId"], body["password"]),
+            ("POST", ReadConfig.getAPIEndpoint("deleteUser")): lambda: self.delete_user(body["loginId"]),
+            ("GET", ReadConfig.getAPIEndpoint("searchUsers")):
+                lambda: self.search(query.get("search", ""), query.get("activeOnly") == "true"),
+        }
+        handler = endpoints.get((method.upper(), path))
+        if handler is None:
+            return 404, {"status": "error", "message": f"No endpoint {method} {path}"}
+        try:
+            return 200, {"status": "success", "message": "Success", "data": handler()}
+        except ValueError as e:
+            return 400, {"status": "error", "message": str(e)}
+        except KeyError as e:
+            return 404, {"status": "error", "message": str(e).strip("'")}
+
+
+class LocalCflowAdapter(BaseAdapter):
+    """requests transport that answers from a LocalUserDirectory instead of the network."""
+
+    def __init__(self, directory: LocalUserDirectory):
+        super().__init__()
+        self.directory = directory
+
+    def send(self, request, **kwargs):
+        url = urlparse(request.url)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        body = json.loads(request.body) if request.body else {}
+        status, payload = self.directory.handle(request.method, url.path, query, body)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers["Content-Type"] = "application/json"
+        response.raw = io.BytesIO(json.dumps(payload).encode())
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,398 @@
+import argparse
+import io
+import json
+import mimetypes
+import os
+import random
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from openpyxl import load_workbook
+from Utilities.ReadProperties import ReadConfig
+from Utilities.LocalCflowBackend import LocalUserDirectory
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("local_server")
+
+
+class LocalCflowServer:
+    """
+    Local stand-in for a Cflow tenant (--region=Local).
+
+    Serves the pages the suite drives — login, dashboard, admin user grid, Add User form,
+    Employees lookup and Excel import — on localhost, backed by a LocalUserDirectory.
+    Every request can be delayed by `latency_ms` ± `jitter_ms`, so runs against it measure
+    framework throughput (latency 0) or a chosen server latency.
+
+    The markup follows the locators in Locators/ and PageObjects/, not the real Angular app.
+    """
+
+    APP_DIR = os.path.join(os.path.dirname(__file__), "LocalCflowApp")
+    LOGIN_PATH = "/cflow/login"
+    LANDING_PATH = "/cflow/dashboard"
+    PAGES = (LANDING_PATH, "/cflow/user-role-permission", "/cflow/lookups", "/cflow/lookups/employees")
+    ASSETS_PREFIX = "/cflow/assets/"
+    LOGIN_API = "/cflow/api/auth/login"
+    POLICY_API = "/cflow/api/admin/password-policy"
+    SESSION_COOKIE = "CFLOWSESSION"
+
+    ROLES = ["Admin", "User", "Approver", "Viewer"]
+    COUNTRY_CODES = ["+1", "+44", "+61", "+65", "+91", "+971"]
+    IMPORT_COLUMNS = {
+        "Name": "name", "Login ID": "loginId", "Email": "email", "Role": "role",
+        "WhatsApp Number": "whatsappNo", "Employee Number": "empNo", "Department": "department",
+    }
+    IMPORTED_USER_PASSWORD = "Cflow@12345"
+
+    # Users the negative tests expect to exist already (duplicate login ID / employee number)
+    SEED_USERS = [
+        {"name": "Dinesh", "loginId": "dinesh01", "empNo": "E02", "email": "dinesh01@yopmail.com",
+         "department": "QA", "password": "Dinesh@123", "role": ["User"], "whatsappNo": "9988776655"},
+    ]
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, client_id: str = "cflowlocal.com",
+                 username: str = "admin@cflowlocal.com", password: str = "Local@12345",
+                 latency_ms: float = 0, jitter_ms: float = 0, min_password_length: int = 8,
+                 max_password_length: int = 20, password_rules: list[str] | None = None,
+                 directory: LocalUserDirectory | None = None):
+        self.host = host
+        self.port = port
+        self.client_id = client_id
+        self.username = username
+        self.password = password
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.password_policy = self._build_policy(
+            min_password_length, max_password_length,
+            ["number", "uppercase", "special"] if password_rules is None else password_rules,
+        )
+
+        self.directory = directory or LocalUserDirectory()
+        for user in self.SEED_USERS:
+            self.directory.add_user(user)
+
+        self._sessions: dict[str, str] = {}  # token -> login name
+        self._lock = threading.Lock()
+        self._rng = random.Random()  # own generator: tests seed the global one (HAR replay)
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_config(cls, region: str = "Local", **overrides) -> "LocalCflowServer":
+        """Server for the tenant described by a config.ini section; keyword arguments win."""
+        url = urlparse(ReadConfig.getURL(region))
+        setting = ReadConfig.getLocalServerSetting
+        options = {
+            "host": url.hostname,
+            "port": url.port or 80,
+            "client_id": ReadConfig.getClientID(region),
+            "username": ReadConfig.getUsername(region),
+            "password": ReadConfig.getPassword(region),
+            "latency_ms": float(setting(region, "latencyMs", "0")),
+            "jitter_ms": float(setting(region, "jitterMs", "0")),
+            "min_password_length": int(setting(region, "passwordMinLength", "8")),
+            "max_password_length": int(setting(region, "passwordMaxLength", "20")),
+            "password_rules": [r.strip() for r in setting(region, "passwordRules", "").split(",") if r.strip()],
+        }
+        options.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**options)
+
+    # ---------------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        port = self._httpd.server_address[1] if self._httpd else self.port
+        return f"http://{self.host}:{port}"
+
+    @property
+    def login_url(self) -> str:
+        return self.base_url + self.LOGIN_PATH
+
+    def start(self) -> "LocalCflowServer":
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _LocalCflowHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.app = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="local-cflow-server", daemon=True)
+        self._thread.start()
+        log.info("🖥 Local Cflow server running at %s (latency %g±%g ms)", self.login_url, self.latency_ms, self.jitter_ms)
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def delay(self):
+        """Artificial server latency for one request."""
+        if self.latency_ms or self.jitter_ms:
+            ms = self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+            time.sleep(max(ms, 0) / 1000)
+
+    # ---------------------------------------------------------------
+    # Sessions
+    # ---------------------------------------------------------------
+    def login(self, body: dict) -> str:
+        """Check the login form and return a new session token (ValueError if rejected)."""
+        client_id = str(body.get("clientId", "")).strip().lower()
+        username = str(body.get("username", "")).strip()
+        password = str(body.get("password", ""))
+        if client_id != self.client_id.lower():
+            raise ValueError("Invalid Client ID")
+
+        if username.lower() == self.username.lower() and password == self.password:
+            name = "Admin"
+        else:
+            user = self.directory.find_user(username)
+            if not user or user["password"] != password:
+                raise ValueError("Invalid username or password")
+            if not user["status"]:
+                raise ValueError("User is inactive. Please contact your administrator")
+            name = user["name"]
+
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = name
+        return token
+
+    def session_user(self, cookie_header: str | None) -> str | None:
+        cookie = SimpleCookie(cookie_header or "")
+        morsel = cookie.get(self.SESSION_COOKIE)
+        with self._lock:
+            return self._sessions.get(morsel.value) if morsel else None
+
+    # ---------------------------------------------------------------
+    # Password Policy
+    # ---------------------------------------------------------------
+    @staticmethod
+    def _build_policy(min_length: int, max_length: int, rules: list[str]) -> list[dict]:
+        """Rules shown under the password field; texts follow the live tenant's wording."""
+        texts = {
+            "number": "Password should contain a number",
+            "uppercase": "Password should contain an uppercase letter",
+            "lowercase": "Password should contain a lowercase alphabet",
+            "special": "Password should contain a special character (!@#$%^&*)",
+        }
+        unknown = set(rules) - set(texts)
+        if unknown:
+            raise ValueError(f"Unknown password rules: {sorted(unknown)} (use {sorted(texts)})")
+
+        policy = [
+            {"key": "min", "value": min_length, "text": f"Password should be at least {min_length} characters long"},
+            {"key": "max", "value": max_length, "text": f"Password should be less than {max_length + 1} characters"},
+        ]
+        return policy + [{"key": rule, "text": texts[rule]} for rule in rules]
+
+    # ---------------------------------------------------------------
+    # Excel Import
+    # ---------------------------------------------------------------
+    @staticmethod
+    def _cell_text(value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # phone numbers / employee numbers stored as numbers
+        return str(value).strip()
+
+    def import_workbook(self, data: bytes) -> dict:
+        """Create the users of an uploaded .xlsx; users whose login ID exists are reported, not added."""
+        try:
+            workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        except Exception as e:
+            raise ValueError(f"Unable to read the uploaded file: {e}")
+
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [self._cell_text(cell) for cell in next(rows, ())]
+            missing = [column for column in self.IMPORT_COLUMNS if column not in header]
+            if missing:
+                raise ValueError(f"Missing columns in the uploaded file: {', '.join(missing)}")
+
+            imported, existing, rejected = [], [], []
+            for row in rows:
+                values = {header[i]: self._cell_text(cell) for i, cell in enumerate(row) if i < len(header)}
+                if not any(values.values()):
+                    continue
+                user = {key: values.get(column, "") for column, key in self.IMPORT_COLUMNS.items()}
+                user["role"] = [r.strip() for r in user["role"].split(",") if r.strip()] or ["User"]
+                user["password"] = self.IMPORTED_USER_PASSWORD
+                if self.directory.find_user(user["loginId"]):
+                    existing.append(user["loginId"])
+                    continue
+                try:
+                    imported.append(self.directory.add_user(user)["loginId"])
+                except ValueError as e:
+                    rejected.append(f"{user['loginId']}: {e}")
+        finally:
+            workbook.close()
+        return {"imported": imported, "existing": existing, "rejected": rejected}
+
+    # ---------------------------------------------------------------
+    # Pages
+    # ---------------------------------------------------------------
+    def client_config(self, user: str | None) -> dict:
+        """Settings the page script reads from window.CFLOW_CONFIG."""
+        endpoints = ("addUser", "userStatus", "resetPassword", "deleteUser", "searchUsers", "importUsers")
+        api = {name: ReadConfig.getAPIEndpoint(name) for name in endpoints}
+        api.update({"login": self.LOGIN_API, "passwordPolicy": self.POLICY_API})
+        return {
+            "user": user, "landing": self.LANDING_PATH, "loginPath": self.LOGIN_PATH, "api": api,
+            "roles": self.ROLES, "countryCodes": self.COUNTRY_CODES, "passwordPolicy": self.password_policy,
+            "toastTimeout": 4000, "importSummaryTimer": 3000,
+        }
+
+    def render_page(self, user: str | None) -> bytes:
+        with open(os.path.join(self.APP_DIR, "index.html"), "r", encoding="utf-8") as f:
+            html = f.read()
+        config = json.dumps(self.client_config(user)).replace("</", "<\\/")
+        return html.replace("{{CFLOW_CONFIG}}", config).encode("utf-8")
+
+
+class _LocalCflowHandler(BaseHTTPRequestHandler):
+    """HTTP layer of LocalCflowServer (one thread per connection)."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalCflow/1.0"
+
+    @property
+    def app(self) -> LocalCflowServer:
+        return self.server.app
+
+    def log_message(self, format, *args):
+        pass  # keep the pytest output clean
+
+    # ---------------------------------------------------------------
+    # Responses
+    # ---------------------------------------------------------------
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict, headers: dict | None = None):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _redirect(self, location: str):
+        self._send(302, b"", "text/plain", {"Location": location})
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    # ---------------------------------------------------------------
+    # Routing
+    # ---------------------------------------------------------------
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        self.app.delay()
+        url = urlparse(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        user = self.app.session_user(self.headers.get("Cookie"))
+
+        try:
+            if method == "GET" and path in ("/", "/cflow"):
+                self._redirect(self.app.LANDING_PATH if user else self.app.LOGIN_PATH)
+            elif method == "GET" and path == self.app.LOGIN_PATH:
+                self._send(200, self.app.render_page(None), "text/html; charset=utf-8")
+            elif method == "GET" and path in self.app.PAGES:
+                if user:
+                    self._send(200, self.app.render_page(user), "text/html; charset=utf-8")
+                else:
+                    self._redirect(self.app.LOGIN_PATH)
+            elif method == "GET" and path.startswith(self.app.ASSETS_PREFIX):
+                self._serve_asset(path[len(self.app.ASSETS_PREFIX):])
+            elif method == "POST" and path == self.app.LOGIN_API:
+                self._login()
+            elif path.startswith("/cflow/api/"):
+                self._api(method, path, query, user)
+            else:
+                self._send_json(404, {"status": "error", "message": f"No page {path}"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the browser navigated away mid-response
+
+    def _serve_asset(self, name: str):
+        asset = os.path.normpath(os.path.join(self.app.APP_DIR, name))
+        if not asset.startswith(self.app.APP_DIR + os.sep) or not os.path.isfile(asset):
+            self._send_json(404, {"status": "error", "message": f"No asset {name}"})
+            return
+        with open(asset, "rb") as f:
+            body = f.read()
+        self._send(200, body, mimetypes.guess_type(asset)[0] or "application/octet-stream")
+
+    def _login(self):
+        try:
+            token = self.app.login(json.loads(self._read_body() or b"{}"))
+        except ValueError as e:
+            self._send_json(401, {"status": "error", "message": str(e)})
+            return
+        cookie = f"{self.app.SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+        self._send_json(200, {"status": "success", "message": "Login Successful",
+                              "data": {"redirect": self.app.LANDING_PATH}}, {"Set-Cookie": cookie})
+
+    def _api(self, method: str, path: str, query: dict, user: str | None):
+        if not user:
+            self._send_json(401, {"status": "error", "message": "Session expired. Please login again"})
+            return
+
+        if method == "GET" and path == self.app.POLICY_API:
+            self._send_json(200, {"status": "success", "data": self.app.password_policy})
+        elif method == "POST" and path == ReadConfig.getAPIEndpoint("importUsers"):
+            try:
+                summary = self.app.import_workbook(self._read_body())
+            except ValueError as e:
+                self._send_json(400, {"status": "error", "message": str(e)})
+                return
+            self._send_json(200, {"status": "success", "data": summary})
+        else:
+            raw = self._read_body()
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                self._send_json(400, {"status": "error", "message": "Malformed JSON body"})
+                return
+            status, payload = self.app.directory.handle(method, path, query, body)
+            self._send_json(status, payload)
+
+
+# ---------------------------------------------------------------
+# Standalone: python -m Utilities.LocalCflowServer --latency 80 --jitter 20
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the local Cflow stand-in server")
+    parser.add_argument("--port", type=int, default=None, help="Port (default: from config.ini [Local])")
+    parser.add_argument("--latency", type=float, default=None, help="Added latency per request, in ms")
+    parser.add_argument("--jitter", type=float, default=None, help="Random ± jitter on the latency, in ms")
+    args = parser.parse_args()
+
+    server = LocalCflowServer.from_config(port=args.port, latency_ms=args.latency, jitter_ms=args.jitter).start()
+    print(f"🖥 Local Cflow server running at {server.login_url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+import random
+import re
+import string
+import time
+from dataclasses import dataclass, field
+from Utilities.FrameworkLogger import get_logger
+from Utilities.ReadProperties import ReadConfig
+from Utilities.RunCache import RunCache
+
+
+log = get_logger("password_policy")
+
+
+@dataclass(frozen=True)
+class PasswordRuleState:
+    """One rule under the password field, as the validator shows it right now."""
+    text: str
+    visible: bool
+    passed: bool
+
+
+@dataclass(frozen=True)
+class PasswordPolicy:
+    """
+    A tenant's password rules, parsed once from the texts shown under the password field.
+
+    Checks and generation run in pure Python, so a valid (or deliberately invalid) password
+    costs no browser round trips — only the final fill and one confirmation read.
+    Rule texts follow the live wording, e.g. "Password should be at least 8 characters long",
+    "Password should be less than 21 characters", "Password should contain a number".
+    Texts that are not recognised are kept but treated as always satisfied.
+    """
+
+    min_length: int = 8
+    max_length: int = 20
+    require_digit: bool = False
+    require_upper: bool = False
+    require_lower: bool = False
+    require_special: bool = False
+    specials: str = "!@#$%^&*"
+    rules: tuple[str, ...] = field(default=(), compare=False)
+
+    DEFAULT_SPECIALS = "!@#$%^&*"
+
+    # ---------------------------------------------------------------
+    # Parsing
+    # ---------------------------------------------------------------
+    @staticmethod
+    def rule_kind(rule: str) -> str | None:
+        """What a rule text asks for: min, max, digit, upper, lower, special (None = unknown)."""
+        r_lower = rule.lower()
+        if "number" in r_lower:
+            return "digit"
+        if "uppercase" in r_lower:
+            return "upper"
+        if "alphabet" in r_lower or "lowercase" in r_lower:
+            return "lower"
+        if "special" in r_lower:
+            return "special"
+        if "at least" in r_lower:
+            return "min"
+        if "less than" in r_lower:
+            return "max"
+        return None
+
+    @staticmethod
+    def _number(rule: str) -> int:
+        return int("".join(filter(str.isdigit, rule)))
+
+    @classmethod
+    def from_rules(cls, rules: list[str]) -> "PasswordPolicy":
+        """
+        Compile the visible rule texts. Length bounds come from the rule numbers alone; the
+        default 8–20 characters only stand in for a bound no rule states.
+        """
+        settings = {"rules": tuple(rules)}
+        min_length = max_length = None
+        for rule in rules:
+            kind = cls.rule_kind(rule)
+            if kind == "min":
+                min_length = max(min_length or 0, cls._number(rule))
+            elif kind == "max":
+                limit = cls._number(rule) - 1  # "less than 21" -> 20
+                max_length = limit if max_length is None else min(max_length, limit)
+            elif kind == "special":
+                settings["require_special"] = True
+                listed = re.search(r"\(([^)\w\s]+)\)", rule)
+                settings["specials"] = listed.group(1) if listed else cls.DEFAULT_SPECIALS
+            elif kind:
+                settings[f"require_{kind}"] = True
+        if min_length is None:
+            min_length = cls.min_length if max_length is None else min(cls.min_length, max_length)
+        if max_length is None:
+            max_length = max(cls.max_length, min_length)
+        return cls(min_length=min_length, max_length=max_length, **settings)
+
+    # ---------------------------------------------------------------
+    # Checks
+    # ---------------------------------------------------------------
+    def rule_satisfied(self, rule: str, password: str) -> bool:
+        """Does `password` meet one rule text?"""
+        kind = self.rule_kind(rule)
+        if kind == "digit":
+            return any(c.isdigit() for c in password)
+        if kind == "upper":
+            return any(c.isupper() for c in password)
+        if kind == "lower":
+            return any(c.islower() for c in password)
+        if kind == "special":
+            return any(c in self.specials for c in password)
+        if kind == "min":
+            return len(password) >= self._number(rule)
+        if kind == "max":
+            return len(password) <= self._number(rule) - 1
+        return True
+
+    def violations(self, password: str) -> list[str]:
+        """Rule texts `password` does not meet (what the validator should still list)."""
+        return [rule for rule in self.rules if not self.rule_satisfied(rule, password)]
+
+    def is_valid(self, password: str) -> bool:
+        return not self.violations(password) and self.min_length <= len(password) <= self.max_length
+
+    # ---------------------------------------------------------------
+    # Generation (uses the `random` module, so HAR replay seeding still applies)
+    # ---------------------------------------------------------------
+    @property
+    def alphabet(self) -> str:
+        return string.ascii_letters + string.digits + self.specials
+
+    def generate_valid(self, length: int | None = None) -> str:
+        """A random password meeting every rule: one character per required class, then filler."""
+        length = min(max(length or self.min_length, self.min_length), self.max_length)
+        required = [pool for pool, needed in ((string.digits, self.require_digit),
+                                              (string.ascii_uppercase, self.require_upper),
+                                              (string.ascii_lowercase, self.require_lower),
+                                              (self.specials, self.require_special)) if needed]
+        if len(required) > length:
+            raise ValueError(f"Password policy cannot be met within {self.max_length} characters: {self.rules}")
+
+        chars = [random.choice(pool) for pool in required]
+        chars += random.choices(self.alphabet, k=length - len(chars))
+        random.shuffle(chars)
+        return "".join(chars)
+
+    def generate_invalid(self, rule: str) -> str:
+        """A password that breaks `rule` (too short / too long / missing the character class)."""
+        return self.invalid_candidates(rule)[0]
+
+    def invalid_candidates(self, rule: str) -> list[str]:
+        """
+        Passwords that break `rule` and, where possible, only that rule: boundary lengths
+        first (min - 1, max + 1), then further lengths; a missing character class at the
+        minimum, middle and maximum length.
+        """
+        kind = self.rule_kind(rule)
+        if kind == "min":
+            lengths = [self.min_length - 1, 1]
+        elif kind == "max":
+            lengths = [self.max_length + 1, self.max_length + 10]
+        elif kind:
+            lengths = [self.min_length, (self.min_length + self.max_length) // 2, self.max_length]
+        else:
+            return ["".join(random.choices(self.alphabet, k=max(1, self.min_length - 1)))]  # unknown rule
+        return [self._breaking(kind, length) for length in dict.fromkeys(n for n in lengths if n > 0)]
+
+    def _breaking(self, kind: str, length: int) -> str:
+        """`length` characters with every required class except `kind` (which is left out entirely)."""
+        pools = {"digit": string.digits, "upper": string.ascii_uppercase,
+                 "lower": string.ascii_lowercase, "special": self.specials}
+        required = [pool for name, pool in pools.items() if name != kind and getattr(self, f"require_{name}")]
+        filler = "".join(pool for name, pool in pools.items() if name != kind)
+
+        chars = [random.choice(pool) for pool in required][:length]
+        chars += random.choices(filler, k=length - len(chars))
+        random.shuffle(chars)
+        return "".join(chars)
+
+
+class PasswordPolicyCache:
+    """
+    The compiled password policy of one tenant (region + client ID), kept in memory and in
+    .run_cache/password_policies.json across runs and workers, so the rules are scraped
+    once instead of on every password the tests enter.
+
+    An entry is used while it is younger than the TTL and, when the page renders its rules,
+    while their texts still hash to the stored fingerprint; otherwise the caller scrapes
+    again and put() replaces it. A TTL of 0 disables the cache (always scrape).
+    """
+
+    PATH = os.path.join(RunCache.ROOT, "password_policies.json")
+
+    _shared: "PasswordPolicyCache | None" = None
+
+    def __init__(self, region: str, client_id: str, ttl_seconds: float = 3600, path: str | None = None):
+        self.key = f"{region}/{client_id}"
+        self.ttl_seconds = ttl_seconds
+        self.path = path or self.PATH
+        self._entry: dict | None = None
+        self._policy: PasswordPolicy | None = None
+
+    # ---------------------------------------------------------------
+    # Shared Instance (one per process, set up by conftest)
+    # ---------------------------------------------------------------
+    @classmethod
+    def configure(cls, region: str, client_id: str, ttl_minutes: float | None = None) -> "PasswordPolicyCache":
+        """Cache of the run's tenant; ttl_minutes=None takes [PasswordPolicy] ttlMinutes from config.ini."""
+        if ttl_minutes is None:
+            ttl_minutes = float(ReadConfig.getPasswordPolicySetting("ttlMinutes", "60"))
+        cls._shared = cls(region, client_id, ttl_seconds=ttl_minutes * 60)
+        return cls._shared
+
+    @classmethod
+    def shared(cls) -> "PasswordPolicyCache":
+        """The configured cache; without conftest (no tenant known) a disabled one."""
+        if cls._shared is None:
+            cls._shared = cls("", "", ttl_seconds=0)
+        return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def fingerprint(rules: list[str]) -> str:
+        return hashlib.sha256("\n".join(rules).encode()).hexdigest()[:16]
+
+    # ---------------------------------------------------------------
+    # Lookup / Store
+    # ---------------------------------------------------------------
+    def _fresh(self, entry: dict | None) -> bool:
+        return bool(entry) and time.time() - entry["saved_at"] < self.ttl_seconds
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get(self, displayed: list[str] | None = None) -> PasswordPolicy | None:
+        """
+        The cached policy, or None when there is none, it expired, or the rule texts the
+        page `displayed` no longer match its fingerprint (empty = not rendered; TTL decides).
+        """
+        if not self.enabled:
+            return None
+        entry = self._entry if self._fresh(self._entry) else self._load().get(self.key)
+        if not self._fresh(entry):
+            log.info("Password policy not cached (or expired) for %s", self.key)
+            return None
+        if displayed and self.fingerprint(displayed) != entry["fingerprint"]:
+            log.info("Password rules of %s changed since they were cached", self.key)
+            return None
+
+        if entry is not self._entry:
+            self._entry, self._policy = entry, PasswordPolicy.from_rules(entry["rules"])
+        return self._policy
+
+    def put(self, rules: list[str]) -> PasswordPolicy:
+        """Compile freshly scraped rules and store them for every worker and later runs."""
+        policy = PasswordPolicy.from_rules(rules)
+        if not self.enabled:
+            return policy
+
+        entry = {"rules": list(rules), "fingerprint": self.fingerprint(rules), "saved_at": time.time()}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with RunCache.file_lock(self.path + ".lock"):
+            entries = self._load()
+            entries[self.key] = entry
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+        self._entry, self._policy = entry, policy
+        log.info("Password policy cached for %s (%d rules)", self.key, len(rules))
+        return policy
@@ -1,5 +1,6 @@
 import configparser
 import os
+from urllib.parse import urlparse
 
 class ReadConfig:
     """Utility class to read configuration values from config.ini"""
@@ -15,6 +16,14 @@ class ReadConfig:
         """Get URL for the given region (AP, ME, US, EU)"""
         return ReadConfig.config.get(region, "baseURL")
 
+    @staticmethod
+    def getRegions(include_local: bool = False) -> list[str]:
+        """Regions defined in config.ini (sections with a baseURL); Local only on request"""
+        return [
+            section for section in ReadConfig.config.sections()
+            if ReadConfig.config.has_option(section, "baseURL") and (include_local or section != "Local")
+        ]
+
     @staticmethod
     def getClientID(region: str) -> str:
         """Get client ID for the given region"""
@@ -29,3 +38,46 @@ class ReadConfig:
     def getPassword(region: str) -> str:
         """Get password for the given region"""
         return ReadConfig.config.get(region, "password")
+
+    @staticmethod
+    def getAPIBaseURL(region: str) -> str:
+        """Scheme + host of the region, e.g. https://testapp.cflowapps.com"""
+        parsed = urlparse(ReadConfig.getURL(region))
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    @staticmethod
+    def hasBackendAPI(region: str) -> bool:
+        """Whether the region serves the [API] endpoints (only the local stand-in so far)"""
+        return ReadConfig.config.getboolean(region, "backendApi", fallback=False)
+
+    @staticmethod
+    def getAPIEndpoint(name: str) -> str:
+        """Path of a backend endpoint from the [API] section (local stand-in placeholders)"""
+        return ReadConfig.config.get("API", name)
+
+    @staticmethod
+    def getRouteSetting(region: str, key: str) -> list[str]:
+        """Comma separated route policy setting; the region section overrides [RoutePolicy]"""
+        default = ReadConfig.config.get("RoutePolicy", key, fallback="")
+        value = ReadConfig.config.get(region, key, fallback=default)
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    @staticmethod
+    def getRegionSetting(region: str, key: str, fallback: str = "") -> str:
+        """Optional per-region setting (e.g. searchResponsePattern)"""
+        return ReadConfig.config.get(region, key, fallback=fallback)
+
+    @staticmethod
+    def getLocalServerSetting(region: str, key: str, fallback: str = "") -> str:
+        """Setting of the local stand-in server (latency, password policy, ...)"""
+        return ReadConfig.config.get(region, key, fallback=fallback)
+
+    @staticmethod
+    def getScreenshotSetting(key: str, fallback: str = "") -> str:
+        """Setting of the [Screenshots] section (directory, format, quality, fullPage, budgetMB)"""
+        return ReadConfig.config.get("Screenshots", key, fallback=fallback)
+
+    @staticmethod
+    def getPasswordPolicySetting(key: str, fallback: str = "") -> str:
+        """Setting of the [PasswordPolicy] section (ttlMinutes)"""
+        return ReadConfig.config.get("PasswordPolicy", key, fallback=fallback)
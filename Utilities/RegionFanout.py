@@ -0,0 +1,206 @@
+import html
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from Utilities.ReadProperties import ReadConfig
+from Utilities.RunCache import RunCache
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("region_fanout")
+
+
+@dataclass
+class RegionResult:
+    """Outcome of one region's child pytest run."""
+    region: str
+    exit_code: int = -1
+    duration: float = 0.0
+    tests: int = 0
+    failed: int = 0
+    skipped: int = 0
+    cases: list[dict] = field(default_factory=list)  # {"name", "time", "outcome", "message"}
+
+    @property
+    def passed(self) -> int:
+        return self.tests - self.failed - self.skipped
+
+    def summary(self) -> str:
+        return (f"{self.passed} passed, {self.failed} failed, {self.skipped} skipped "
+                f"in {self.duration:.1f}s (exit {self.exit_code})")
+
+
+class RegionFanout:
+    """
+    Runs the same pytest invocation against several regions at once (--region=all / AP,US,...).
+
+    Every region is a child pytest process with its own xdist pool (`workers` browsers at most,
+    so no tenant gets more load than a normal run) and its own run-cache folder
+    <run>/<region>, so logins and shared test data never cross tenants.
+    `max_parallel` limits how many regions run at the same time (0 = all).
+    Per-region HTML / JUnit reports are merged into one report labelled by region.
+    """
+
+    # Options the parent decides per region; removed from the forwarded command line
+    OWN_OPTIONS = ("--region", "-n", "--numprocesses", "--html", "--junitxml", "--junit-xml",
+                   "--region-workers", "--max-parallel-regions")
+
+    def __init__(self, regions: list[str], args: list[str], workers: int = 2, max_parallel: int = 0,
+                 report_dir: str = os.path.join("Reports", "regions")):
+        self.regions = regions
+        self.args = self.strip_options(args, self.OWN_OPTIONS)
+        self.workers = workers
+        self.max_parallel = max_parallel or len(regions)
+        self.report_dir = report_dir
+
+    # ---------------------------------------------------------------
+    # Command Line
+    # ---------------------------------------------------------------
+    @staticmethod
+    def parse_regions(value: str) -> list[str] | None:
+        """Regions named by --region, or None for a plain single-region run."""
+        if value.lower() == "all":
+            return ReadConfig.getRegions()
+        if "," not in value:
+            return None
+        regions = list(dict.fromkeys(r.strip() for r in value.split(",") if r.strip()))
+        unknown = [r for r in regions if r not in ReadConfig.getRegions(include_local=True)]
+        if unknown:
+            raise ValueError(f"Unknown region(s): {', '.join(unknown)}")
+        return regions
+
+    @staticmethod
+    def strip_options(args: list[str], names: tuple[str, ...]) -> list[str]:
+        """Drop `names` (and their values) from an argument list: --opt v, --opt=v, -n4."""
+        kept, skip_value = [], False
+        for arg in args:
+            if skip_value:
+                skip_value = False
+                continue
+            name = arg.split("=", 1)[0]
+            if name in names:
+                skip_value = "=" not in arg
+            elif any(n.startswith("-") and not n.startswith("--") and arg.startswith(n) for n in names):
+                pass  # short option with the value attached, e.g. -n4
+            else:
+                kept.append(arg)
+        return kept
+
+    def region_dir(self, region: str) -> str:
+        return os.path.join(self.report_dir, region)
+
+    def command(self, region: str) -> list[str]:
+        out = self.region_dir(region)
+        return [sys.executable, "-m", "pytest", *self.args,
+                f"--region={region}", "-n", str(self.workers),
+                f"--junitxml={os.path.join(out, 'junit.xml')}",
+                f"--html={os.path.join(out, 'report.html')}"]
+
+    # ---------------------------------------------------------------
+    # Running
+    # ---------------------------------------------------------------
+    def _run_region(self, region: str) -> RegionResult:
+        os.makedirs(self.region_dir(region), exist_ok=True)
+        junit_path = os.path.join(self.region_dir(region), "junit.xml")
+        if os.path.exists(junit_path):
+            os.remove(junit_path)  # never report a previous run's results
+        env = {k: v for k, v in os.environ.items() if not k.startswith("PYTEST_XDIST")}
+        env["CFLOW_RUN_ID"] = os.path.join(RunCache.run_id(), region)  # own logins + shared data
+
+        log.info("🌍 [%s] started (%d workers)", region, self.workers)
+        start = time.perf_counter()
+        with open(os.path.join(self.region_dir(region), "console.log"), "w", encoding="utf-8") as console:
+            exit_code = subprocess.call(self.command(region), stdout=console, stderr=subprocess.STDOUT, env=env)
+
+        result = self.read_junit(region, junit_path)
+        result.exit_code = exit_code
+        result.duration = time.perf_counter() - start
+        if exit_code == 0:
+            log.info("✅ [%s] %s", region, result.summary())
+        else:
+            log.warning("❌ [%s] %s", region, result.summary())
+        return result
+
+    def run(self) -> int:
+        """Run every region and write the combined report; returns the worst exit code."""
+        log.info("🚀 Running %s (%d region(s) at a time, %d workers each)",
+                 ", ".join(self.regions), self.max_parallel, self.workers)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+            results = list(pool.map(self._run_region, self.regions))
+        wall_time = time.perf_counter() - start
+
+        report = self.write_report(results, wall_time)
+        print(f"\n⏱ {len(results)} regions in {wall_time:.1f}s (one after another: "
+              f"{sum(r.duration for r in results):.1f}s) — combined report: {report}")
+        return max(r.exit_code for r in results)
+
+    # ---------------------------------------------------------------
+    # Reports
+    # ---------------------------------------------------------------
+    @staticmethod
+    def read_junit(region: str, junit_path: str) -> RegionResult:
+        result = RegionResult(region)
+        if not os.path.exists(junit_path):
+            return result  # the child never got to run tests (usage error, crash, ...)
+
+        for case in ET.parse(junit_path).getroot().iter("testcase"):
+            outcome, message = "passed", ""
+            for child in case:
+                if child.tag in ("failure", "error"):
+                    outcome, message = "failed", child.get("message", "")
+                elif child.tag == "skipped":
+                    outcome, message = "skipped", child.get("message", "")
+            result.tests += 1
+            result.failed += outcome == "failed"
+            result.skipped += outcome == "skipped"
+            result.cases.append({
+                "name": f"{case.get('classname', '')}::{case.get('name', '')}",
+                "time": float(case.get("time") or 0),
+                "outcome": outcome,
+                "message": message,
+            })
+        return result
+
+    def write_report(self, results: list[RegionResult], wall_time: float) -> str:
+        """One HTML page: a summary row per region, then every test labelled by region."""
+        colors = {"passed": "#2e7d32", "failed": "#c62828", "skipped": "#9e9e9e"}
+        summary_rows = "".join(
+            f"<tr><td><a href='{html.escape(r.region)}/report.html'>{html.escape(r.region)}</a></td>"
+            f"<td>{r.tests}</td><td>{r.passed}</td><td>{r.failed}</td><td>{r.skipped}</td>"
+            f"<td>{r.duration:.1f}s</td><td>{r.exit_code}</td></tr>"
+            for r in results
+        )
+        case_rows = "".join(
+            f"<tr><td>{html.escape(r.region)}</td><td>{html.escape(c['name'])}</td>"
+            f"<td style='color:{colors[c['outcome']]}'>{c['outcome']}</td><td>{c['time']:.1f}s</td>"
+            f"<td>{html.escape(c['message'][:300])}</td></tr>"
+            for r in results for c in r.cases
+        )
+        page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Cflow Multi-Region Report</title>
+<style>
+body {{ font-family: Verdana, sans-serif; font-size: 13px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; }}
+th {{ background: #f0f0f0; }}
+</style></head>
+<body>
+<h1>🚀 Cflow Playwright Automation — Multi-Region Report</h1>
+<p>Run {html.escape(RunCache.run_id())} | {time.strftime('%d-%b-%Y %H:%M:%S')} |
+wall time {wall_time:.1f}s (sequential would be {sum(r.duration for r in results):.1f}s)</p>
+<table><tr><th>Region</th><th>Tests</th><th>Passed</th><th>Failed</th><th>Skipped</th><th>Duration</th><th>Exit</th></tr>
+{summary_rows}</table>
+<table><tr><th>Region</th><th>Test</th><th>Result</th><th>Time</th><th>Message</th></tr>
+{case_rows}</table>
+</body></html>
+"""
+        os.makedirs(self.report_dir, exist_ok=True)
+        report_path = os.path.join(self.report_dir, "index.html")
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(page)
+        return report_path
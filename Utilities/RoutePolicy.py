@@ -0,0 +1,156 @@
+import json
+import os
+import re
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from playwright.sync_api import BrowserContext, Route, Request
+from Utilities.RunCache import RunCache
+
+
+@dataclass
+class RouteStats:
+    """Requests a context did not load, and the bytes that saved."""
+    blocked: int = 0
+    bytes_saved: int = 0
+    unknown_size: int = 0  # blocked URLs whose size was never measured
+    by_type: Counter = field(default_factory=Counter)
+
+    def copy(self) -> "RouteStats":
+        return RouteStats(self.blocked, self.bytes_saved, self.unknown_size, Counter(self.by_type))
+
+    def since(self, start: "RouteStats") -> "RouteStats":
+        return RouteStats(
+            self.blocked - start.blocked,
+            self.bytes_saved - start.bytes_saved,
+            self.unknown_size - start.unknown_size,
+            self.by_type - start.by_type,
+        )
+
+    def add(self, other: "RouteStats"):
+        self.blocked += other.blocked
+        self.bytes_saved += other.bytes_saved
+        self.unknown_size += other.unknown_size
+        self.by_type.update(other.by_type)
+
+    def summary(self) -> str:
+        types = ", ".join(f"{t}={n}" for t, n in self.by_type.most_common()) or "none"
+        known = f" ({self.unknown_size} of unmeasured size)" if self.unknown_size else ""
+        return f"{self.blocked} requests blocked [{types}], ~{self.bytes_saved / 1024:.1f} KB saved{known}"
+
+
+class RoutePolicy:
+    """
+    page.route policy that keeps non-essential resources (fonts, images, analytics, ...) off the wire.
+
+    mode="block"   : abort requests matching the blocklist unless they match the allowlist
+    mode="measure" : load everything, but record the size of what *would* be blocked, so
+                     later "block" runs can report real bytes saved
+    mode="off"     : no routing at all
+
+    Only requests matching a blocked URL pattern are routed (the patterns are matched by the
+    browser), so every other request loads without a round trip to the Python handler — which,
+    under the sync API, would stall while a test sleeps. Blocking by resource type needs every
+    request to go through the handler, so it is opt-in (blockResourceTypes is empty by default).
+
+    Sizes measured in "measure" mode are kept in .run_cache/route_sizes.json across runs.
+    """
+
+    MODES = ("off", "block", "measure")
+    SIZES_PATH = os.path.join(RunCache.ROOT, "route_sizes.json")
+
+    def __init__(self, mode: str = "block", block_resource_types: list[str] | None = None,
+                 block_url_patterns: list[str] | None = None, allow_url_patterns: list[str] | None = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported route policy mode: {mode} (use one of {self.MODES})")
+        self.mode = mode
+        self.block_resource_types = set(block_resource_types or [])
+        self.block_url_patterns = list(block_url_patterns or [])
+        self.allow_url_patterns = list(allow_url_patterns or [])
+
+        self.known_sizes = self._load_sizes()
+        self.total = RouteStats()
+        self._stats: weakref.WeakKeyDictionary[BrowserContext, RouteStats] = weakref.WeakKeyDictionary()
+
+    # ---------------------------------------------------------------
+    # Matching
+    # ---------------------------------------------------------------
+    @staticmethod
+    def url_regex(pattern: str) -> re.Pattern:
+        """The fnmatch-style pattern as a regex the browser can match (JS syntax, anchored)."""
+        parts = (".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern)
+        return re.compile(f"^{''.join(parts)}$")
+
+    @staticmethod
+    def _size_key(url: str) -> str:
+        return url.split("?", 1)[0]
+
+    def should_block(self, request: Request) -> bool:
+        url = request.url
+        if any(fnmatch(url, pattern) for pattern in self.allow_url_patterns):
+            return False
+        return (request.resource_type in self.block_resource_types
+                or any(fnmatch(url, pattern) for pattern in self.block_url_patterns))
+
+    # ---------------------------------------------------------------
+    # Contexts
+    # ---------------------------------------------------------------
+    def apply(self, context: BrowserContext) -> RouteStats:
+        """Install the policy on a context and return its (live) stats."""
+        stats = self._stats.setdefault(context, RouteStats())
+        if self.mode == "block":
+            handler = lambda route, request: self._handle(route, request, stats)
+            if self.block_resource_types:
+                context.route("**/*", handler)  # a resource type is only known per request
+            else:
+                for pattern in self.block_url_patterns:
+                    context.route(self.url_regex(pattern), handler)
+        elif self.mode == "measure":
+            context.on("requestfinished", self._measure)
+        return stats
+
+    def stats_for(self, context: BrowserContext) -> RouteStats:
+        return self._stats.get(context, RouteStats())
+
+    def _handle(self, route: Route, request: Request, stats: RouteStats):
+        if not self.should_block(request):
+            route.fallback()  # let other handlers (e.g. HAR replay) or the network serve it
+            return
+
+        stats.blocked += 1
+        stats.by_type[request.resource_type] += 1
+        size = self.known_sizes.get(self._size_key(request.url))
+        if size is None:
+            stats.unknown_size += 1
+        else:
+            stats.bytes_saved += size
+        route.abort("blockedbyclient")
+
+    def _measure(self, request: Request):
+        if self.should_block(request):
+            try:
+                self.known_sizes[self._size_key(request.url)] = request.sizes()["responseBodySize"]
+            except Exception:
+                pass  # the page went away before the sizes could be read
+
+    # ---------------------------------------------------------------
+    # Size Ledger
+    # ---------------------------------------------------------------
+    def _load_sizes(self) -> dict[str, int]:
+        try:
+            with open(self.SIZES_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_sizes(self):
+        """Merge this worker's measurements into the shared ledger (measure mode only)."""
+        if self.mode != "measure" or not self.known_sizes:
+            return
+        os.makedirs(RunCache.ROOT, exist_ok=True)
+        with RunCache.file_lock(self.SIZES_PATH + ".lock"):
+            sizes = self._load_sizes()
+            sizes.update(self.known_sizes)
+            with open(self.SIZES_PATH, "w", encoding="utf-8") as f:
+                json.dump(sizes, f)
@@ -0,0 +1,95 @@
+import os
+import re
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+
+
+class RunCache:
+    """
+    Scratch directory for one pytest run, shared by the controller and every xdist worker.
+    Holds cached logins and other data tests hand to each other during the run.
+    """
+
+    ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".run_cache"))
+    KEEP_RUNS = 5
+
+    @staticmethod
+    def run_id() -> str:
+        """Identifier shared by all processes of the current run."""
+        run_id = os.environ.get("CFLOW_RUN_ID") or os.environ.get("PYTEST_XDIST_TESTRUNUID")
+        if not run_id:
+            run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        # Exported so xdist workers and any child process reuse the same directory
+        os.environ["CFLOW_RUN_ID"] = run_id
+        return run_id
+
+    @staticmethod
+    def worker_id() -> str:
+        """xdist worker name (gw0, gw1, ...) or 'main' when running without xdist."""
+        return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+    @staticmethod
+    def run_dir() -> str:
+        path = os.path.join(RunCache.ROOT, RunCache.run_id())
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def path(*parts: str) -> str:
+        """Absolute path inside the run directory; parent folders are created."""
+        full_path = os.path.join(RunCache.run_dir(), *parts)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        return full_path
+
+    @staticmethod
+    def safe_name(text: str) -> str:
+        """Turn any text (node ids, login names, ...) into a file-name friendly token."""
+        return re.sub(r"[^0-9A-Za-z._-]+", "_", text).strip("_")
+
+    @staticmethod
+    def prune_old_runs(keep: int = KEEP_RUNS):
+        """Remove all but the newest `keep` run directories."""
+        if not os.path.isdir(RunCache.ROOT):
+            return
+        runs = sorted(
+            (os.path.join(RunCache.ROOT, name) for name in os.listdir(RunCache.ROOT)),
+            key=os.path.getmtime,
+            reverse=True,
+        )
+        for old_run in [r for r in runs if os.path.isdir(r)][keep:]:
+            shutil.rmtree(old_run, ignore_errors=True)
+
+    @staticmethod
+    @contextmanager
+    def file_lock(lock_path: str, timeout: float = 120, stale_after: float = 300):
+        """
+        Cross-process lock based on exclusive creation of `lock_path`.
+        Works the same on Windows and Linux; a lock older than `stale_after` seconds
+        is treated as left behind by a crashed worker and taken over.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock_path) > stale_after:
+                        os.remove(lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"❌ Timed out waiting for lock: {lock_path}")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
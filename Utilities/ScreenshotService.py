@@ -0,0 +1,175 @@
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from Utilities.ReadProperties import ReadConfig
+from Utilities.RunCache import RunCache
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("screenshots")
+
+
+class ScreenshotService:
+    """
+    Failure screenshots for BaseHelper / AsyncBaseHelper.
+
+    The browser still captures on the test thread (the page must not change first), but
+    the file is written by a background pool, so a failing step is not held up by disk I/O.
+    Files go to <directory>/<run id>/ and are named <prefix>_<worker>_<test>_<time>_<n>,
+    so parallel workers and tests never overwrite each other. Given the locator a step
+    failed on, the image is clipped to that element (the whole page if it is not visible
+    within CLIP_TIMEOUT_MS). Once a run's folder holds
+    more than `budget_mb`, the oldest screenshots are deleted (0 = no limit).
+
+    Settings come from the [Screenshots] section of config.ini; --screenshot-* options override them.
+    """
+
+    FORMATS = ("png", "jpeg")
+    CLIP_TIMEOUT_MS = 1000  # how long an element clip waits for the element before the page is taken
+    ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+    _shared: "ScreenshotService | None" = None
+
+    def __init__(self, directory: str = "Screenshots", image_format: str = "png", quality: int = 80,
+                 full_page: bool = False, budget_mb: float = 200, workers: int = 2):
+        image_format = image_format.lower().replace("jpg", "jpeg")
+        if image_format not in self.FORMATS:
+            raise ValueError(f"Unsupported screenshot format: {image_format} (use one of {self.FORMATS})")
+
+        self.directory = os.path.join(self.ROOT, directory, RunCache.run_id())
+        self.image_format = image_format
+        self.quality = quality
+        self.full_page = full_page
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self._pending: set[Future] = set()
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+
+    # ---------------------------------------------------------------
+    # Shared Instance (one per process, set up by conftest)
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_config(cls, **overrides) -> "ScreenshotService":
+        """Service built from config.ini; keyword arguments set to None keep the config value."""
+        settings = {
+            "directory": ReadConfig.getScreenshotSetting("directory", "Screenshots"),
+            "image_format": ReadConfig.getScreenshotSetting("format", "png"),
+            "quality": int(ReadConfig.getScreenshotSetting("quality", "80")),
+            "full_page": ReadConfig.getScreenshotSetting("fullPage", "false").lower() == "true",
+            "budget_mb": float(ReadConfig.getScreenshotSetting("budgetMB", "200")),
+        }
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**settings)
+
+    @classmethod
+    def configure(cls, **overrides) -> "ScreenshotService":
+        if cls._shared:
+            cls._shared.close()
+        cls._shared = cls.from_config(**overrides)
+        return cls._shared
+
+    @classmethod
+    def shared(cls) -> "ScreenshotService":
+        if cls._shared is None:
+            cls._shared = cls.from_config()
+        return cls._shared
+
+    # ---------------------------------------------------------------
+    # Capture
+    # ---------------------------------------------------------------
+    def screenshot_options(self, element: bool = False) -> dict:
+        """Keyword arguments for page.screenshot / locator.screenshot."""
+        options = {"type": self.image_format}
+        if self.image_format == "jpeg":
+            options["quality"] = self.quality
+        if element:
+            options["timeout"] = self.CLIP_TIMEOUT_MS
+        elif self.full_page:
+            options["full_page"] = True
+        return options
+
+    def next_path(self, prefix: str) -> str:
+        """Collision-free file name: prefix, worker, current test, millisecond time, counter."""
+        test = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0].split("::")[-1]
+        now = time.time()
+        parts = [prefix, RunCache.worker_id(), test, time.strftime("%H%M%S", time.localtime(now)),
+                 f"{int(now * 1000) % 1000:03d}", str(next(self._counter))]
+        name = RunCache.safe_name("_".join(part for part in parts if part))[:150]
+        extension = "jpg" if self.image_format == "jpeg" else "png"
+        return os.path.join(self.directory, f"{name}.{extension}")
+
+    def grab(self, page, locator=None) -> bytes:
+        """Image of `locator` (selector or Locator) when it is visible, otherwise of the page (sync API)."""
+        if locator is not None:
+            element = page.locator(locator) if isinstance(locator, str) else locator
+            try:
+                return element.first.screenshot(**self.screenshot_options(element=True))
+            except Exception:
+                pass  # not visible (often why the step failed): the page shows more
+        return page.screenshot(**self.screenshot_options())
+
+    def capture(self, page, prefix: str = "Error", locator=None, path: str | None = None) -> str:
+        """Screenshot the page (or just `locator`); the file is written in the background."""
+        return self.save(self.grab(page, locator), prefix, path)
+
+    def save(self, image: bytes, prefix: str = "Error", path: str | None = None) -> str:
+        """Queue already captured bytes for writing (to `path`, if reserved with next_path)."""
+        path = path or self.next_path(prefix)
+        future = self._pool.submit(self._write, path, image)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return path
+
+    # ---------------------------------------------------------------
+    # Background Writing and Rotation
+    # ---------------------------------------------------------------
+    def _done(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+        if future.exception():
+            log.warning("⚠ Screenshot could not be written: %s", future.exception())
+
+    def _write(self, path: str, image: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(image)
+        if self.budget_bytes:
+            self._rotate(keep=path)
+
+    def _rotate(self, keep: str):
+        """Delete the oldest files of this run's folder (any worker's) until it fits the budget."""
+        files = []
+        for entry in os.scandir(self.directory):
+            try:
+                files.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+            except FileNotFoundError:
+                continue  # removed by another worker meanwhile
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.budget_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+    def flush(self, timeout: float = 30):
+        """Wait until every queued screenshot is on disk."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass  # already reported by _done
+
+    def close(self):
+        self.flush()
+        self._pool.shutdown(wait=True)
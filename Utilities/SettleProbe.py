@@ -0,0 +1,97 @@
+import threading
+from dataclasses import dataclass
+
+
+# Injected into every document (init script): counts XHR / fetch calls in flight and
+# stamps the last network or DOM activity, so "settled" can be checked from outside.
+# Also wraps Angular's testability API for --angular-stable.
+SETTLE_PROBE_JS = """
+(() => {
+    if (window.__cflowSettle) {
+        return;
+    }
+    const state = window.__cflowSettle = {inflight: 0, lastActivity: performance.now()};
+    const touch = () => { state.lastActivity = performance.now(); };
+
+    const nativeFetch = window.fetch;
+    if (nativeFetch) {
+        window.fetch = function (...args) {
+            state.inflight++;
+            touch();
+            return nativeFetch.apply(this, args).finally(() => { state.inflight--; touch(); });
+        };
+    }
+    const nativeSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        state.inflight++;
+        touch();
+        this.addEventListener("loadend", () => { state.inflight--; touch(); }, {once: true});
+        return nativeSend.apply(this, args);
+    };
+
+    new MutationObserver(touch).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+
+    state.settled = (quietMs) => state.inflight <= 0
+        && document.readyState !== "loading"
+        && performance.now() - state.lastActivity >= quietMs;
+
+    // Angular testability: "stable" once every app's whenStable fired, "timeout" when the
+    // limit passed first, "absent" on pages without Angular (nothing to wait for).
+    const nativeSetTimeout = window.setTimeout.bind(window);
+    state.angularStable = (timeoutMs) => new Promise((resolve) => {
+        const apps = window.getAllAngularTestabilities ? window.getAllAngularTestabilities() : [];
+        if (!apps.length) {
+            resolve("absent");
+            return;
+        }
+        let pending = apps.length;
+        const timer = nativeSetTimeout(() => resolve("timeout"), timeoutMs);
+        apps.forEach((testability) => testability.whenStable(() => {
+            if (--pending === 0) {
+                clearTimeout(timer);
+                resolve("stable");
+            }
+        }));
+    });
+})();
+"""
+
+# page.evaluate argument: the time limit in ms; resolves to "stable" / "timeout" / "absent"
+ANGULAR_STABLE_JS = "(ms) => window.__cflowSettle ? window.__cflowSettle.angularStable(ms) : 'absent'"
+
+
+def settled_condition(quiet_ms: int, predicate: str | None = None) -> str:
+    """JS function for wait_for_function: probe reports idle (and `predicate` holds)."""
+    condition = f"window.__cflowSettle && window.__cflowSettle.settled({quiet_ms})"
+    if predicate:
+        condition += f" && ({predicate})"
+    return f"() => {condition}"
+
+
+@dataclass
+class SettleStats:
+    """Settled waits of this process, compared with the fixed sleeps they replaced."""
+    waits: int = 0
+    waited_ms: float = 0.0
+    legacy_ms: float = 0.0  # what the replaced sleeps would have cost
+    saved_ms: float = 0.0
+    timeouts: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()  # async flows record from their own thread
+
+    def record(self, waited_ms: float, legacy_ms: float | None, settled: bool):
+        with self._lock:
+            self.waits += 1
+            self.waited_ms += waited_ms
+            self.timeouts += not settled
+            if legacy_ms:
+                self.legacy_ms += legacy_ms
+                self.saved_ms += legacy_ms - waited_ms
+
+    def summary(self) -> str:
+        return (f"{self.waits} settled waits took {self.waited_ms / 1000:.1f}s; the fixed sleeps they "
+                f"replaced add up to {self.legacy_ms / 1000:.1f}s (saved {self.saved_ms / 1000:.1f}s, "
+                f"{self.timeouts} hit their time limit)")
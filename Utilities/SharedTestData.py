@@ -0,0 +1,116 @@
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, fields
+from Utilities.RunCache import RunCache
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("shared_data")
+
+
+@dataclass
+class CreatedUser:
+    """A user created by one test and consumed by later tests."""
+    username: str
+    login_id: str
+    emp_no: str
+    password: str = ""
+    email: str = ""
+    department: str = ""
+
+
+class SharedTestData:
+    """
+    Cross-process store for data one test produces and other tests consume.
+
+    Backed by a SQLite file in the run cache, so a record published on one xdist worker
+    can be read on any other. Producers declare what they publish with
+    `@pytest.mark.produces("key")`; if the producer fails or is skipped, consumers stop
+    waiting at once, and a key no selected test produces is never waited for at all.
+    """
+
+    def __init__(self, db_path: str | None = None, expected_keys: set[str] | None = None,
+                 default_timeout: float = 300):
+        self.db_path = db_path or RunCache.path("shared_test_data.sqlite3")
+        self.expected_keys = expected_keys
+        self.default_timeout = default_timeout
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " key TEXT PRIMARY KEY, type TEXT, payload TEXT, status TEXT,"
+                " worker TEXT, published_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with db:  # commit on success, roll back on error
+                yield db
+        finally:
+            db.close()
+
+    def _write(self, key: str, type_name: str, payload: str, status: str):
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?)",
+                (key, type_name, payload, status, RunCache.worker_id(), time.time()),
+            )
+
+    # ---------------------------------------------------------------
+    # Producer Side
+    # ---------------------------------------------------------------
+    def publish(self, key: str, record):
+        """Store a dataclass record under `key`."""
+        self._write(key, type(record).__name__, json.dumps(asdict(record)), "ok")
+        log.info("📦 Published '%s' for other tests: %s", key, record)
+
+    def mark_failed(self, key: str, reason: str = ""):
+        """Tell consumers the producer failed or was skipped, so they do not wait for `key`."""
+        with self._connect() as db:
+            row = db.execute("SELECT status FROM records WHERE key = ?", (key,)).fetchone()
+        if row and row[0] == "ok":
+            return  # the record was published before the producer failed later on
+        self._write(key, "", json.dumps({"reason": reason}), "failed")
+
+    # ---------------------------------------------------------------
+    # Consumer Side
+    # ---------------------------------------------------------------
+    def get(self, key: str, record_type):
+        """Return the record for `key`, or None if it is not (successfully) published."""
+        with self._connect() as db:
+            row = db.execute("SELECT payload, status FROM records WHERE key = ?", (key,)).fetchone()
+        if not row or row[1] != "ok":
+            return None
+        known = {f.name for f in fields(record_type)}
+        return record_type(**{k: v for k, v in json.loads(row[0]).items() if k in known})
+
+    def _is_failed(self, key: str) -> bool:
+        with self._connect() as db:
+            row = db.execute("SELECT status FROM records WHERE key = ?", (key,)).fetchone()
+        return bool(row and row[0] == "failed")
+
+    def wait_for(self, key: str, record_type, timeout: float | None = None, poll: float = 0.5):
+        """
+        Wait until `key` is published (possibly by another worker) and return it.
+        Returns None on timeout, when the producer failed or was skipped, or when no test produces `key`.
+        """
+        if self.expected_keys is not None and key not in self.expected_keys:
+            log.info("⚠ No selected test produces '%s' — not waiting for it.", key)
+            return None
+
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            record = self.get(key, record_type)
+            if record is not None:
+                return record
+            if self._is_failed(key):
+                log.info("⚠ Producer of '%s' failed or was skipped.", key)
+                return None
+            if time.monotonic() > deadline:
+                log.warning("⚠ Timed out after %ss waiting for '%s'.", timeout, key)
+                return None
+            time.sleep(poll)
@@ -0,0 +1,162 @@
+import weakref
+from dataclasses import dataclass
+from playwright.sync_api import BrowserContext, Page, TimeoutError
+
+
+# Init script: a MutationObserver copies every toast (ngx-toastr children of #toast-container)
+# into window.__cflowToasts the moment it is added, so a toast is recorded even if it is
+# gone before anyone looks. The buffer is mirrored to sessionStorage, so marks stay valid
+# and the timeline survives full page navigations within the tab.
+TOAST_RECORDER_JS = """
+(() => {
+    if (window.__cflowToasts) {
+        return;
+    }
+    const KEY = "__cflowToasts";
+    const LEVELS = ["success", "error", "warning", "info"];
+    const LIMIT = 200;
+
+    let saved = null;
+    try {
+        saved = JSON.parse(window.sessionStorage.getItem(KEY));
+    } catch (e) {
+        saved = null;  // opaque origins (about:blank, data:) have no sessionStorage
+    }
+    const buffer = window.__cflowToasts = saved || {
+        id: Math.random().toString(36).slice(2), seq: 0, toasts: [],
+    };
+    const save = () => {
+        try {
+            window.sessionStorage.setItem(KEY, JSON.stringify(buffer));
+        } catch (e) {
+            // not persisted; the in-page buffer still works
+        }
+    };
+
+    const textOf = (node) => (node.querySelector(".toast-message") || node).textContent.replace(/\\s+/g, " ").trim();
+    const entries = new WeakMap();
+    const record = (node) => {
+        if (entries.has(node)) {
+            return;
+        }
+        const level = LEVELS.find((l) => node.classList.contains("toast-" + l)) || "info";
+        const entry = {seq: ++buffer.seq, text: textOf(node), level: level, time: Date.now(),
+                       path: window.location.pathname};
+        entries.set(node, entry);
+        buffer.toasts.push(entry);
+        buffer.toasts.splice(0, buffer.toasts.length - LIMIT);
+        save();
+    };
+
+    new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) {
+                    continue;
+                }
+                if (node.id === "toast-container") {
+                    Array.from(node.children).forEach(record);
+                } else if (node.parentElement && node.parentElement.id === "toast-container") {
+                    record(node);
+                }
+            }
+            // Text bound after the toast was attached (Angular renders it a tick later)
+            const target = mutation.target.nodeType === Node.ELEMENT_NODE
+                ? mutation.target : mutation.target.parentElement;
+            const toast = target && target.closest("#toast-container > *");
+            const entry = toast && entries.get(toast);
+            if (entry && !entry.text) {
+                entry.text = textOf(toast);
+                save();
+            }
+        }
+    }).observe(document, {subtree: true, childList: true, characterData: true});
+})();
+"""
+
+
+@dataclass
+class Toast:
+    """One recorded toast message."""
+    seq: int
+    text: str
+    level: str  # success / error / warning / info
+    time: float  # epoch ms (page clock)
+    path: str = ""
+
+    def __str__(self):
+        return f"[{self.level}] {self.text}"
+
+
+class ToastRecorder:
+    """
+    Reads the toast buffer kept in the page by TOAST_RECORDER_JS.
+
+    Take a `mark()` before an action, then `wait_for(mark)` / `since(mark)` return only the
+    toasts that action raised — no polling of #toast-container, no stale toast from an
+    earlier step, no missed toast that closed quickly. `timeline()` is every toast of the tab.
+    """
+
+    _installed: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._ensure_installed()
+
+    @staticmethod
+    def install(context: BrowserContext):
+        """Record toasts in every page the context opens."""
+        context.add_init_script(TOAST_RECORDER_JS)
+
+    def _ensure_installed(self):
+        """Pages from contexts without install() get the recorder from their next document on."""
+        if self.page in ToastRecorder._installed:
+            return
+        ToastRecorder._installed.add(self.page)
+        self.page.add_init_script(TOAST_RECORDER_JS)
+        try:
+            self.page.evaluate(TOAST_RECORDER_JS)
+        except Exception:
+            pass  # page is mid-navigation; the init script covers the next document
+
+    # ---------------------------------------------------------------
+    # Queries (one evaluate each)
+    # ---------------------------------------------------------------
+    def mark(self) -> dict:
+        """Position in the toast buffer; toasts recorded after it belong to the next action."""
+        return self.page.evaluate("() => { const b = window.__cflowToasts;"
+                                  " return b ? {id: b.id, seq: b.seq} : {id: null, seq: 0}; }")
+
+    def since(self, mark: dict) -> list[Toast]:
+        """Toasts recorded after `mark`, oldest first."""
+        toasts = self.page.evaluate(
+            """(mark) => { const b = window.__cflowToasts;
+                if (!b) { return []; }
+                return b.toasts.filter((t) => b.id !== mark.id || t.seq > mark.seq); }""",
+            mark,
+        )
+        return [Toast(**t) for t in toasts]
+
+    def wait_for(self, mark: dict, pattern: str | None = None, timeout: int = 5000) -> Toast | None:
+        """
+        First toast after `mark` (matching the case-insensitive regex `pattern`, if given).
+
+        Returns as soon as it is recorded, or None after `timeout` ms without one.
+        """
+        try:
+            handle = self.page.wait_for_function(
+                """([mark, pattern]) => { const b = window.__cflowToasts;
+                    const re = pattern ? new RegExp(pattern, "i") : null;
+                    return b && b.toasts.find((t) => (b.id !== mark.id || t.seq > mark.seq)
+                                                     && t.text && (!re || re.test(t.text))); }""",
+                arg=[mark, pattern],
+                timeout=timeout,
+                polling=50,
+            )
+        except TimeoutError:
+            return None
+        return Toast(**handle.json_value())
+
+    def timeline(self) -> list[Toast]:
+        """Every toast recorded in this tab, oldest first."""
+        return self.since({"id": None, "seq": 0})
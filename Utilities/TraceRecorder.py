@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from playwright.sync_api import BrowserContext
+from Utilities.RunCache import RunCache
+from Utilities.FrameworkLogger import get_logger
+
+
+log = get_logger("tracing")
+
+
+@dataclass
+class TraceStats:
+    """What tracing cost this process: time spent in start/stop calls and the zips kept."""
+    chunks: int = 0
+    overhead_ms: float = 0.0
+    kept: int = 0
+    kept_bytes: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record(self, overhead_ms: float, kept_path: str | None):
+        with self._lock:
+            self.chunks += 1
+            self.overhead_ms += overhead_ms
+            if kept_path:
+                self.kept += 1
+                self.kept_bytes += os.path.getsize(kept_path)
+
+    def summary(self) -> str:
+        average = self.overhead_ms / self.chunks if self.chunks else 0
+        return (f"{self.chunks} trace chunks cost {self.overhead_ms / 1000:.1f}s ({average:.0f} ms per test); "
+                f"{self.kept} kept ({self.kept_bytes / 1024 / 1024:.1f} MB)")
+
+
+class TraceRecorder:
+    """
+    Playwright tracing in chunks, one chunk per test.
+
+    mode="off"               : no tracing
+    mode="retain-on-failure" : every test is traced, but the zip is only written for failing tests
+    mode="on"                : every test's zip is written
+
+    Tracing is started once per context (on its first chunk), so pooled contexts that serve
+    many tests pay for it once; each test then only opens and closes a chunk. Zips go to
+    <trace_dir>/<run id>/<test>.zip — open them with `playwright show-trace <zip>`.
+    """
+
+    MODES = ("off", "retain-on-failure", "on")
+
+    def __init__(self, mode: str = "off", trace_dir: str = "Traces", snapshots: bool = True, sources: bool = True):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported trace mode: {mode} (use one of {self.MODES})")
+        self.mode = mode
+        self.trace_dir = os.path.join(trace_dir, RunCache.run_id())
+        self.snapshots = snapshots
+        self.sources = sources
+        self.stats = TraceStats()
+        self._started: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+        self._closed: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def path_for(self, nodeid: str) -> str:
+        return os.path.join(self.trace_dir, f"{RunCache.safe_name(nodeid)}.zip")
+
+    def prepare(self, context: BrowserContext):
+        """Start tracing on a new context (once; chunks are opened per test)."""
+        if not self.enabled or context in self._started:
+            return
+        self._started.add(context)
+        context.on("close", lambda _: self._closed.add(context))  # a test closed it itself
+        context.tracing.start(screenshots=self.snapshots, snapshots=self.snapshots, sources=self.sources)
+
+    def start(self, context: BrowserContext, nodeid: str) -> float:
+        """Open the test's chunk (starting tracing first on a new context); returns the ms it took."""
+        if not self.enabled:
+            return 0.0
+        start = time.perf_counter()
+        self.prepare(context)
+        context.tracing.start_chunk(title=nodeid)
+        return (time.perf_counter() - start) * 1000
+
+    def stop(self, context: BrowserContext, nodeid: str, failed: bool,
+             start_ms: float = 0.0) -> tuple[str | None, float]:
+        """
+        Close the test's chunk: written to disk for failures (or always with mode="on"),
+        discarded otherwise.
+
+        Returns:
+            tuple: Path of the kept zip (or None), and the test's tracing cost in ms
+            (`start_ms` from start() plus closing the chunk).
+        """
+        if not self.enabled or context in self._closed:
+            return None, start_ms
+        path = self.path_for(nodeid) if failed or self.mode == "on" else None
+        start = time.perf_counter()
+        try:
+            if path:
+                os.makedirs(self.trace_dir, exist_ok=True)
+            context.tracing.stop_chunk(path=path)
+        except Exception as e:
+            log.warning("⚠ Trace not saved for %s: %s", nodeid, e)
+            path = None
+        overhead_ms = start_ms + (time.perf_counter() - start) * 1000
+        self.stats.record(overhead_ms, path)
+        return path, overhead_ms
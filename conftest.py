@@ -1,13 +1,36 @@
 import pytest
 from playwright.sync_api import sync_playwright, ViewportSize
-from PageObjects.Login_Page.A_loginpage import LoginPage
 from Utilities.ReadProperties import ReadConfig
 from Utilities.BaseHelpers import BaseHelper
+from Utilities.AuthSession import AuthSessionCache
+from Utilities.RunCache import RunCache
+from Utilities.ContextPool import ContextPool
+from Utilities.AsyncFlowRunner import AsyncFlowRunner
+from Utilities.SharedTestData import SharedTestData, CreatedUser
+from Utilities.CflowApiClient import CflowApiClient
+from Utilities.RoutePolicy import RoutePolicy, RouteStats
+from Utilities.HarArchive import HarArchive
+from Utilities.LocalCflowServer import LocalCflowServer
+from Utilities.RegionFanout import RegionFanout
+from Utilities.ToastRecorder import ToastRecorder
+from Utilities.ScreenshotService import ScreenshotService
+from Utilities.FailureArtifacts import FailureArtifacts
+from Utilities.TraceRecorder import TraceRecorder
+from Utilities.FrameworkLogger import FrameworkLog, get_logger
+from Utilities.PasswordPolicy import PasswordPolicy, PasswordPolicyCache
+from PageObjects.Admin_Add_User.B_Admin_Add_user import AdminNavigationAndAddUser
 from datetime import datetime
-# from pytest_html import extras
+import base64
 import os
 import re
 
+try:
+    from pytest_html import extras
+except ImportError:  # failure artifacts are still written to disk, just not attached
+    extras = None
+
+
+log = get_logger("pytest")
 
 # --------------------------
 # CLI Options
@@ -16,9 +39,82 @@ def pytest_addoption(parser):
     parser.addoption("--browser_name", action="store", default="chromium",
                      help="Browser: chromium/firefox/webkit")
     parser.addoption("--region", action="store", default="Test",
-                     help="Region: AP/ME/US/EU/Test")
+                     help="Region: AP/ME/US/EU/Test/Local (Local = stand-in server on localhost); "
+                          "'all' or a comma list (AP,US) runs every region at once")
+    parser.addoption("--region-workers", action="store", type=int, default=2,
+                     help="Multi-region runs: xdist workers (parallel browsers) per region")
+    parser.addoption("--max-parallel-regions", action="store", type=int, default=0,
+                     help="Multi-region runs: how many regions run at the same time (0 = all)")
     parser.addoption("--headless", action="store_true",
                      help="Run in headless mode")
+    parser.addoption("--fresh-browser", action="store_true",
+                     help="Launch a new browser process for every test (debugging). "
+                          "Default: one browser per worker, isolated per test by contexts")
+    parser.addoption("--no-auth-cache", action="store_true",
+                     help="Log in through the UI in every test instead of reusing the cached session")
+    parser.addoption("--context-pool", action="store", type=int, default=0,
+                     help="Keep N logged-in contexts warm on the dashboard for tests using 'login' (0 = off)")
+    parser.addoption("--context-recycle", action="store", default="reset",
+                     choices=ContextPool.RECYCLE_POLICIES,
+                     help="After a test: reset the pooled context and reuse it, or replace it")
+    parser.addoption("--async-concurrency", action="store", type=int, default=4,
+                     help="How many pages the async_flows fixture drives at the same time")
+    parser.addoption("--shared-data-timeout", action="store", type=float, default=300,
+                     help="Seconds a test waits for data published by another test (possibly on another worker)")
+    parser.addoption("--seed-users", action="store", default="ui", choices=("ui", "api"),
+                     help="How tests that only need an existing user get one: "
+                          "ui = the user created by the Add User UI test, api = created through the backend")
+    parser.addoption("--route-policy", action="store", default="block", choices=RoutePolicy.MODES,
+                     help="block = skip non-essential resources, measure = load them but record their sizes, "
+                          "off = no request routing")
+    parser.addoption("--block-resource-types", action="store", default=None,
+                     help="Comma list of resource types to block (overrides config.ini)")
+    parser.addoption("--block-urls", action="store", default=None,
+                     help="Comma list of URL glob patterns to block (overrides config.ini)")
+    parser.addoption("--allow-urls", action="store", default=None,
+                     help="Comma list of URL glob patterns never blocked (overrides config.ini)")
+    parser.addoption("--har-mode", action="store", default="off", choices=HarArchive.MODES,
+                     help="record = save each test's traffic to a HAR, replay = serve tests from their HARs "
+                          "(no network)")
+    parser.addoption("--har-dir", action="store", default=os.path.join("TestData", "HAR"),
+                     help="Folder holding the per-test HAR archives")
+    parser.addoption("--local-latency", action="store", type=float, default=None,
+                     help="--region=Local: artificial server latency per request in ms (default: config.ini)")
+    parser.addoption("--local-jitter", action="store", type=float, default=None,
+                     help="--region=Local: random ± jitter on that latency in ms (default: config.ini)")
+    parser.addoption("--angular-stable", action="store_true",
+                     help="Before every BaseHelper action wait for Angular's whenStable "
+                          "(pages without Angular are not delayed)")
+    parser.addoption("--verbose-actions", action="store_true",
+                     help="Echo every helper action and field check to the console (default: warnings, "
+                          "errors and the summary; everything else goes to the JSON-lines log)")
+    parser.addoption("--action-log-dir", action="store", default="Logs",
+                     help="Folder for the per-worker JSON-lines logs, one sub-folder per run")
+    parser.addoption("--trace-mode", action="store", default="off", choices=TraceRecorder.MODES,
+                     help="Playwright tracing, one chunk per test: retain-on-failure keeps zips of failing "
+                          "tests only, on keeps all (pytest's own --trace is the debugger)")
+    parser.addoption("--trace-dir", action="store", default="Traces",
+                     help="Folder for trace zips, one sub-folder per run")
+    parser.addoption("--trace-no-snapshots", action="store_true",
+                     help="Trace without DOM snapshots / screenshots (smaller, cheaper)")
+    parser.addoption("--trace-no-sources", action="store_true",
+                     help="Trace without the test sources")
+    parser.addoption("--password-policy-ttl", action="store", type=float, default=None,
+                     help="Minutes the scraped password rules of the tenant stay cached, 0 = scrape on every "
+                          "use (default: config.ini)")
+    parser.addoption("--screenshot-dir", action="store", default=None,
+                     help="Folder for failure screenshots, one sub-folder per run (default: config.ini)")
+    parser.addoption("--screenshot-format", action="store", default=None, choices=ScreenshotService.FORMATS,
+                     help="Failure screenshot format (default: config.ini)")
+    parser.addoption("--screenshot-quality", action="store", type=int, default=None,
+                     help="JPEG quality 1-100 for --screenshot-format=jpeg (default: config.ini)")
+    parser.addoption("--screenshot-budget-mb", action="store", type=float, default=None,
+                     help="Disk budget per run; the oldest screenshots are deleted beyond it, 0 = unlimited "
+                          "(default: config.ini)")
+
+
+VIEWPORT = ViewportSize(width=1470, height=720)
+DEFAULT_TIMEOUT = 10000
 
 
 # --------------------------
@@ -31,67 +127,382 @@ def playwright_instance():
 
 
 # --------------------------
-# Launch Fresh Browser per Test
+# Browser Scope
 # --------------------------
-@pytest.fixture(scope="function")
-def browser(playwright_instance, request):
-    browser_name = request.config.getoption("--browser_name")
-    headless = request.config.getoption("--headless")
+def _browser_scope(fixture_name, config):
+    """One browser per worker session, unless --fresh-browser asks for one per test."""
+    return "function" if config.getoption("--fresh-browser") else "session"
 
+
+def _launch_browser(playwright_instance, browser_name: str, headless: bool):
     if browser_name.lower() == "chromium":
-        browser = playwright_instance.chromium.launch(headless=headless)
+        return playwright_instance.chromium.launch(headless=headless)
     elif browser_name.lower() == "firefox":
-        browser = playwright_instance.firefox.launch(headless=headless)
+        return playwright_instance.firefox.launch(headless=headless)
     elif browser_name.lower() == "webkit":
-        browser = playwright_instance.webkit.launch(headless=headless)
+        return playwright_instance.webkit.launch(headless=headless)
     else:
         raise ValueError(f"Unsupported browser: {browser_name}")
 
+
+# --------------------------
+# Launch Browser (shared per worker, or fresh per test with --fresh-browser)
+# --------------------------
+@pytest.fixture(scope=_browser_scope)
+def browser(playwright_instance, request):
+    browser_name = request.config.getoption("--browser_name")
+    headless = request.config.getoption("--headless")
+
+    browser = _launch_browser(playwright_instance, browser_name, headless)
     yield browser
     browser.close()
 
 
 # --------------------------
-# Fresh Page for Every Test
+# Request Routing Policy (block non-essential resources)
 # --------------------------
-@pytest.fixture(scope="function")
-def page(browser):
-    context = browser.new_context(
-        viewport=ViewportSize(width=1470, height=720)
+@pytest.fixture(scope="session")
+def route_policy(request):
+    region = request.config.getoption("--region")
+
+    def setting(option: str, key: str) -> list[str]:
+        value = request.config.getoption(option)
+        if value is None:
+            return ReadConfig.getRouteSetting(region, key)
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    policy = RoutePolicy(
+        mode=request.config.getoption("--route-policy"),
+        block_resource_types=setting("--block-resource-types", "blockResourceTypes"),
+        block_url_patterns=setting("--block-urls", "blockUrlPatterns"),
+        allow_url_patterns=setting("--allow-urls", "allowUrlPatterns"),
+    )
+    yield policy
+
+    if policy.mode == "block":
+        log.info("🚧 Route policy (%s): %s", RunCache.worker_id(), policy.total.summary())
+    policy.save_sizes()
+
+
+def _record_route_stats(item, policy: RoutePolicy, stats: RouteStats):
+    policy.total.add(stats)
+    if policy.mode == "block":
+        item.user_properties.append(("blocked_requests", stats.blocked))
+        item.user_properties.append(("blocked_bytes", stats.bytes_saved))
+        log.info("🚧 %s", stats.summary())
+
+
+def _prepare_context(context, route_policy: RoutePolicy):
+    """Setup every test context gets: request routing and the toast recorder."""
+    route_policy.apply(context)
+    ToastRecorder.install(context)
+
+
+def _log_toast_timeline(page):
+    """Every toast the test's tab showed, in order (lands in the report's captured log)."""
+    try:
+        timeline = ToastRecorder(page).timeline()
+    except Exception:
+        return  # page already closed by the test
+    if timeline:
+        start = timeline[0].time
+        lines = [f"   +{(toast.time - start) / 1000:6.2f}s {toast.path} {toast}" for toast in timeline]
+        log.info("🍞 Toast timeline (%d):\n%s", len(timeline), "\n".join(lines))
+
+
+# --------------------------
+# HAR Record / Replay
+# --------------------------
+@pytest.fixture(scope="session")
+def har_archive(request):
+    return HarArchive(
+        mode=request.config.getoption("--har-mode"),
+        har_dir=request.config.getoption("--har-dir"),
+        region=request.config.getoption("--region"),
     )
-    page = context.new_page()
-    page.set_default_timeout(10000)
+
+
+# --------------------------
+# Tracing (--trace-mode; one chunk per test, zips kept for failures)
+# --------------------------
+@pytest.fixture(scope="session")
+def trace_recorder(request):
+    recorder = TraceRecorder(
+        mode=request.config.getoption("--trace-mode"),
+        trace_dir=request.config.getoption("--trace-dir"),
+        snapshots=not request.config.getoption("--trace-no-snapshots"),
+        sources=not request.config.getoption("--trace-no-sources"),
+    )
+    yield recorder
+
+    if recorder.stats.chunks:
+        log.info("🎞 Tracing (%s): %s", RunCache.worker_id(), recorder.stats.summary())
+
+
+def _stop_trace(item, recorder: TraceRecorder, context, nodeid: str, start_ms: float):
+    """Close the test's trace chunk and note what tracing cost it."""
+    if not recorder.enabled:
+        return
+    path, cost_ms = recorder.stop(context, nodeid, failed=_test_failed(item), start_ms=start_ms)
+    item.user_properties.append(("trace_ms", round(cost_ms)))
+    log.info("🎞 Tracing cost %.0f ms%s", cost_ms, f"; trace kept: {path} (playwright show-trace)" if path else "")
+
+
+@pytest.fixture(autouse=True)
+def _seed_test_data(request, har_archive):
+    # Same random names / login IDs in record and replay, so recorded requests match
+    if har_archive.enabled:
+        har_archive.seed(request.node.nodeid)
+
+
+# --------------------------
+# Fresh Page for Every Test (pooled, already logged in, when --context-pool is set)
+# --------------------------
+@pytest.fixture(scope="function")
+def page(browser, request, route_policy, har_archive, trace_recorder):
+    pool = request.getfixturevalue("context_pool") if "login" in request.fixturenames else None
+    if pool:
+        context, page = pool.acquire()
+    else:
+        nodeid = request.node.nodeid
+        context = browser.new_context(viewport=VIEWPORT, **har_archive.context_options(nodeid))
+        _prepare_context(context, route_policy)
+        har_archive.attach(context, nodeid)
+        page = context.new_page()
+        page.set_default_timeout(DEFAULT_TIMEOUT)
+    # Console log from the start; pooled pages start clean; collected by makereport on failure
+    FailureArtifacts.for_page(page).reset().deferred = True
+    route_start = route_policy.stats_for(context).copy()
+    trace_ms = trace_recorder.start(context, request.node.nodeid)
+
     yield page
-    context.close()
+
+    _log_toast_timeline(page)
+    _stop_trace(request.node, trace_recorder, context, request.node.nodeid, trace_ms)
+    _record_route_stats(request.node, route_policy, route_policy.stats_for(context).since(route_start))
+    if pool:
+        pool.release(context, page, failed=_test_failed(request.node))
+    else:
+        context.close()
 
 
 # --------------------------
-# Login Fixture (Optional)
+# Extra Contexts Inside a Test (same viewport, routing, HAR and tracing as `page`)
 # --------------------------
 @pytest.fixture(scope="function")
-def login(page, request):
+def new_context(browser, request, route_policy, har_archive, trace_recorder):
+    contexts = []
+
+    def factory(name: str = "extra"):
+        nodeid = f"{request.node.nodeid}-{name}"
+        context = browser.new_context(viewport=VIEWPORT, **har_archive.context_options(nodeid))
+        _prepare_context(context, route_policy)
+        har_archive.attach(context, nodeid)
+        contexts.append((context, nodeid, trace_recorder.start(context, nodeid)))
+        return context
+
+    yield factory
+    for context, nodeid, trace_ms in contexts:
+        _stop_trace(request.node, trace_recorder, context, nodeid, trace_ms)
+        context.close()
+
+
+# --------------------------
+# Cached Login Session (one per region + account)
+# --------------------------
+@pytest.fixture(scope="session")
+def auth_cache(request):
     region = request.config.getoption("--region")
+    return AuthSessionCache(
+        region=region,
+        url=ReadConfig.getURL(region),
+        client_id=ReadConfig.getClientID(region),
+        username=ReadConfig.getUsername(region),
+        password=ReadConfig.getPassword(region),
+    )
 
-    url = ReadConfig.getURL(region)
-    client_id = ReadConfig.getClientID(region)
-    username = ReadConfig.getUsername(region)
-    password = ReadConfig.getPassword(region)
 
-    print(f"\n➡️ Launching URL: {url} ({region})")
-    page.goto(url)
+# --------------------------
+# Pre-warmed Pool of Logged-in Contexts (per worker)
+# --------------------------
+@pytest.fixture(scope="session")
+def context_pool(request, auth_cache, route_policy):
+    size = request.config.getoption("--context-pool")
+    if not size:
+        yield None
+        return
+
+    pool = ContextPool(
+        request.getfixturevalue("browser"),
+        auth_cache,
+        size=size,
+        recycle=request.config.getoption("--context-recycle"),
+        default_timeout=DEFAULT_TIMEOUT,
+        setup_context=lambda context: _prepare_context(context, route_policy),
+        viewport=VIEWPORT,
+    )
+    yield pool
+    pool.close()
 
-    lp = LoginPage(page)
-    lp.setClientid(client_id)
-    lp.setUserName(username)
-    lp.setPassword(password)
-    lp.clickLogin()
 
-    helper = BaseHelper(page)
-    helper.verify_page_url("/dashboard", description="Dashboard")
+# --------------------------
+# Login Fixture (Optional)
+# --------------------------
+@pytest.fixture(scope="function")
+def login(page, request, auth_cache, context_pool, har_archive):
+    if context_pool and context_pool.owns(page):
+        pass  # handed out already logged in and parked on the dashboard
+    elif request.config.getoption("--no-auth-cache") or har_archive.enabled:
+        # Recorded tests carry their own login, so replay does not depend on a cached session
+        auth_cache.ui_login(page)
+    else:
+        auth_cache.authenticate(page)
 
     yield page
 
 
+def _ensure_auth_state(request, playwright_instance, auth_cache):
+    """
+    Log in once (if needed) so session-scoped helpers can start from the cached state.
+    Skips, instead of erroring at setup, when the region has no credentials or cannot be reached.
+    """
+    reason = auth_cache.unavailable_reason()
+    if reason:
+        pytest.skip(reason)
+    if request.config.getoption("--fresh-browser"):
+        login_browser = _launch_browser(
+            playwright_instance,
+            request.config.getoption("--browser_name"),
+            request.config.getoption("--headless"),
+        )
+        auth_cache.ensure_state(login_browser, viewport=VIEWPORT)
+        login_browser.close()
+    else:
+        auth_cache.ensure_state(request.getfixturevalue("browser"), viewport=VIEWPORT)
+
+
+# --------------------------
+# Async Flows (many logged-in pages on one event loop)
+# --------------------------
+@pytest.fixture(scope="session")
+def async_flows(request, playwright_instance, auth_cache):
+    """
+    Runs independent async flows concurrently, each on its own logged-in page:
+
+        async def check(page, user): ...
+        async_flows.map(check, users)
+    """
+    browser_name = request.config.getoption("--browser_name")
+    headless = request.config.getoption("--headless")
+
+    # Make sure a cached session exists before the async pages start from it
+    _ensure_auth_state(request, playwright_instance, auth_cache)
+
+    runner = AsyncFlowRunner(
+        browser_name=browser_name,
+        headless=headless,
+        storage_state=auth_cache.state_path,
+        start_url=auth_cache.landing_url(),
+        concurrency=request.config.getoption("--async-concurrency"),
+        default_timeout=DEFAULT_TIMEOUT,
+        viewport=VIEWPORT,
+    )
+    yield runner
+    runner.close()
+
+
+# --------------------------
+# Data Shared Between Tests (works across xdist workers)
+# --------------------------
+@pytest.fixture(scope="session")
+def shared_data(request):
+    return SharedTestData(
+        expected_keys=getattr(request.config, "_produced_keys", None),
+        default_timeout=request.config.getoption("--shared-data-timeout"),
+    )
+
+
+# --------------------------
+# Backend API Client (pooled HTTP, logged-in session cookie)
+# --------------------------
+@pytest.fixture(scope="session")
+def api_client(request, playwright_instance, auth_cache):
+    region = request.config.getoption("--region")
+    if not ReadConfig.hasBackendAPI(region):
+        pytest.skip(f"Region {region} has no verified backend API (backendApi in config.ini)")
+    _ensure_auth_state(request, playwright_instance, auth_cache)
+    client = CflowApiClient.from_storage_state(ReadConfig.getAPIBaseURL(region), auth_cache.state_path)
+    yield client
+    client.close()
+
+
+# --------------------------
+# An Existing User for Tests That Only Need One
+# --------------------------
+@pytest.fixture(scope="function")
+def seeded_user(request, shared_data):
+    """
+    --seed-users=ui  : the user published by the Add User UI test (None if it is not available)
+    --seed-users=api : a fresh user created through the backend, deleted after the test
+    """
+    if request.config.getoption("--seed-users") == "ui":
+        yield shared_data.wait_for("active_user", CreatedUser)
+        return
+
+    api_client = request.getfixturevalue("api_client")
+    # The tenant's scraped policy when cached, otherwise every character class within 8-20
+    policy = PasswordPolicyCache.shared().get() or PasswordPolicy(
+        require_digit=True, require_upper=True, require_lower=True, require_special=True)
+    user = CreatedUser(
+        username=f"User_{AdminNavigationAndAddUser.random_string(5)}",
+        login_id=AdminNavigationAndAddUser.random_login_id(),
+        emp_no=AdminNavigationAndAddUser.random_employee_number(),
+        password=policy.generate_valid(),
+        email="dinesh123@yopmail.com",
+        department="QA",
+    )
+    api_client.create_user({
+        "name": user.username, "department": user.department, "email": user.email,
+        "loginId": user.login_id, "password": user.password, "empNo": user.emp_no,
+        "role": ["User"], "countryCode": "+91", "whatsappNo": "9988776655", "status": True,
+    })
+    yield user
+    api_client.delete_user(user.login_id)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    # Keys some selected test publishes (after -k / -m deselection) — consumers never wait for anything else
+    config._produced_keys = {
+        key for item in items for marker in item.iter_markers("produces") for key in marker.args
+    }
+
+
+# ------------------------------
+# Multi-region Run (--region=all / AP,US): one child pytest per region
+# ------------------------------
+def pytest_cmdline_main(config):
+    try:
+        regions = RegionFanout.parse_regions(config.getoption("--region"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    if not regions:
+        return None  # normal single-region run
+
+    RunCache.prune_old_runs()
+    FrameworkLog.configure(config.getoption("--action-log-dir"), verbose=config.getoption("--verbose-actions"))
+    fanout = RegionFanout(
+        regions,
+        list(config.invocation_params.args),
+        workers=config.getoption("--region-workers"),
+        max_parallel=config.getoption("--max-parallel-regions"),
+    )
+    try:
+        return fanout.run()
+    finally:
+        FrameworkLog.close()
+
+
 # ------------------------------
 # Custom HTML Report Title
 # ------------------------------
@@ -105,11 +516,63 @@ def pytest_html_report_title(report):
 # ------------------------------
 @pytest.mark.optionalhook
 def pytest_configure(config):
+    if config.getoption("--context-pool") and config.getoption("--fresh-browser"):
+        raise pytest.UsageError("--context-pool needs the shared browser; it cannot be combined with --fresh-browser")
+    if config.getoption("--seed-users") == "api" and not ReadConfig.hasBackendAPI(config.getoption("--region")):
+        raise pytest.UsageError("--seed-users=api needs a region with backendApi = true in config.ini "
+                                "(the [API] endpoints are placeholders of the local stand-in)")
+    if config.getoption("--context-pool") and config.getoption("--har-mode") != "off":
+        raise pytest.UsageError("--har-mode records/replays one context per test; it cannot be combined with --context-pool")
+
+    # Controller (or single process) decides the run id before xdist workers start
+    if not hasattr(config, "workerinput"):
+        RunCache.run_id()
+        RunCache.prune_old_runs()
+
+    FrameworkLog.configure(config.getoption("--action-log-dir"), verbose=config.getoption("--verbose-actions"))
+    if not hasattr(config, "workerinput") and config.getoption("--region") == "Local":
+        _start_local_server(config)
+
+    BaseHelper.ANGULAR_STABLE = config.getoption("--angular-stable")  # every process, workers included
+    AdminNavigationAndAddUser.SEARCH_RESPONSE_PATTERN = ReadConfig.getRegionSetting(
+        config.getoption("--region"), "searchResponsePattern")
+    region = config.getoption("--region")
+    PasswordPolicyCache.configure(region, ReadConfig.getClientID(region), config.getoption("--password-policy-ttl"))
+    ScreenshotService.configure(
+        directory=config.getoption("--screenshot-dir"),
+        image_format=config.getoption("--screenshot-format"),
+        quality=config.getoption("--screenshot-quality"),
+        budget_mb=config.getoption("--screenshot-budget-mb"),
+    )
+
+    config.addinivalue_line("markers", "produces(*keys): test publishes these keys to the shared_data store")
+
     config._metadata = {}
     config.option.metadata = {}
     config._environment = False
 
 
+# ------------------------------
+# Local Stand-in Server (--region=Local; one per run, shared by all workers)
+# ------------------------------
+def _start_local_server(config):
+    server = LocalCflowServer.from_config(
+        "Local",
+        latency_ms=config.getoption("--local-latency"),
+        jitter_ms=config.getoption("--local-jitter"),
+    )
+    try:
+        config._local_server = server.start()
+    except OSError as e:
+        raise pytest.UsageError(f"Cannot start the local Cflow server on {server.base_url}: {e}")
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_local_server", None)
+    if server:
+        server.stop()
+
+
 @pytest.mark.optionalhook
 def pytest_metadata(metadata):
     metadata.clear()
@@ -208,6 +671,63 @@ def pytest_metadata(metadata):
 #
 
 
+# ------------------------------
+# Keep Each Phase's Report on the Test Item (used by fixture teardown)
+# ------------------------------
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+    if report.when == "call" or report.failed:
+        side_captures = FailureArtifacts.drain_side_captures()  # other pages this test screenshotted
+        if report.failed and report.when in ("setup", "call"):
+            _attach_failure_artifacts(item, report, side_captures)
+
+    # A failing or skipped producer releases the tests waiting for its data right away
+    if report.failed or report.skipped:
+        outcome = "failed" if report.failed else "was skipped"
+        for marker in item.iter_markers("produces"):
+            for key in marker.args:
+                SharedTestData().mark_failed(key, reason=f"{item.nodeid} {outcome} during {report.when}")
+
+
+def _attach_failure_artifacts(item, report, side_captures: list[tuple[str, bytes]]):
+    """
+    The failed test's one screenshot, DOM snapshot and console log, plus the screenshots
+    taken of its other pages, added to the HTML report.
+    """
+    page = getattr(item, "funcargs", {}).get("page")
+    artifacts = {}
+    if page is not None and not page.is_closed():
+        artifacts = FailureArtifacts.for_page(page).collect(page)
+    if artifacts:
+        log.info("🧾 Failure artifacts: %s", artifacts.get("screenshot", artifacts["log_path"]))
+    for path, _ in side_captures:
+        log.info("🧾 Failure screenshot (other page): %s", path)
+    if extras is None or not (artifacts or side_captures):
+        return
+
+    attached = getattr(report, "extras", [])
+    jpeg = ScreenshotService.shared().image_format == "jpeg"
+    images = ([("Failure screenshot", artifacts["image"])] if "image" in artifacts else []) + [
+        (f"Failure screenshot ({os.path.basename(path)})", image) for path, image in side_captures]
+    for name, image in images:
+        attached.append((extras.jpg if jpeg else extras.png)(base64.b64encode(image).decode(), name=name))
+    if not artifacts:
+        report.extras = attached
+        return
+    if "dom_html" in artifacts:
+        attached.append(extras.text(artifacts["dom_html"], name="DOM snapshot"))
+    attached.append(extras.text(artifacts["log"], name="Breadcrumbs and console log"))
+    report.extras = attached
+
+
+def _test_failed(item) -> bool:
+    return any(getattr(getattr(item, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+
+
 # ------------------------------
 # Track Test Session Start Time
 # ------------------------------
@@ -237,5 +757,13 @@ def pytest_sessionfinish(session, exitstatus):
         with open(report_path, "w", encoding="utf-8") as f:
             f.write(cleaned_html)
 
-    print(f"\n✨ Test session finished. Exit status: {exitstatus}")
+    ScreenshotService.shared().close()  # queued screenshots are on disk before the run ends
+
+    if BaseHelper.settle_stats.waits:
+        log.info("⏳ Settled waits (%s): %s", RunCache.worker_id(), BaseHelper.settle_stats.summary())
+    FrameworkLog.close()
+
+    # The one line each process prints: everything else is in the log file
+    summary = f" — 📝 {FrameworkLog.stats.summary()} → {FrameworkLog.path}" if FrameworkLog.stats.records else ""
+    print(f"\n✨ Test session finished ({RunCache.worker_id()}). Exit status: {exitstatus}{summary}")
 